@@ -2,6 +2,8 @@
 
 import os
 
+from minapari._lazy import lazy_imports
+
 try:
     from minapari._version import version as __version__
 except ImportError:
@@ -12,9 +14,14 @@ os.environ.setdefault('SPARSE_AUTO_DENSIFY', '1')
 
 del os
 
-# Direct imports for common usage
-from minapari.viewer import Viewer
-from minapari.layers import Image, Layer
+# Common names are imported on first access (PEP 562), so that
+# `import minapari` does not import Qt, vispy and the layers until they are
+# used. Type checkers read them from __init__.pyi.
+_LAZY_IMPORTS = {
+    'Viewer': 'minapari.viewer',
+    'Image': 'minapari.layers',
+    'Layer': 'minapari.layers',
+}
 
 __all__ = [
     '__version__',
@@ -22,3 +29,5 @@ __all__ = [
     'Image',
     'Layer',
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
@@ -0,0 +1,54 @@
+"""Package attributes imported on first access (PEP 562).
+
+Packages list the names they export lazily, with the module each is defined
+in, and use the module ``__getattr__`` and ``__dir__`` made here. Type
+checkers read the names from the ``__init__.pyi`` stub of the package.
+"""
+
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_imports(
+    package: str,
+    imports: Mapping[str, str],
+    exported: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Make the module ``__getattr__`` and ``__dir__`` of a package.
+
+    >>> __getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, which must be being imported.
+    imports : mapping of str to str
+        Module that defines each name imported on first access.
+    exported : iterable of str
+        Names listed by ``dir`` even before they are imported, usually
+        ``__all__``.
+
+    Returns
+    -------
+    __getattr__ : callable
+        Imports a name, and sets it on the package so that it is only
+        imported once.
+    __dir__ : callable
+        Lists the attributes of the package and the exported names.
+    """
+    module = sys.modules[package]
+    exported = tuple(exported)
+
+    def __getattr__(name: str) -> Any:
+        if name in imports:
+            value = getattr(import_module(imports[name]), name)
+            setattr(module, name, value)
+            return value
+        raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(module)) | set(exported))
+
+    return __getattr__, __dir__
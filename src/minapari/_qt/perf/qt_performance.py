@@ -7,11 +7,16 @@ from qtpy.QtCore import Qt, QTimer
 from qtpy.QtGui import QTextCursor
 from qtpy.QtWidgets import (
     QComboBox,
+    QFileDialog,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QProgressBar,
+    QPushButton,
     QSizePolicy,
     QSpacerItem,
+    QTableWidget,
+    QTableWidgetItem,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -40,10 +45,74 @@ class TextLog(QTextEdit):
         self.moveCursor(QTextCursor.MoveOperation.End)
         self.setTextColor(Qt.GlobalColor.red)
         self.insertPlainText(
-            trans._('{time_ms:5.0f}ms {name}\n', time_ms=time_ms, name=name)
+            trans._('{time_ms:8.2f}ms {name}\n', time_ms=time_ms, name=name)
         )
 
 
+class StatsTable(QTableWidget):
+    """Table of the latency statistics of the slowest timers.
+
+    Timers are sorted by total time. The self time excludes the time spent
+    in nested timers.
+    """
+
+    MAX_ROWS = 50
+
+    def __init__(self) -> None:
+        super().__init__()
+        labels = [
+            trans._('Timer'),
+            trans._('Count'),
+            trans._('Total'),
+            trans._('Self'),
+            trans._('Mean'),
+            trans._('p50'),
+            trans._('p95'),
+            trans._('p99'),
+            trans._('Max'),
+        ]
+        self.setColumnCount(len(labels))
+        self.setHorizontalHeaderLabels(labels)
+        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.verticalHeader().setVisible(False)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+
+    def set_stats(self, stats: dict) -> None:
+        """Show the statistics of the timers with the largest total time.
+
+        Parameters
+        ----------
+        stats : Dict[str, Stat]
+            Statistics of each timer, by timer name.
+        """
+        rows = sorted(stats.items(), key=lambda item: -item[1].sum)
+        rows = rows[: self.MAX_ROWS]
+        self.setRowCount(len(rows))
+        for row, (name, stat) in enumerate(rows):
+            p50, p95, p99 = stat.histogram.percentiles([50, 95, 99])
+            values = [
+                name,
+                str(stat.count),
+                f'{stat.sum:.2f}',
+                f'{stat.self_sum:.2f}',
+                f'{stat.average:.3f}',
+                f'{p50:.3f}',
+                f'{p95:.3f}',
+                f'{p99:.3f}',
+                f'{stat.max:.3f}',
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(
+                        Qt.AlignmentFlag.AlignRight
+                        | Qt.AlignmentFlag.AlignVCenter
+                    )
+                self.setItem(row, column, item)
+
+
 class QtPerformance(QWidget):
     """Dockable widget to show performance info.
 
@@ -57,7 +126,10 @@ class QtPerformance(QWidget):
 
     2) We log any event whose duration is longer than the threshold.
 
-    3) We show uptime so you can tell if this window is being updated at all.
+    3) We show the latency statistics of the slowest timers since the last
+       reset, in milliseconds. They can be exported to JSON.
+
+    4) We show uptime so you can tell if this window is being updated at all.
 
     Attributes
     ----------
@@ -67,6 +139,8 @@ class QtPerformance(QWidget):
         The progress bar we use as your draw time indicator.
     thresh_ms : float
         Log events whose duration is longer then this.
+    stats_table : StatsTable
+        Table of the latency statistics of the timers.
     timer_label : QLabel
         We write the current "uptime" into this label.
     timer : QTimer
@@ -133,6 +207,23 @@ class QtPerformance(QWidget):
 
         layout.addWidget(self.log)
 
+        # Latency statistics since the last reset.
+        layout.addWidget(QLabel(trans._('Latency (milliseconds):')))
+        self.stats_table = StatsTable()
+        layout.addWidget(self.stats_table)
+
+        reset_button = QPushButton(trans._('Reset'))
+        reset_button.clicked.connect(self._reset_stats)
+        export_button = QPushButton(trans._('Export...'))
+        export_button.clicked.connect(self._export_stats)
+        button_layout = QHBoxLayout()
+        button_layout.addItem(
+            QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+        )
+        button_layout.addWidget(reset_button)
+        button_layout.addWidget(export_button)
+        layout.addLayout(button_layout)
+
         # Uptime label. To indicate if the widget is getting updated.
         label = QLabel('')
         layout.addWidget(label)
@@ -151,6 +242,22 @@ class QtPerformance(QWidget):
         self.thresh_ms = float(text)
         self.log.clear()  # start fresh with this new threshold
 
+    def _reset_stats(self):
+        """Start the latency statistics afresh."""
+        perf.timers.reset()
+        self.stats_table.setRowCount(0)
+
+    def _export_stats(self):
+        """Write the latency statistics to a JSON file."""
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            trans._('Export latency statistics'),
+            'perf_stats.json',
+            trans._('JSON files (*.json)'),
+        )
+        if path:
+            perf.timers.export_stats(path)
+
     def _get_timer_info(self):
         """Get the information from the timers that we want to display."""
         average = None
@@ -190,5 +297,7 @@ class QtPerformance(QWidget):
             self.log.append(name, time_ms)
 
         # Clear all the timers since we've displayed them. They will immediately
-        # start accumulating numbers for the next update.
+        # start accumulating numbers for the next update. Their statistics
+        # are kept in the totals shown in the table.
         perf.timers.clear()
+        self.stats_table.set_stats(perf.timers.get_stats())
@@ -279,6 +279,7 @@ def quit_app():
         # Write trace file before exit, if we were writing one.
         # Is there a better place to make sure this is done on exit?
         perf.timers.stop_trace_file()
+        perf.timers.stop_flight_recorder()
 
     if config.monitor:
         # Stop the monitor service if we were using it
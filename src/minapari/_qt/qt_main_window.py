@@ -964,7 +964,8 @@ class Window:
         _rebuild_npe1_plugins_menu()
 
     def _handle_trace_file_on_start(self):
-        """Start trace of `trace_file_on_start` config set."""
+        """Start trace of `trace_file_on_start` config set, and the flight
+        recorder if `flight_recorder_seconds` is set."""
         from minapari._qt._qapp_model.qactions._debug import _start_trace
 
         if perf.perf_config:
@@ -975,6 +976,11 @@ class Window:
                 # want to create a trace every time you start napari,
                 # without having to start it from the debug menu.
                 _start_trace(path)
+            seconds = perf.perf_config.flight_recorder_seconds
+            if seconds is not None:
+                perf.timers.start_flight_recorder(
+                    seconds, perf.perf_config.flight_recorder_path
+                )
 
     def _add_menus(self):
         """Add menubar to napari app."""
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import os
 import sys
+import threading
 import traceback
 import warnings
 import weakref
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import FrameType
 from typing import (
@@ -40,10 +43,14 @@ from minapari.errors import MultipleReaderError, ReaderPluginError
 from minapari.layers.base.base import Layer
 from minapari.plugins import _npe2
 from minapari.settings import get_settings
-from minapari.settings._application import DaskSettings
-from minapari.utils import config, perf, resize_dask_cache
+from minapari.settings._application import DaskSettings, SliceCacheSettings
+from minapari.utils import (
+    config,
+    perf,
+    resize_dask_cache,
+    resize_slice_cache,
+)
 from minapari.utils.action_manager import action_manager
-from minapari.utils.geometry import get_center_bbox
 from minapari.utils.history import (
     get_open_history,
     get_save_history,
@@ -232,6 +239,10 @@ class QtViewer(QSplitter):
         self.addWidget(main_widget)
 
         self.viewer._layer_slicer.events.ready.connect(self._on_slice_ready)
+        self.viewer._layer_loader.events.ready.connect(self._on_layers_loaded)
+        # Layers with appended frames waiting for a dims update.
+        self._appended_layers: WeakSet[Layer] = WeakSet()
+        self._appended_lock = threading.Lock()
 
         self._on_active_change()
         self.viewer.layers.events.inserted.connect(self._update_camera_depth)
@@ -244,6 +255,7 @@ class QtViewer(QSplitter):
         )
 
         self.viewer.layers.events.inserted.connect(self._on_add_layer_change)
+        self.viewer.layers.events.removed.connect(self._on_remove_layer)
 
         self.setAcceptDrops(True)
 
@@ -264,6 +276,10 @@ class QtViewer(QSplitter):
         settings.application.dask.events.connect(
             self._update_dask_cache_settings
         )
+        self._update_slice_cache_settings(settings.application.slice_cache)
+        settings.application.slice_cache.events.connect(
+            self._update_slice_cache_settings
+        )
 
         for layer in self.viewer.layers:
             self._add_layer(layer)
@@ -282,6 +298,22 @@ class QtViewer(QSplitter):
         size = dask_setting.cache
         resize_dask_cache(int(int(enabled) * size * 1e9))
 
+    @staticmethod
+    def _update_slice_cache_settings(
+        slice_cache_setting: SliceCacheSettings | Event = None,
+    ):
+        """Update the slice cache to match settings."""
+        if not slice_cache_setting:
+            return
+        if not isinstance(slice_cache_setting, SliceCacheSettings):
+            slice_cache_setting = get_settings().application.slice_cache
+
+        enabled = slice_cache_setting.enabled
+        size = slice_cache_setting.cache
+        resize_slice_cache(
+            int(int(enabled) * size * 1e9), slice_cache_setting.policy
+        )
+
     @property
     def controls(self) -> QtLayerControlsContainer:
         """Qt view for GUI controls."""
@@ -689,6 +721,75 @@ class QtViewer(QSplitter):
 
         self.canvas.add_layer_visual_mapping(layer, vispy_layer)
 
+        if hasattr(layer.events, 'data_range'):
+            layer.events.data_range.connect(self._on_data_range)
+            if layer.data_range_estimate is not None:
+                layer._apply_data_range(layer.data_range_estimate)
+            layer._refine_data_range()
+        if hasattr(layer.events, 'data_appended'):
+            layer.events.data_appended.connect(self._on_data_appended)
+        if hasattr(layer.events, 'bricks_loaded'):
+            layer.events.bricks_loaded.connect(self._on_bricks_loaded)
+        if hasattr(layer.events, 'tiles_loaded'):
+            layer.events.tiles_loaded.connect(self._on_tiles_loaded)
+
+    def _on_remove_layer(self, event):
+        """Stop the background work of a removed layer."""
+        layer = event.value
+        if hasattr(layer.events, 'data_range'):
+            layer._stop_refining_data_range()
+
+    @ensure_main_thread
+    def _on_layers_loaded(self, event):
+        """Callback connected to `viewer._layer_loader.events.ready`.
+
+        Swaps in the layers that were built in the background.
+        """
+        self.viewer._on_layers_loaded(event)
+
+    @ensure_main_thread
+    def _on_data_range(self, event):
+        """Apply a refined estimate of a layer's data range.
+
+        The estimate is computed and emitted from a background thread.
+        """
+        event.source._apply_data_range(event.value)
+
+    @ensure_main_thread
+    def _on_bricks_loaded(self, event):
+        """Show the 3D bricks of a layer as they are loaded.
+
+        The bricks are read and the event emitted from background threads.
+        """
+        event.source._on_bricks_loaded()
+
+    @ensure_main_thread
+    def _on_tiles_loaded(self, event):
+        """Show the 2D tiles of a multiscale layer as they are loaded.
+
+        The tiles are read and the event emitted from background threads.
+        """
+        event.source._on_tiles_loaded()
+
+    def _on_data_appended(self, event):
+        """Schedule a dims update for frames appended from any thread.
+
+        Appends are coalesced: while an update of the layer is waiting on the
+        main thread, further appends do not schedule another one.
+        """
+        layer = event.source
+        with self._appended_lock:
+            if layer in self._appended_layers:
+                return
+            self._appended_layers.add(layer)
+        self._apply_data_appended(layer)
+
+    @ensure_main_thread
+    def _apply_data_appended(self, layer):
+        with self._appended_lock:
+            self._appended_layers.discard(layer)
+        self.viewer._on_data_appended(layer)
+
     def _remove_invalid_chars(self, selected_layer_name):
         """Removes invalid characters from selected layer name to suggest a filename.
 
@@ -926,13 +1027,7 @@ class QtViewer(QSplitter):
                 )
             )
 
-        try:
-            self.viewer._layer_slicer.wait_until_idle(timeout=5)
-        except TimeoutError as e:  # pragma: no cover
-            raise TimeoutError(
-                'Slicing was too slow. Wait for all layers to load before taking a screenshot, '
-                'or disable async slicing in Preferences->Experimental.'
-            ) from e
+        self._wait_until_sliced()
 
         if fit_to_data_extent:
             # Use the same scene parameter calculations as in viewer_model.fit_to_view
@@ -966,6 +1061,43 @@ class QtViewer(QSplitter):
 
             return img
 
+    def _wait_until_sliced(self) -> None:
+        """Wait for pending slices before capturing the canvas."""
+        try:
+            self.viewer._layer_slicer.wait_until_idle(timeout=5)
+        except TimeoutError as e:  # pragma: no cover
+            raise TimeoutError(
+                'Slicing was too slow. Wait for all layers to load before taking a screenshot, '
+                'or disable async slicing in Preferences->Experimental.'
+            ) from e
+
+    def _render_regions(
+        self,
+        regions: Sequence[np.ndarray],
+        shapes: Sequence[tuple[int, int]],
+        paths: Sequence[str | Path | None],
+    ) -> list[np.ndarray]:
+        """Render world regions offscreen and save them in the background.
+
+        Rendering needs the OpenGL context and happens on the main thread,
+        while images are encoded and written by a thread pool, overlapping
+        with the rendering of the next regions.
+        """
+        self._wait_until_sliced()
+        images = []
+        rendered = self.canvas.render_regions(regions, shapes)
+        with ThreadPoolExecutor(
+            max_workers=min(len(regions), os.cpu_count() or 1, 8) or 1
+        ) as pool:
+            futures = []
+            for image, path in zip(rendered, paths, strict=True):
+                images.append(image)
+                if path is not None:
+                    futures.append(pool.submit(imsave, str(path), image))
+            for future in futures:
+                future.result()
+        return images
+
     @contextlib.contextmanager
     def resize_canvas(self, size: tuple[int, int] | None, scale: float):
         """Temporarily, safely, resize the canvas
@@ -1325,11 +1457,14 @@ class QtViewer(QSplitter):
     ):
         """Export the given rectangular rois to specified file paths.
 
-        For each shape, moves the camera to the center of the shape
-        and adjust the canvas size to fit the shape.
-        Note: The shape height and width can be of type float.
-        However, the canvas size only accepts a tuple of integers.
-        This can result in slight misalignment.
+        Rois are rendered offscreen from the current slice of the layers,
+        without moving the camera or resizing the canvas, and saved to disk
+        in the background while the next rois are rendered. Multiscale
+        layers are sliced for each roi at the level its export needs. By
+        default, one pixel of the exported images corresponds to one data
+        pixel of the layer with the finest scale. In grid mode, each view of
+        the grid is exported at that size, laid out as in the grid. Canvas
+        overlays, such as the scale bar, are not exported.
 
         Parameters
         ----------
@@ -1346,8 +1481,8 @@ class QtViewer(QSplitter):
             If None, the screenshots will only be returned and not saved
             to disk.
         scale: float, optional
-            Scale factor used to increase resolution of canvas for the screenshot.
-            By default, uses the displayed scale.
+            Scale factor used to increase resolution of the exported images.
+            By default, one image pixel per data pixel.
 
         Returns
         -------
@@ -1382,32 +1517,20 @@ class QtViewer(QSplitter):
                 "'export_rois' is not implemented for 3D view."
             )
 
-        screenshot_list = []
-        camera = self.viewer.camera
-        start_camera_center = camera.center
-        start_camera_zoom = camera.zoom
-        canvas = self.canvas
-        prev_size = canvas.size
-
         visible_dims = list(self.viewer.dims.displayed)
         step = min(self.viewer.layers.extent.step[visible_dims])
 
-        for index, roi in enumerate(rois):
-            center_coord, height, width = get_center_bbox(roi)
-            camera.center = center_coord
-            canvas.size = (int(height / step), int(width / step))
-
-            camera.zoom = 1 / step
-            path = paths[index] if paths is not None else None
-            screenshot_list.append(
-                self.screenshot(path=path, scale=scale, flash=False)
-            )
-
-        canvas.size = prev_size
-        camera.center = start_camera_center
-        camera.zoom = start_camera_zoom
+        regions = []
+        shapes = []
+        for roi in rois:
+            corners = np.asarray(roi, dtype=float)
+            regions.append(np.stack([corners.min(0), corners.max(0)]))
+            size = (corners.max(0) - corners.min(0)) / step * scale
+            shapes.append(tuple(np.round(size).astype(int)))
 
-        return screenshot_list
+        if paths is None:
+            paths = [None] * len(rois)
+        return self._render_regions(regions, shapes, paths)
 
     def export_figure(
         self,
@@ -1417,10 +1540,13 @@ class QtViewer(QSplitter):
     ) -> np.ndarray:
         """Export an image of the full extent of the displayed layer data.
 
-        This function finds a tight boundary around the data, resets the view
-        around that boundary (and, when scale=1, such that 1 captured pixel is
-        equivalent to one data pixel), takes a screenshot, then restores the
-        previous zoom and canvas sizes.
+        This function finds a tight boundary around the data and renders it
+        such that, when scale=1, 1 captured pixel is equivalent to one data
+        pixel. In a single 2D view, the data is rendered offscreen without
+        moving the camera, multiscale layers being sliced for it, and canvas
+        overlays are not exported. Otherwise, the view is reset around the
+        data, a screenshot is taken, then the previous zoom and canvas sizes
+        are restored.
 
         Parameters
         ----------
@@ -1448,6 +1574,20 @@ class QtViewer(QSplitter):
                 )
             )
 
+        if self.viewer.dims.ndisplay == 2 and not self.viewer.grid.enabled:
+            displayed = list(self.viewer.dims.displayed)
+            extent = self.viewer._get_scene_parameters()[0][:, displayed]
+            step = min(self.viewer.layers.extent.step[displayed])
+            size = np.ceil((extent[1] - extent[0]) / step * scale)
+            (img,) = self._render_regions(
+                [extent], [tuple(size.astype(int))], [path]
+            )
+            if flash:
+                from minapari._qt.utils import add_flash_animation
+
+                add_flash_animation(self._welcome_widget)
+            return img
+
         img = QImg2array(
             self._screenshot(
                 scale=scale,
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
 import gc
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from functools import partial
 from typing import TYPE_CHECKING
 from weakref import WeakSet
@@ -15,10 +16,17 @@ from vispy.scene import SceneCanvas as SceneCanvas_, ViewBox, Widget
 from minapari._vispy.camera import VispyCamera
 from minapari._vispy.mouse_event import NapariMouseEvent
 from minapari._vispy.utils.cursor import QtCursorVisual
-from minapari._vispy.utils.gl import get_max_texture_sizes
+from minapari._vispy.utils.gl import (
+    get_max_texture_sizes,
+    texture_upload_stats,
+)
+from minapari._vispy.utils.interaction import InteractiveVolumeQuality
+from minapari._vispy.utils.offscreen import OffscreenRenderer
 from minapari._vispy.utils.visual import create_vispy_overlay
+from minapari._vispy.visuals.volume import Volume as VolumeNode
 from minapari.components._viewer_constants import CanvasPosition
 from minapari.components.overlays import CanvasOverlay
+from minapari.settings import get_settings
 from minapari.utils._proxies import ReadOnlyWrapper
 from minapari.utils.colormaps.standardize_color import transform_color
 from minapari.utils.events import disconnect_events
@@ -251,6 +259,28 @@ class VispyCanvas:
         self.viewer.camera.events.mouse_zoom.connect(self._on_interactive)
         self.viewer.camera.events.zoom.connect(self._on_cursor)
 
+        # Volumes are drawn with a coarser ray step while the camera moves.
+        self._interaction_quality = InteractiveVolumeQuality(
+            self._scene_canvas, self._volume_visuals
+        )
+        quality_settings = get_settings().application.interactive_quality
+        self._on_interaction_quality_settings()
+        quality_settings.events.connect(
+            self._on_interaction_quality_settings
+        )
+        for name in ('center', 'zoom', 'angles', 'perspective'):
+            getattr(self.viewer.camera.events, name).connect(
+                self._on_camera_move
+            )
+        # The render time of frames is measured around all other draw
+        # callbacks.
+        self._scene_canvas.events.draw.connect(
+            self._interaction_quality.on_draw_start, position='first'
+        )
+        self._scene_canvas.events.draw.connect(
+            self._interaction_quality.on_draw_end, position='last'
+        )
+
         self.viewer._zoom_box.events.zoom.connect(self._on_boxzoom)
         self.viewer.layers.events.reordered.connect(self._update_scenegraph)
         self.viewer.layers.events.removed.connect(self._remove_layer)
@@ -423,6 +453,28 @@ class VispyCanvas:
             self.view.interactive = interactive
             self.grid.interactive = False
 
+    def _on_interaction_quality_settings(self, event=None) -> None:
+        """Apply the interactive quality settings."""
+        settings = get_settings().application.interactive_quality
+        quality = self._interaction_quality
+        quality.enabled = settings.enabled
+        quality.target_frame_time = settings.target_frame_time / 1000
+        quality.idle_delay = settings.idle_delay / 1000
+        quality.max_step_factor = settings.max_step_factor
+        if not settings.enabled:
+            quality.reset()
+
+    def _on_camera_move(self) -> None:
+        """Render volumes at interactive quality while the camera moves."""
+        if self.viewer.dims.ndisplay == 3:
+            self._interaction_quality.on_camera_move()
+
+    def _volume_visuals(self) -> Iterator[VolumeNode]:
+        """Volume visuals of the layers."""
+        for vispy_layer in self.layer_to_visual.values():
+            if isinstance(vispy_layer.node, VolumeNode):
+                yield vispy_layer.node
+
     def _on_boxzoom(self, event):
         """Update zoom level."""
         box_size_canvas = np.abs(
@@ -718,7 +770,9 @@ class VispyCanvas:
                     :, displayed_axes
                 ],
                 shape_threshold=self._current_viewbox_size[::-1],
+                camera=self.viewer.camera,
             )
+        texture_upload_stats.end_frame()
 
     def on_resize(self, event: ResizeEvent) -> None:
         """Called whenever canvas is resized.
@@ -1126,6 +1180,128 @@ class VispyCanvas:
         self.on_draw(None)
         return self.native.grabFramebuffer()
 
+    def render_regions(
+        self,
+        regions: Iterable[npt.ArrayLike],
+        shapes: Iterable[tuple[int, int]],
+    ) -> Iterator[npt.NDArray[np.uint8]]:
+        """Render regions of the 2D scene offscreen, one after the other.
+
+        Unlike `screenshot`, this neither moves the camera nor resizes the
+        canvas, so what is shown on screen is left untouched. Multiscale
+        layers are sliced for each region, at the level of its rendered
+        shape, and sliced back for the view when done. Other layers are
+        drawn as currently sliced. Canvas overlays, such as the scale bar,
+        are not drawn.
+
+        In grid mode, each view of the grid is rendered at the requested
+        shape, and the images are laid out as in the grid, with its spacing.
+
+        Parameters
+        ----------
+        regions : iterable of array, shape (2, 2)
+            Minimum and maximum world coordinates of each region, along the
+            displayed dimensions.
+        shapes : iterable of tuple of int
+            Shape (height, width) of the image rendered for each region, or
+            for each view of the grid.
+
+        Returns
+        -------
+        images : iterator of array
+            Numpy arrays of type ubyte and shape (h, w, 4), rendered as the
+            iterator is consumed. Index [0, 0] is the upper-left corner of the
+            rendered region.
+        """
+        if self.viewer.dims.ndisplay != 2:
+            raise NotImplementedError(
+                trans._(
+                    'Offscreen rendering is only implemented for 2D views.',
+                    deferred=True,
+                )
+            )
+        return self._render_regions(regions, shapes)
+
+    def _render_regions(
+        self,
+        regions: Iterable[npt.ArrayLike],
+        shapes: Iterable[tuple[int, int]],
+    ) -> Iterator[npt.NDArray[np.uint8]]:
+        if self.viewer.grid.enabled:
+            cells = [
+                position
+                for position, indices in self.viewer.grid.iter_viewboxes(
+                    len(self.viewer.layers)
+                )
+                if indices
+            ]
+            views = self.grid_views
+        else:
+            cells = [(0, 0)]
+            views = [self.view]
+        multiscale = [
+            layer
+            for layer in self.viewer.layers
+            if layer.visible and getattr(layer, 'multiscale', False)
+        ]
+        with contextlib.ExitStack() as stack:
+            renderers = [
+                stack.enter_context(
+                    OffscreenRenderer(self._scene_canvas, view)
+                )
+                for view in views
+            ]
+            for layer in multiscale:
+                stack.callback(
+                    self._restore_slice, layer, *_slice_state(layer)
+                )
+            for region, shape in zip(regions, shapes, strict=True):
+                region = np.asarray(region, dtype=float)
+                for layer in multiscale:
+                    _slice_region(layer, region, shape)
+                images = [
+                    renderer.render(region, shape) for renderer in renderers
+                ]
+                yield self._tile_grid(cells, images)
+
+    def _tile_grid(
+        self,
+        cells: list[tuple[int, int]],
+        images: list[npt.NDArray[np.uint8]],
+    ) -> npt.NDArray[np.uint8]:
+        """Lay out the images rendered for the views as in the grid."""
+        if len(images) == 1:
+            return images[0]
+        height, width = images[0].shape[:2]
+        rows, cols = self.viewer.grid.actual_shape(len(self.viewer.layers))
+        spacing = self.viewer.grid._compute_canvas_spacing(
+            (cols * width, rows * height), len(self.viewer.layers)
+        )
+        tiled = np.zeros(
+            (
+                rows * height + (rows - 1) * spacing,
+                cols * width + (cols - 1) * spacing,
+                4,
+            ),
+            dtype=np.uint8,
+        )
+        tiled[...] = np.round(
+            transform_color(self._scene_canvas.bgcolor.rgba)[0] * 255
+        )
+        for (row, col), image in zip(cells, images, strict=True):
+            top = row * (height + spacing)
+            left = col * (width + spacing)
+            tiled[top : top + height, left : left + width] = image
+        return tiled
+
+    @staticmethod
+    def _restore_slice(layer: Layer, level, corner_pixels, scale_factor):
+        """Slice a layer back as it was before rendering regions."""
+        layer._data_level = level
+        layer.corner_pixels = corner_pixels
+        layer.scale_factor = scale_factor
+        layer._refresh_sync(data_displayed=True)
+
     def enable_dims_play(self, *args) -> None:
         """Enable playing of animation. False if awaiting a draw event"""
         self.viewer.dims._play_ready = True
@@ -1230,3 +1406,34 @@ class VispyCanvas:
             self.viewer.grid.spacing = safe_spacing
 
         self.grid.spacing = safe_spacing
+
+
+
+def _slice_state(layer: Layer) -> tuple:
+    """Level, corner pixels and scale factor a multiscale layer is sliced at."""
+    return layer.data_level, layer.corner_pixels.copy(), layer.scale_factor
+
+
+def _slice_region(
+    layer: Layer, region: np.ndarray, shape: tuple[int, int]
+) -> None:
+    """Slice a multiscale layer for a region rendered at a given shape.
+
+    The level and corners are chosen as for a view of that shape showing
+    the region, and the layer is sliced on the calling thread, so that its
+    visual is updated before the region is rendered.
+    """
+    ndisplayed = len(layer._slice_input.displayed)
+    scale_factor = np.max((region[1] - region[0]) / np.asarray(shape))
+    with layer._block_refresh():
+        layer._update_draw(
+            scale_factor=float(scale_factor),
+            corner_pixels_displayed=region[:, -ndisplayed:],
+            shape_threshold=tuple(shape),
+        )
+    # Exports show the data of the level, not a coarser preview of it.
+    read_all_tiles = getattr(
+        layer, '_read_all_tiles', contextlib.nullcontext
+    )
+    with read_all_tiles():
+        layer._refresh_sync(data_displayed=True)
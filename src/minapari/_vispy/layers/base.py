@@ -164,7 +164,7 @@ class VispyBaseLayer(ABC, Generic[_L]):
     def _on_matrix_change(self):
         dims_displayed = self.layer._slice_input.displayed
         # mypy: self.layer._transforms.simplified cannot be None
-        transform = self.layer._transforms.simplified.set_slice(dims_displayed)
+        transform = self.layer._transforms.simplified_slice(dims_displayed)
         # convert NumPy axis ordering to VisPy axis ordering
         # by reversing the axes order and flipping the linear
         # matrix
@@ -202,9 +202,11 @@ class VispyBaseLayer(ABC, Generic[_L]):
             # of pixel to center of pixel.
             # Note this offset is only required for array like data in
             # 2D.
-            offset_matrix = self.layer._data_to_world.set_slice(
-                dims_displayed
-            ).linear_matrix
+            offset_matrix = (
+                self.layer._transforms[1:3]
+                .simplified_slice(dims_displayed)
+                .linear_matrix
+            )
             offset = -offset_matrix @ np.ones(offset_matrix.shape[1]) / 2
             # Convert NumPy axis ordering to VisPy axis ordering
             # and embed in full affine matrix
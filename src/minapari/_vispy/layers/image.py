@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import numpy as np
 from vispy.scene import Node
+from vispy.visuals._scalable_textures import CPUScaledTextureMixin
 
 from minapari._vispy.layers.scalar_field import (
     _VISPY_FORMAT_TO_DTYPE,
     ScalarFieldLayerNode,
     VispyScalarFieldBaseLayer,
 )
-from minapari._vispy.utils.gl import get_gl_extensions
+from minapari._vispy.utils.gl import (
+    fix_data_dtype,
+    get_gl_extensions,
+    texture_dtype,
+    texture_upload_stats,
+)
 from minapari._vispy.visuals.image import Image as ImageNode
 from minapari._vispy.visuals.volume import Volume as VolumeNode
 from minapari.layers.base._base_constants import Blending
@@ -103,6 +109,7 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
         self.layer.events.gamma.connect(self._on_gamma_change)
         self.layer.events.iso_threshold.connect(self._on_iso_threshold_change)
         self.layer.events.attenuation.connect(self._on_attenuation_change)
+        self.layer.events.region_update.connect(self._on_region_update)
 
         # display_change is special (like data_change) because it requires a
         # self.reset(). This means that we have to call it manually. Also,
@@ -119,6 +126,126 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
             else self.layer.interpolation3d
         )
 
+    def _on_data_change(self) -> None:
+        if not self._set_tiles():
+            super()._on_data_change()
+
+    def _set_tiles(self) -> bool:
+        """Show a 2D multiscale slice tile by tile.
+
+        The node keeps the tiles in a texture atlas, so that only the tiles
+        that newly enter the view, or whose coarser fill was replaced by
+        their own data, are uploaded.
+
+        Returns
+        -------
+        bool
+            False if the slice is not made of whole tiles, e.g. because it
+            was sliced for an export, or cannot be shown tile by tile.
+        """
+        layer = self.layer
+        response = layer._slice
+        layout = getattr(response, 'tiles', None)
+        displayed = list(layer._slice_input.displayed)
+        if (
+            layout is None
+            or len(displayed) != 2
+            or displayed != sorted(displayed)
+            # Rescaled data depends on the contrast limits.
+            or response.image.view is not response.image.raw
+        ):
+            return False
+        view = response.image.view
+        node = self._layer_node.get_node(2, texture_dtype(view.dtype))
+        if node is not self.node or not isinstance(node, ImageNode):
+            return False
+        tiles = []
+        for key in layout.keys:
+            start = [
+                key.index[axis] * size - origin
+                for axis, size, origin in zip(
+                    displayed, layout.tile_shape, layout.origin, strict=True
+                )
+            ]
+            stop = [
+                min(first + size, level_size - origin)
+                for first, size, level_size, origin in zip(
+                    start,
+                    layout.tile_shape,
+                    layout.shape,
+                    layout.origin,
+                    strict=True,
+                )
+            ]
+            if min(start) < 0 or any(
+                end > size for end, size in zip(stop, view.shape, strict=False)
+            ):
+                return False
+            tiles.append(
+                (
+                    (layout.generation, key),
+                    tuple(start),
+                    view[start[0] : stop[0], start[1] : stop[1]],
+                    key not in layout.pending,
+                )
+            )
+        if not node.set_tiles(
+            view.shape[:2],
+            layout.tile_shape,
+            tiles,
+            max_size=self.MAX_TEXTURE_SIZE_2D,
+        ):
+            return False
+        self._on_matrix_change()
+        node.update()
+        return True
+
+    def _on_region_update(self, event) -> None:
+        """Upload the part of the slice changed by ``Image.update_region``.
+
+        Falls back to a full data update when the node does not hold the
+        slice as is, e.g. after it was downsampled to fit the texture.
+        """
+        node = self.node
+        if isinstance(node, VolumeNode):
+            stored = node._last_data
+        elif isinstance(node, ImageNode):
+            stored = node._data
+        else:
+            stored = None
+        data = event.data
+        # Like `Image._raw_to_displayed` for the whole slice, rescale data
+        # whose contrast limits are out of the range or precision of
+        # float32.
+        contrast_limits = self.layer.contrast_limits
+        coerced = _coerce_contrast_limits(contrast_limits)
+        if not np.allclose(coerced.contrast_limits, contrast_limits):
+            data = coerced.coerce_data(data)
+        data = fix_data_dtype(data)
+        if (
+            stored is None
+            or not stored.flags.writeable
+            or stored.dtype != data.dtype
+            or stored.shape != self.layer._data_view.shape
+        ):
+            self._on_data_change()
+            return
+        region = tuple(
+            slice(start, start + size)
+            for start, size in zip(event.offset, data.shape, strict=True)
+        )
+        # Keep the node data in sync, it is uploaded again in full when
+        # the texture has to be rebuilt.
+        stored[region] = data
+        # CPU-scaled textures normalize the data they are given in place.
+        node._texture.scale_and_set_data(
+            data,
+            offset=event.offset,
+            copy=isinstance(node._texture, CPUScaledTextureMixin),
+        )
+        texture_upload_stats.add_upload(data.nbytes)
+        node.update()
+
     def _on_rendering_change(self) -> None:
         super()._on_rendering_change()
         self._on_attenuation_change()
@@ -3,7 +3,6 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 from functools import lru_cache
-from typing import Any, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -11,6 +10,7 @@ from vispy.app import Canvas
 from vispy.gloo import gl
 from vispy.gloo.context import get_current_canvas
 
+from minapari.utils.perf import USE_PERFMON, add_counter_event
 from minapari.utils.translations import trans
 
 texture_dtypes = [
@@ -77,10 +77,91 @@ def get_max_texture_sizes() -> tuple[int, int]:
     return max_size_2d, max_size_3d
 
 
+class TextureUploadStats:
+    """Bytes copied and uploaded on the way to textures, per frame.
+
+    Copies made by :func:`fix_data_dtype` and data handed to texture
+    visuals are added to the counts of the current frame. The canvas ends
+    the frame after drawing, which moves the counts to ``last_frame`` and,
+    when perfmon is enabled, records them as a ``texture_upload`` counter
+    event.
+
+    Attributes
+    ----------
+    bytes_copied : int
+        Bytes copied to convert data to a texture dtype or layout during
+        the current frame.
+    bytes_uploaded : int
+        Bytes set as texture data during the current frame.
+    last_frame : dict[str, int]
+        The counts of the last completed frame.
+    """
+
+    def __init__(self) -> None:
+        self.bytes_copied = 0
+        self.bytes_uploaded = 0
+        self.last_frame = {'bytes_copied': 0, 'bytes_uploaded': 0}
+
+    def add_copy(self, nbytes: int) -> None:
+        self.bytes_copied += int(nbytes)
+
+    def add_upload(self, nbytes: int) -> None:
+        self.bytes_uploaded += int(nbytes)
+
+    def end_frame(self) -> None:
+        """Store and reset the counts of the current frame."""
+        self.last_frame = {
+            'bytes_copied': self.bytes_copied,
+            'bytes_uploaded': self.bytes_uploaded,
+        }
+        self.bytes_copied = 0
+        self.bytes_uploaded = 0
+        if USE_PERFMON:
+            add_counter_event('texture_upload', **self.last_frame)
+
+
+texture_upload_stats = TextureUploadStats()
+
+
+def texture_dtype(dtype: npt.DTypeLike) -> np.dtype:
+    """Return the dtype that data of ``dtype`` is uploaded to vispy as.
+
+    Acceptable types are int8, uint8, int16, uint16, float32.
+    """
+    dtype = np.dtype(dtype)
+    dtype_ = dtype
+    if dtype not in texture_dtypes:
+        try:
+            dtype_ = np.dtype(
+                {
+                    'i': np.float32,
+                    'f': np.float32,
+                    'u': np.uint16,
+                    'b': np.uint8,
+                }[dtype.kind]
+            )
+            if dtype_ == np.uint16 and dtype.itemsize > 2:
+                dtype_ = np.dtype(np.float32)
+        except KeyError as e:  # not an int or float
+            raise TypeError(
+                trans._(
+                    'type {dtype} not allowed for texture; must be one of {textures}',
+                    deferred=True,
+                    dtype=dtype,
+                    textures=set(texture_dtypes),
+                )
+            ) from e
+    return dtype_
+
+
 def fix_data_dtype(data: npt.NDArray) -> npt.NDArray:
     """Makes sure the dtype of the data is accetpable to vispy.
 
     Acceptable types are int8, uint8, int16, uint16, float32.
+    Data is also made C-contiguous, in the same copy as the dtype
+    conversion if one is needed. Data that already has an acceptable dtype
+    and layout, such as a contiguous slice of a memory-mapped array, is
+    returned as is, so that it is uploaded straight from its buffer.
 
     Parameters
     ----------
@@ -92,33 +173,13 @@ def fix_data_dtype(data: npt.NDArray) -> npt.NDArray:
     np.ndarray
         Data that is of right type and will be passed to vispy.
     """
-
-    dtype = np.dtype(data.dtype)
-    if dtype in texture_dtypes:
-        return data
-
-    try:
-        dtype_ = cast(
-            'type[np.unsignedinteger[Any] | np.floating[Any]]',
-            {
-                'i': np.float32,
-                'f': np.float32,
-                'u': np.uint16,
-                'b': np.uint8,
-            }[dtype.kind],
-        )
-        if dtype_ == np.uint16 and dtype.itemsize > 2:
-            dtype_ = np.float32
-    except KeyError as e:  # not an int or float
-        raise TypeError(
-            trans._(
-                'type {dtype} not allowed for texture; must be one of {textures}',
-                deferred=True,
-                dtype=dtype,
-                textures=set(texture_dtypes),
-            )
-        ) from e
-    return data.astype(dtype_)
+    dtype_ = texture_dtype(data.dtype)
+    array = np.asarray(data)
+    if array.dtype == dtype_ and array.flags.c_contiguous:
+        return array
+    fixed = np.ascontiguousarray(array, dtype=dtype_)
+    texture_upload_stats.add_copy(fixed.nbytes)
+    return fixed
 
 
 # blend_func parameters are multiplying:
@@ -0,0 +1,166 @@
+"""Coarser volume rendering while the camera moves."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from time import perf_counter
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from vispy.app import Timer
+from vispy.gloo import gl
+
+if TYPE_CHECKING:
+    from vispy.scene import SceneCanvas
+
+    from minapari._vispy.visuals.volume import Volume
+
+
+class InteractiveVolumeQuality:
+    """Coarsen the ray step of volumes while the camera moves.
+
+    While the camera moves, the relative step size of every volume is
+    multiplied by a factor that is adjusted after each frame, so that frames
+    take about ``target_frame_time`` to render. The render time is measured
+    from ``on_draw_start``, connected first to the draw event of the canvas,
+    to ``on_draw_end``, connected last, which waits for the GPU to finish.
+    Waiting stalls the CPU, so only one frame in ``sample_interval`` is
+    measured. The time between frames is not used, since it depends on how
+    often the camera moves rather than on the cost of rendering. Once the camera has
+    been idle for ``idle_delay``, the original step sizes are restored and
+    the canvas is drawn again at full quality.
+
+    Parameters
+    ----------
+    canvas : vispy.scene.SceneCanvas
+        Canvas drawing the volumes.
+    volumes : callable
+        Returns the volume visuals currently drawn by the canvas.
+    target_frame_time : float
+        Target duration of a frame while interacting, in seconds.
+    idle_delay : float
+        Time without camera motion after which full quality is restored, in
+        seconds.
+    max_step_factor : float
+        Largest factor the step size is multiplied by.
+    sample_interval : int
+        Number of frames per measured frame while the camera moves. The
+        first frame of each interaction is always measured.
+    enabled : bool
+        If False, volumes are always drawn at full quality.
+    """
+
+    def __init__(
+        self,
+        canvas: SceneCanvas,
+        volumes: Callable[[], Iterable[Volume]],
+        *,
+        target_frame_time: float = 1 / 30,
+        idle_delay: float = 0.3,
+        max_step_factor: float = 4.0,
+        sample_interval: int = 8,
+        enabled: bool = True,
+    ) -> None:
+        self.target_frame_time = target_frame_time
+        self.max_step_factor = max_step_factor
+        self.sample_interval = sample_interval
+        self.enabled = enabled
+        self._canvas = canvas
+        self._volumes = volumes
+        self._idle_delay = idle_delay
+        self._timer: Timer | None = None
+        self._factor = 1.0
+        self._base_steps: WeakKeyDictionary[Volume, float] = (
+            WeakKeyDictionary()
+        )
+        self._moving = False
+        self._draw_start: float | None = None
+        self._frames = 0
+
+    @property
+    def idle_delay(self) -> float:
+        """Time without camera motion before full quality is restored."""
+        return self._idle_delay
+
+    @idle_delay.setter
+    def idle_delay(self, value: float) -> None:
+        self._idle_delay = value
+        if self._timer is not None:
+            self._timer.interval = value
+
+    @property
+    def factor(self) -> float:
+        """Factor the step size of volumes is currently multiplied by."""
+        return self._factor if self._moving else 1.0
+
+    def on_camera_move(self, event=None) -> None:
+        """Switch to interactive quality until the camera stops moving."""
+        if not self.enabled:
+            return
+        if not self._moving:
+            self._moving = True
+            self._frames = 0
+            # Start from the factor the previous interaction settled on.
+            self._apply(self._factor)
+        if self._timer is None:
+            self._timer = Timer(
+                interval=self._idle_delay,
+                connect=self._on_idle,
+                iterations=1,
+                start=False,
+            )
+        self._timer.start()
+
+    def on_draw_start(self, event=None) -> None:
+        """Time the start of a frame, if it is sampled."""
+        self._draw_start = None
+        if not self._moving:
+            return
+        sampled = self._frames % max(self.sample_interval, 1) == 0
+        self._frames += 1
+        if sampled:
+            # Wait for the previous frames, so they are not timed too.
+            gl.glFinish()
+            self._draw_start = perf_counter()
+
+    def on_draw_end(self, event=None) -> None:
+        """Adapt the step size to the render time of the frame."""
+        start, self._draw_start = self._draw_start, None
+        if start is None or not self._moving:
+            return
+        # Drawing only queues GL commands, wait for them to be executed.
+        gl.glFinish()
+        frame_time = perf_counter() - start
+        # The cost of a frame is inversely proportional to the step size.
+        ratio = frame_time / self.target_frame_time
+        factor = float(
+            np.clip(self._factor * ratio**0.5, 1, self.max_step_factor)
+        )
+        # Avoid redrawing for small changes.
+        if abs(factor - self._factor) > 0.05 * self._factor:
+            self._apply(factor)
+
+    def _apply(self, factor: float) -> None:
+        self._factor = factor
+        for volume in self._volumes():
+            base = self._base_steps.setdefault(
+                volume, volume.relative_step_size
+            )
+            volume.relative_step_size = base * factor
+
+    def _on_idle(self, event=None) -> None:
+        self._moving = False
+        self._draw_start = None
+        if not self._base_steps:
+            return
+        for volume, base in list(self._base_steps.items()):
+            volume.relative_step_size = base
+        self._base_steps.clear()
+        self._canvas.update()
+
+    def reset(self) -> None:
+        """Restore full quality immediately."""
+        if self._timer is not None:
+            self._timer.stop()
+        self._on_idle()
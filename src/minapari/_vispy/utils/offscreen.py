@@ -0,0 +1,135 @@
+"""Offscreen rendering of regions of a 2D view."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from vispy.geometry import Rect
+from vispy.gloo import FrameBuffer, RenderBuffer
+from vispy.visuals.transforms import STTransform
+
+from minapari.utils.translations import trans
+
+if TYPE_CHECKING:
+    from vispy.scene import SceneCanvas, ViewBox
+
+
+class OffscreenRenderer:
+    """Render regions of the scene of a 2D view into offscreen framebuffers.
+
+    Regions are drawn with a scene transform of their own, which is swapped
+    in for the duration of each render and restored afterwards, so the
+    camera of the view and what is shown on screen are left untouched. The
+    visuals of the view, and so the textures already uploaded for them, are
+    shared with the on-screen rendering, and framebuffers are reused between
+    regions of the same size.
+
+    Only the scene of the view is drawn: layers and scene overlays, but not
+    canvas overlays such as the scale bar.
+
+    This must be used from the main thread, as a context manager.
+
+    Parameters
+    ----------
+    canvas : vispy.scene.SceneCanvas
+        Canvas the view belongs to.
+    view : vispy.scene.ViewBox
+        View whose scene is rendered. Its camera must be a 2D camera.
+    bgcolor : color, optional
+        Background color of the rendered images. By default, the background
+        color of the canvas.
+    """
+
+    def __init__(
+        self,
+        canvas: SceneCanvas,
+        view: ViewBox,
+        bgcolor=None,
+    ) -> None:
+        self._canvas = canvas
+        self._view = view
+        self._bgcolor = canvas.bgcolor if bgcolor is None else bgcolor
+        self._framebuffers: dict[tuple[int, int], FrameBuffer] = {}
+        self._scene_transform = None
+
+    def __enter__(self) -> OffscreenRenderer:
+        self._canvas.set_current()
+        self._scene_transform = self._view.scene.transform
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._view.scene.transform = self._scene_transform
+        self._scene_transform = None
+        for fbo in self._framebuffers.values():
+            fbo.color_buffer.delete()
+            fbo.depth_buffer.delete()
+            fbo.delete()
+        self._framebuffers.clear()
+
+    def _framebuffer(self, shape: tuple[int, int]) -> FrameBuffer:
+        fbo = self._framebuffers.get(shape)
+        if fbo is None:
+            fbo = FrameBuffer(
+                color=RenderBuffer(shape), depth=RenderBuffer(shape)
+            )
+            self._framebuffers[shape] = fbo
+        return fbo
+
+    def _transform(self, region: np.ndarray) -> STTransform:
+        """Scene transform mapping a region onto the whole view.
+
+        This mirrors the transform set by vispy's ``PanZoomCamera``.
+        """
+        camera = self._view.camera
+        (y0, x0), (y1, x1) = region
+        rect = Rect((x0, y0), (x1 - x0, y1 - y0))
+        view_rect = self._view.rect.flipped(
+            x=camera.flip[0], y=(not camera.flip[1])
+        )
+        transform = STTransform()
+        transform.set_mapping(rect, view_rect, update=False)
+        transform.zoom((1, 1, 1 / camera.depth_value))
+        transform.dynamic = True
+        return transform
+
+    def render(
+        self, region: np.ndarray, shape: tuple[int, int]
+    ) -> np.ndarray:
+        """Render a region of the scene.
+
+        Parameters
+        ----------
+        region : array, shape (2, 2)
+            Minimum and maximum scene coordinates of the region, in
+            (row, column) order.
+        shape : tuple of int
+            Shape (height, width) of the rendered image in pixels.
+
+        Returns
+        -------
+        image : array
+            Numpy array of type ubyte and shape (h, w, 4). Index [0, 0] is
+            the upper-left corner of the rendered region.
+        """
+        if self._scene_transform is None:
+            raise RuntimeError(
+                trans._(
+                    'OffscreenRenderer must be entered before rendering.',
+                    deferred=True,
+                )
+            )
+        shape = (max(int(shape[0]), 1), max(int(shape[1]), 1))
+        canvas = self._canvas
+        view = self._view
+        view.scene.transform = self._transform(np.asarray(region))
+        # The region is stretched over the whole view, so that the clipping
+        # of the view never cuts it, then resampled to the requested shape.
+        fbo = self._framebuffer(shape)
+        canvas.push_fbo(fbo, view.pos, view.size)
+        try:
+            canvas.context.clear(color=self._bgcolor, depth=True)
+            canvas.draw_visual(view.scene)
+            return fbo.read()
+        finally:
+            canvas.pop_fbo()
@@ -1,10 +1,196 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+import numpy as np
 from vispy.scene.visuals import Image as BaseImage
 
+from minapari._vispy.utils.gl import texture_dtype, texture_upload_stats
 from minapari._vispy.visuals.util import TextureMixin
 
 
 # If data is not present, we need bounds to be None (see napari#3517)
 class Image(TextureMixin, BaseImage):
+    """Image visual that can also show a slice made of tiles.
+
+    In tile mode, the texture is an atlas of fixed-size slots. Each tile of
+    the slice is drawn as a quad sampling its slot, so that a tile is only
+    uploaded when it first enters the slice or when its final data replaces
+    a preview, e.g. a tile filled from a coarser level.
+    """
+
+    # Shape of the slice in tile mode, None otherwise.
+    _tiled_shape: tuple[int, int] | None = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.unfreeze()
+        # Slot and completeness of the tiles held by the atlas, least
+        # recently shown first.
+        self._tile_slots: OrderedDict[Hashable, tuple[int, bool]] = (
+            OrderedDict()
+        )
+        self._atlas_grid = (0, 0)
+        self._tile_shape = (0, 0)
+        self._tiled_shape = None
+        self._tile_vertices: tuple[np.ndarray, np.ndarray] | None = None
+        self._untiled_method = self._method
+        self.freeze()
+
+    @property
+    def size(self) -> tuple[int, int]:
+        if self._tiled_shape is not None:
+            return self._tiled_shape[::-1]
+        return super().size
+
+    def set_data(self, data: Any, *args: Any, **kwargs: Any) -> None:
+        self._stop_tiles()
+        super().set_data(data, *args, **kwargs)
+
+    def set_tiles(
+        self,
+        shape: Sequence[int],
+        tile_shape: Sequence[int],
+        tiles: Sequence[tuple[Hashable, tuple[int, int], np.ndarray, bool]],
+        max_size: int | None = None,
+    ) -> bool:
+        """Show a slice made of tiles, uploading only the changed tiles.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Shape (rows, columns) of the slice.
+        tile_shape : tuple of int
+            Shape (rows, columns) of a whole tile.
+        tiles : sequence of tuple
+            ``(key, start, data, complete)`` of each tile of the slice.
+            ``key`` identifies the tile data, ``start`` is the index of its
+            first pixel in the slice and ``data`` may be smaller than a
+            whole tile at the edges of the slice. It is converted to a
+            texture dtype when it is uploaded. Tiles that are not
+            ``complete`` are uploaded again once they are complete.
+        max_size : int, optional
+            Maximum size of a 2D texture.
+
+        Returns
+        -------
+        bool
+            False if the tiles do not fit in a texture, in which case the
+            visual is not changed.
+        """
+        tile_shape = (int(tile_shape[0]), int(tile_shape[1]))
+        if not tiles:
+            return False
+        first = tiles[0][2]
+        dtype = texture_dtype(first.dtype)
+        reallocate = (
+            self._tiled_shape is None
+            or self._data is None
+            or tile_shape != self._tile_shape
+            or self._data.dtype != dtype
+            or self._data.shape[2:] != first.shape[2:]
+            or len(tiles) > math.prod(self._atlas_grid)
+        )
+        if reallocate:
+            grid = _atlas_grid(len(tiles), tile_shape, max_size)
+            if grid is None:
+                return False
+            self._texture.check_data_format(first)
+            self._data = np.zeros(
+                (grid[0] * tile_shape[0], grid[1] * tile_shape[1])
+                + first.shape[2:],
+                dtype=dtype,
+            )
+            self._atlas_grid = grid
+            self._tile_shape = tile_shape
+            self._tile_slots.clear()
+            self._need_texture_upload = True
+        # Full uploads send the whole atlas anyway.
+        upload = not self._need_texture_upload
+        shown = {key for key, *_ in tiles}
+        needed = len(shown.difference(self._tile_slots))
+        used = {slot for slot, _ in self._tile_slots.values()}
+        free_slots = sorted(
+            set(range(math.prod(self._atlas_grid))).difference(used)
+        )
+        # Slots of tiles that are not shown are reused, oldest first.
+        for key in list(self._tile_slots):
+            if len(free_slots) >= needed:
+                break
+            if key not in shown:
+                free_slots.append(self._tile_slots.pop(key)[0])
+        positions = []
+        texcoords = []
+        atlas_shape = np.array(self._data.shape[:2], dtype=np.float32)
+        for key, start, data, complete in tiles:
+            entry = self._tile_slots.pop(key, None)
+            if entry is None:
+                slot = free_slots.pop(0)
+            else:
+                slot = entry[0]
+            row, column = divmod(slot, self._atlas_grid[1])
+            offset = (row * tile_shape[0], column * tile_shape[1])
+            if entry is None or (complete and not entry[1]):
+                region = tuple(
+                    slice(o, o + s)
+                    for o, s in zip(offset, data.shape[:2], strict=True)
+                )
+                self._data[region] = data
+                if upload:
+                    # A copy, which CPU-scaled textures may normalize.
+                    tile = np.array(self._data[region], order='C')
+                    self._texture.scale_and_set_data(
+                        tile, offset=offset, copy=False
+                    )
+                    texture_upload_stats.add_upload(tile.nbytes)
+            self._tile_slots[key] = (slot, complete)
+            quad = _quad(start, data.shape[:2])
+            positions.append(quad)
+            texcoords.append(
+                _quad(offset, data.shape[:2]) / atlas_shape[::-1]
+            )
+        if self._tiled_shape is None:
+            self._untiled_method = self._method
+            self._use_method('subdivide')
+        self._tiled_shape = (int(shape[0]), int(shape[1]))
+        self._tile_vertices = (
+            np.concatenate(positions).astype(np.float32),
+            np.concatenate(texcoords).astype(np.float32),
+        )
+        self._need_vertex_update = True
+        self.update()
+        return True
+
+    def _stop_tiles(self) -> None:
+        """Leave tile mode, the next data fills the whole texture."""
+        if self._tiled_shape is None:
+            return
+        self._tiled_shape = None
+        self._tile_vertices = None
+        self._tile_slots.clear()
+        self._atlas_grid = (0, 0)
+        self._use_method(self._untiled_method)
+        # Force the vertices of the whole image to be rebuilt.
+        self._data = None
+
+    def _use_method(self, method: str) -> None:
+        self._method = method
+        self._need_vertex_update = True
+        for view in self._vshare.views:
+            view._need_method_update = True
+
+    def _build_vertex_data(self) -> None:
+        if self._tile_vertices is None:
+            super()._build_vertex_data()
+            return
+        positions, texcoords = self._tile_vertices
+        self._subdiv_position.set_data(positions)
+        self._subdiv_texcoord.set_data(texcoords)
+        self._need_vertex_update = False
+
     def _compute_bounds(self, axis, view):
         if self._data is None:
             return None
@@ -12,3 +198,33 @@ class Image(TextureMixin, BaseImage):
             return (0, 0)
 
         return (0, self.size[axis])
+
+
+def _atlas_grid(
+    count: int, tile_shape: tuple[int, int], max_size: int | None
+) -> tuple[int, int] | None:
+    """Rows and columns of atlas slots for ``count`` tiles, with room to pan.
+
+    None if the atlas would not fit in a texture of ``max_size``.
+    """
+    side = max(2, math.ceil(math.sqrt(2 * count)))
+    rows = columns = side
+    if max_size is not None:
+        rows = min(rows, max_size // tile_shape[0])
+        columns = min(columns, max_size // tile_shape[1])
+        if rows * columns < count:
+            rows = max_size // tile_shape[0]
+            columns = max_size // tile_shape[1]
+    if rows * columns < count:
+        return None
+    return rows, columns
+
+
+def _quad(start: Sequence[int], shape: Sequence[int]) -> np.ndarray:
+    """Two triangles covering a (row, column) region, in (x, y) order."""
+    y0, x0 = start
+    y1, x1 = y0 + shape[0], x0 + shape[1]
+    return np.array(
+        [[x0, y0], [x1, y0], [x1, y1], [x0, y0], [x1, y1], [x0, y1]],
+        dtype=np.float32,
+    )
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from minapari._vispy.utils.gl import texture_upload_stats
 
 if TYPE_CHECKING:
     from vispy.visuals.visual import Visual
@@ -14,7 +16,8 @@ class TextureMixin(Visual):
     We need to refer back to the texture format, but VisPy
     stores it in a private attribute — ``node._texture.internalformat``.
     This mixin is added to our Node subclasses to avoid having to
-    access private VisPy attributes.
+    access private VisPy attributes. It also counts the bytes set as
+    texture data in ``texture_upload_stats``.
     """
 
     def __init__(self, *args, texture_format: str | None, **kwargs) -> None:  # type: ignore [no-untyped-def]
@@ -28,3 +31,7 @@ class TextureMixin(Visual):
     @property
     def texture_format(self) -> str | None:
         return self._texture_format
+
+    def set_data(self, data: Any, *args: Any, **kwargs: Any) -> None:
+        super().set_data(data, *args, **kwargs)  # type: ignore [misc]
+        texture_upload_stats.add_upload(getattr(data, 'nbytes', 0))
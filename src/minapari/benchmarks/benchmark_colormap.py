@@ -0,0 +1,31 @@
+"""Benchmarks of mapping values to colors with colormaps."""
+
+from minapari.utils.colormaps import ensure_colormap
+
+from .utils import random_data, run_benchmark
+
+
+class ColormapSuite:
+    """Map 2D arrays of values with colormaps of a few interpolation
+    modes."""
+
+    params = [
+        ['gray', 'viridis', 'twilight_shifted'],
+        [(512, 512), (2048, 2048)],
+        ['float32', 'uint8'],
+    ]
+    param_names = ['colormap', 'shape', 'dtype']
+
+    def setup(self, colormap, shape, dtype):
+        self.colormap = ensure_colormap(colormap)
+        self.values = random_data(shape, dtype)
+        # build the lookup tables outside of the timings
+        self.colormap.map(self.values[:1, :1])
+
+    def time_map(self, colormap, shape, dtype):
+        """Time to map the values to colors."""
+        self.colormap.map(self.values)
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,30 @@
+"""Benchmarks of estimating the range of values of image data."""
+
+from minapari.layers.utils.layer_utils import calc_data_range
+
+from .utils import random_data, run_benchmark
+
+
+class CalcDataRangeSuite:
+    """Range of 2D and 3D data of several dtypes."""
+
+    params = [
+        [(512, 512), (4096, 4096), (64, 512, 512)],
+        ['uint8', 'uint16', 'float32', 'float64'],
+    ]
+    param_names = ['shape', 'dtype']
+
+    def setup(self, shape, dtype):
+        self.data = random_data(shape, dtype)
+
+    def time_calc_data_range(self, shape, dtype):
+        """Time to estimate the range of the data."""
+        calc_data_range(self.data)
+
+    def peakmem_calc_data_range(self, shape, dtype):
+        """Peak memory used to estimate the range of the data."""
+        calc_data_range(self.data)
+
+
+if __name__ == '__main__':
+    run_benchmark()
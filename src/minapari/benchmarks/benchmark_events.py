@@ -0,0 +1,68 @@
+"""Benchmarks of emitting events to many callbacks."""
+
+from minapari.utils.events import EmitterGroup, Event, EventEmitter
+
+from .utils import run_benchmark
+
+
+class _Listener:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def on_event(self, event) -> None:
+        self.count += 1
+
+
+class EventEmitterSuite:
+    """Emit an event connected to a number of callbacks."""
+
+    params = [[1, 10, 100, 1000], ['function', 'method']]
+    param_names = ['n_callbacks', 'kind']
+
+    def setup(self, n_callbacks, kind):
+        self.emitter = EventEmitter(source=self, type_name='changed')
+        self.listeners = [_Listener() for _ in range(n_callbacks)]
+        for listener in self.listeners:
+            if kind == 'function':
+                self.emitter.connect(lambda event: None)
+            else:
+                self.emitter.connect(listener.on_event)
+
+    def time_emit(self, n_callbacks, kind):
+        """Time to emit an event to all the callbacks."""
+        self.emitter(value=1)
+
+    def time_emit_blocked(self, n_callbacks, kind):
+        """Time to emit an event while the emitter is blocked."""
+        with self.emitter.blocker():
+            self.emitter(value=1)
+
+
+class EmitterGroupSuite:
+    """Emit the events of a group connected to one callback."""
+
+    params = [1, 10, 100]
+    param_names = ['n_events']
+
+    def setup(self, n_events):
+        names = {f'event_{i}': Event for i in range(n_events)}
+        self.group = EmitterGroup(source=self, **names)
+        self.listener = _Listener()
+        self.group.connect(self.listener.on_event)
+        self.emitters = [getattr(self.group, name) for name in names]
+
+    def time_emit_all(self, n_events):
+        """Time to emit every event of the group once."""
+        for emitter in self.emitters:
+            emitter(value=1)
+
+    def time_emit_all_batched(self, n_events):
+        """Time to emit every event of the group twice in a batch."""
+        with self.group.batch():
+            for emitter in self.emitters:
+                emitter(value=1)
+                emitter(value=2)
+
+
+if __name__ == '__main__':
+    run_benchmark()
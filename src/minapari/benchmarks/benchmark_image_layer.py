@@ -0,0 +1,36 @@
+"""Benchmarks of the image layer thumbnail."""
+
+import numpy as np
+
+from minapari.layers import Image
+
+from .utils import random_data, run_benchmark
+
+
+class ImageThumbnailSuite:
+    """Render the thumbnail of 2D images of several sizes and dtypes."""
+
+    params = [[256, 2048, 8192], ['uint8', 'uint16', 'float32']]
+    param_names = ['size', 'dtype']
+
+    def setup(self, size, dtype):
+        self.layer = Image(random_data((size, size), dtype))
+        self.limits = [
+            tuple(self.layer.contrast_limits),
+            tuple(np.multiply(self.layer.contrast_limits, 0.5)),
+        ]
+
+    def time_update_thumbnail(self, size, dtype):
+        """Time to update the thumbnail and render it."""
+        self.layer._update_thumbnail()
+        self.layer.thumbnail  # noqa: B018
+
+    def time_contrast_limits_thumbnail(self, size, dtype):
+        """Time to change the contrast limits and render the thumbnail."""
+        self.limits.reverse()
+        self.layer.contrast_limits = self.limits[0]
+        self.layer.thumbnail  # noqa: B018
+
+
+if __name__ == '__main__':
+    run_benchmark()
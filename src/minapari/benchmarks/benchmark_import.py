@@ -0,0 +1,161 @@
+"""Benchmarks and budget of the import time of minapari.
+
+The ``timeraw_`` benchmarks are run by asv in a fresh interpreter each time.
+Running this module as a script instead checks the headless import of the
+layers against a time budget, and that it does not import the GUI, for use
+in CI::
+
+    python -m minapari.benchmarks.benchmark_import --budget 1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+# What batch scripts that never show a viewer import. minapari.utils.color
+# comes first, to check that it can be imported before the colormaps.
+HEADLESS_IMPORT = (
+    'import minapari.utils.color\n'
+    'from minapari.layers import Image\n'
+    'from minapari.layers.utils.layer_utils import calc_data_range'
+)
+
+#: Import time budget of HEADLESS_IMPORT, in seconds.
+IMPORT_BUDGET = 1.0
+
+#: Modules that HEADLESS_IMPORT must not import. dask is not listed since
+#: pint imports it when it is installed.
+FORBIDDEN_MODULES = (
+    'qtpy',
+    'PyQt5',
+    'PyQt6',
+    'PySide2',
+    'PySide6',
+    'pandas',
+    'vispy.app',
+    'vispy.scene',
+    'minapari._qt',
+    'minapari._vispy',
+    'minapari.viewer',
+)
+
+
+class ImportSuite:
+    """Import time of minapari and its headless parts."""
+
+    def timeraw_import_minapari(self):
+        """Time to import the top level package."""
+        return 'import minapari'
+
+    def timeraw_import_layers(self):
+        """Time to import the layers package."""
+        return 'import minapari.layers'
+
+    def timeraw_import_color(self):
+        """Time to import the color utilities on their own."""
+        return 'import minapari.utils.color'
+
+    def timeraw_import_headless(self):
+        """Time to import what headless batch scripts use."""
+        return HEADLESS_IMPORT
+
+
+def import_time(statement: str) -> tuple[float, dict[str, float]]:
+    """Measure an import in a fresh interpreter with ``-X importtime``.
+
+    Parameters
+    ----------
+    statement : str
+        Python code doing the imports.
+
+    Returns
+    -------
+    total : float
+        Time spent importing, in seconds.
+    modules : dict of str to float
+        Cumulative import time of each imported module, in seconds.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    total = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:') :].split('|')
+        seconds = int(cumulative) / 1e6
+        modules[name.strip()] = seconds
+        # Only the top level imports are not indented.
+        if name.startswith(' ') and not name.startswith('  '):
+            total += seconds
+    return total, modules
+
+
+def check_import_budget(
+    statement: str = HEADLESS_IMPORT,
+    budget: float = IMPORT_BUDGET,
+    forbidden: tuple[str, ...] = FORBIDDEN_MODULES,
+) -> list[str]:
+    """Check the import time and the modules imported by a statement.
+
+    Parameters
+    ----------
+    statement : str
+        Python code doing the imports.
+    budget : float
+        Maximum import time, in seconds.
+    forbidden : tuple of str
+        Modules, with their submodules, that must not be imported.
+
+    Returns
+    -------
+    list of str
+        Description of each problem found, empty if the import is within
+        the budget. A failing import is reported as a problem.
+    """
+    try:
+        total, modules = import_time(statement)
+    except subprocess.CalledProcessError as e:
+        lines = e.stderr.strip().splitlines() or [f'exit code {e.returncode}']
+        return [f'import failed: {lines[-1]}']
+    problems = []
+    if total > budget:
+        slowest = sorted(modules.items(), key=lambda item: -item[1])[:10]
+        problems.append(
+            f'import took {total:.3f}s, over the budget of {budget:.3f}s. '
+            'Slowest modules (cumulative): '
+            + ', '.join(f'{name} {seconds:.3f}s' for name, seconds in slowest)
+        )
+    for name in sorted(modules):
+        if any(
+            name == module or name.startswith(module + '.')
+            for module in forbidden
+        ):
+            problems.append(f'{name} was imported')
+    return problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Check the headless import against the budget, return an exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--budget',
+        type=float,
+        default=IMPORT_BUDGET,
+        help='Import time budget in seconds',
+    )
+    args = parser.parse_args(argv)
+    problems = check_import_budget(budget=args.budget)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""Benchmarks of slicing image layers with the layer slicer."""
+
+import os
+import tempfile
+
+import dask.array as da
+import numpy as np
+
+from minapari.components import Dims
+from minapari.components._layer_slicer import _LayerSlicer
+from minapari.layers import Image
+from minapari.utils import resize_slice_cache
+
+from .utils import random_data, run_benchmark
+
+
+class LayerSlicerSuite:
+    """Slice the planes of a (16, 1024, 1024) image, one per call."""
+
+    params = [['numpy', 'dask', 'memmap'], [False, True]]
+    param_names = ['backend', 'async_']
+    timeout = 120
+
+    def setup(self, backend, async_):
+        shape = (16, 1024, 1024)
+        data = random_data(shape, 'uint16')
+        self._tempdir = None
+        if backend == 'dask':
+            data = da.from_array(data, chunks=(1, 256, 256))
+        elif backend == 'memmap':
+            self._tempdir = tempfile.TemporaryDirectory()
+            path = os.path.join(self._tempdir.name, 'data.npy')
+            np.save(path, data)
+            data = np.load(path, mmap_mode='r')
+        self.layer = Image(data)
+        self.dims = Dims(ndim=3)
+        self.dims.set_range(0, (0, shape[0] - 1, 1))
+        self.slicer = _LayerSlicer()
+        self.slicer._force_sync = not async_
+        self._cache_bytes = resize_slice_cache().max_bytes
+        # Every call must slice the data instead of hitting the cache.
+        resize_slice_cache(0)
+        self._index = 0
+
+    def teardown(self, backend, async_):
+        self.slicer.shutdown()
+        resize_slice_cache(self._cache_bytes)
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+
+    def time_submit(self, backend, async_):
+        """Time to slice the next plane of the image."""
+        self._index = (self._index + 1) % self.layer.data.shape[0]
+        self.dims.set_point(0, self._index)
+        future = self.slicer.submit(layers=[self.layer], dims=self.dims)
+        if future is not None:
+            future.result()
+
+
+if __name__ == '__main__':
+    run_benchmark()
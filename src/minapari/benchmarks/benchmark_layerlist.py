@@ -0,0 +1,45 @@
+"""Benchmarks of the extent of layer lists with many layers."""
+
+import numpy as np
+
+from minapari.components import LayerList
+from minapari.layers import Image
+
+from .utils import run_benchmark
+
+
+class LayerListExtentSuite:
+    """Extent of a list of translated 3D image layers."""
+
+    params = [10, 100, 500]
+    param_names = ['n_layers']
+    timeout = 120
+
+    def setup(self, n_layers):
+        rng = np.random.default_rng(0)
+        data = np.zeros((8, 64, 64), dtype=np.uint8)
+        self.layers = LayerList(
+            [
+                Image(data, translate=rng.random(3) * 100, scale=(2, 1, 1))
+                for _ in range(n_layers)
+            ]
+        )
+
+    def time_extent(self, n_layers):
+        """Time to compute the extent after it was invalidated."""
+        self.layers._clean_cache()
+        self.layers.extent  # noqa: B018
+
+    def time_extent_cached(self, n_layers):
+        """Time to get the extent when no layer changed."""
+        self.layers.extent  # noqa: B018
+
+    def time_translate_layer(self, n_layers):
+        """Time to move a layer and get the new extent."""
+        layer = self.layers[0]
+        layer.translate = -np.asarray(layer.translate)
+        self.layers.extent  # noqa: B018
+
+
+if __name__ == '__main__':
+    run_benchmark()
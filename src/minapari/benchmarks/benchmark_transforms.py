@@ -0,0 +1,68 @@
+"""Benchmarks of composing and applying layer transforms."""
+
+import numpy as np
+
+from minapari.utils.transforms import Affine, ScaleTranslate, TransformChain
+
+from .utils import run_benchmark
+
+
+def _transforms(ndim):
+    rng = np.random.default_rng(0)
+    return [
+        ScaleTranslate(rng.random(ndim) + 0.5, rng.random(ndim) * 10),
+        Affine(scale=rng.random(ndim) + 0.5, translate=rng.random(ndim)),
+        Affine(
+            scale=np.ones(ndim),
+            rotate=np.eye(ndim),
+            shear=np.zeros(ndim * (ndim - 1) // 2),
+            translate=np.zeros(ndim),
+        ),
+        Affine(affine_matrix=np.eye(ndim + 1)),
+    ]
+
+
+class TransformChainSuite:
+    """Simplify the chain of transforms of a layer."""
+
+    params = [2, 3, 5]
+    param_names = ['ndim']
+
+    def setup(self, ndim):
+        self.transforms = _transforms(ndim)
+        self.chain = TransformChain(self.transforms)
+        self.chain.simplified  # noqa: B018
+
+    def time_simplified(self, ndim):
+        """Time to compose a new chain of transforms."""
+        TransformChain(self.transforms).simplified  # noqa: B018
+
+    def time_simplified_cached(self, ndim):
+        """Time to get the composite of a chain that did not change."""
+        self.chain.simplified  # noqa: B018
+
+
+class AffineSuite:
+    """Map coordinates with an affine transform."""
+
+    params = [[2, 3, 5], [1, 1000, 1_000_000]]
+    param_names = ['ndim', 'n_coords']
+
+    def setup(self, ndim, n_coords):
+        rng = np.random.default_rng(0)
+        self.transform = TransformChain(_transforms(ndim)).simplified
+        self.coords = rng.random((n_coords, ndim)) * 100
+        if n_coords == 1:
+            self.coords = self.coords[0]
+
+    def time_call(self, ndim, n_coords):
+        """Time to map the coordinates."""
+        self.transform(self.coords)
+
+    def time_inverse_call(self, ndim, n_coords):
+        """Time to invert the transform and map the coordinates."""
+        self.transform.inverse(self.coords)
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,142 @@
+"""Helpers shared by the benchmarks.
+
+The benchmarks follow the conventions of `asv <https://asv.readthedocs.io>`_
+and are normally run with ``asv run`` from the root of the repository,
+which stores comparable JSON results in ``.asv/results``. Each benchmark
+module can also be run directly, for a quick check without asv::
+
+    python -m minapari.benchmarks.benchmark_colormap --json colormap.json
+    python -m minapari.benchmarks.benchmark_events EventEmitterSuite.time_emit
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import itertools
+import json
+import subprocess
+import sys
+import timeit
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+
+def _param_sets(cls: type) -> Iterator[tuple[Any, ...]]:
+    params = getattr(cls, 'params', None)
+    if params is None:
+        yield ()
+        return
+    if not params or not isinstance(params[0], list | tuple):
+        params = [params]
+    yield from itertools.product(*params)
+
+
+def _time(method, args: tuple, repeat: int) -> float:
+    """Best time of a call, in seconds, like asv reports the minimum."""
+    timer = timeit.Timer(lambda: method(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _time_raw(code: str, repeat: int) -> float:
+    """Best time of running code in a fresh interpreter, like asv timeraw."""
+    timer = timeit.Timer(
+        lambda: subprocess.run([sys.executable, '-c', code], check=True)
+    )
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def run_benchmark(argv: list[str] | None = None) -> dict[str, float]:
+    """Run the benchmarks of the calling module without asv.
+
+    Every ``time_*`` method of every benchmark class of the module is run for
+    each combination of the class parameters, calling ``setup`` and
+    ``teardown`` around them like asv does. The code returned by
+    ``timeraw_*`` methods is timed in a fresh interpreter.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command line arguments, by default those of the process.
+
+    Returns
+    -------
+    dict of str to float
+        Best time of each benchmark, in seconds, by benchmark name.
+    """
+    parser = argparse.ArgumentParser(description='Run benchmarks')
+    parser.add_argument(
+        'benchmark',
+        nargs='?',
+        default='',
+        help='Class or class.method of the benchmarks to run, all by default',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='Number of timed repeats'
+    )
+    parser.add_argument('--json', help='File to write the results to')
+    args = parser.parse_args(argv)
+    selected_class, _, selected_method = args.benchmark.partition('.')
+
+    frame = inspect.currentframe()
+    assert frame is not None
+    assert frame.f_back is not None
+    namespace = frame.f_back.f_globals
+
+    results = {}
+    for cls in list(namespace.values()):
+        if not inspect.isclass(cls) or cls.__module__ != namespace['__name__']:
+            continue
+        if selected_class and cls.__name__ != selected_class:
+            continue
+        methods = [
+            name
+            for name in dir(cls)
+            if name.startswith(('time_', 'timeraw_'))
+            and (not selected_method or name == selected_method)
+        ]
+        for params in _param_sets(cls):
+            for name in methods:
+                instance = cls()
+                if hasattr(instance, 'setup'):
+                    instance.setup(*params)
+                try:
+                    method = getattr(instance, name)
+                    if name.startswith('timeraw_'):
+                        code = method(*params)
+                        seconds = _time_raw(code, args.repeat)
+                    else:
+                        seconds = _time(method, params, args.repeat)
+                finally:
+                    if hasattr(instance, 'teardown'):
+                        instance.teardown(*params)
+                label = f'{cls.__name__}.{name}'
+                if params:
+                    label += f'({", ".join(map(repr, params))})'
+                results[label] = seconds
+                print(f'{label:<72} {_format_time(seconds)}')
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+    return results
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:8.3f} {unit}'
+    return f'{seconds / 1e-9:8.3f} ns'
+
+
+def random_data(shape: tuple[int, ...], dtype: str, seed: int = 0):
+    """Random data of a shape and dtype, spanning a good part of its range."""
+    rng = np.random.default_rng(seed)
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'f':
+        return rng.random(shape, dtype=dtype)
+    info = np.iinfo(dtype)
+    return rng.integers(info.min, info.max, shape, dtype=dtype, endpoint=True)
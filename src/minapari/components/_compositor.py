@@ -0,0 +1,431 @@
+"""Render the 2D view of a viewer on the CPU, without an OpenGL context.
+
+Each visible image layer is sliced at the current dims point, resampled with
+nearest neighbour interpolation onto the canvas pixels, mapped through its
+contrast limits, gamma and colormap, and blended over the layers below it
+with the same equations as the OpenGL blending modes of ``Blending``. The
+canvas is split in bands of rows that are rendered in parallel threads.
+
+Only image layers are drawn; other layers and overlays are ignored.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from minapari.layers import Image
+from minapari.layers.base._base_constants import Blending
+from minapari.utils.colormaps.standardize_color import transform_color
+from minapari.utils.theme import get_theme
+from minapari.utils.translations import trans
+
+if TYPE_CHECKING:
+    from minapari.components.viewer_model import ViewerModel
+
+#: Number of canvas rows rendered by each thread task.
+DEFAULT_TILE_ROWS = 256
+#: Number of bins between the contrast limits of the lookup tables of float
+#: and large integer data.
+LOOKUP_TABLE_BINS = 4096
+
+
+@dataclass(frozen=True)
+class _LayerPlane:
+    """Sliced plane of a layer and its mapping from canvas pixels.
+
+    Attributes
+    ----------
+    layer : Image
+        The layer.
+    plane : np.ndarray
+        Sliced data along the displayed axes, in (row, column) display order,
+        cropped to the part covered by the canvas, with a trailing channel
+        axis for RGB images.
+    origin : np.ndarray
+        Data coordinates of the first element of ``plane``.
+    matrix : np.ndarray
+        (2, 3) affine matrix mapping homogeneous canvas pixel centers
+        (row, column, 1) to data coordinates of the displayed axes.
+    lut : np.ndarray, optional
+        Lookup table of the colors of the values, see `_lookup_table`.
+    """
+
+    layer: Image
+    plane: np.ndarray
+    origin: np.ndarray
+    matrix: np.ndarray
+    lut: np.ndarray | None
+
+    @property
+    def separable(self) -> bool:
+        """Whether data rows only depend on canvas rows, and columns on
+        canvas columns."""
+        return self.matrix[0, 1] == 0 and self.matrix[1, 0] == 0
+
+
+def _canvas_to_world(
+    viewer: ViewerModel, shape: tuple[int, int], zoom: float
+) -> np.ndarray:
+    """(2, 3) affine matrix from canvas pixel centers to displayed world
+    coordinates, as set up by the 2D camera."""
+    camera = viewer.camera
+    center = np.asarray(camera.center[-2:], dtype=float)
+    vertical, horizontal = camera.orientation2d
+    signs = np.array(
+        [1 if vertical == 'down' else -1, 1 if horizontal == 'right' else -1]
+    )
+    scale = signs / zoom
+    matrix = np.zeros((2, 3))
+    matrix[[0, 1], [0, 1]] = scale
+    matrix[:, 2] = center + scale * (0.5 - np.asarray(shape) / 2)
+    return matrix
+
+
+def _choose_level(layer: Image, pixel_size: float) -> int:
+    """Coarsest level whose pixels are not larger than the canvas pixels."""
+    if not layer.multiscale:
+        return 0
+    factors = np.asarray(layer.downsample_factors, dtype=float)
+    displayed = layer._slice_input.displayed
+    sizes = factors[:, displayed].max(axis=1)
+    fine_enough = np.flatnonzero(sizes <= max(pixel_size, 1))
+    return int(fine_enough[-1]) if len(fine_enough) else 0
+
+
+def _slice_layer(
+    viewer: ViewerModel,
+    layer: Image,
+    canvas_to_world: np.ndarray,
+    shape: tuple[int, int],
+) -> _LayerPlane | None:
+    """Slice a layer at the dims point and crop it to the canvas.
+
+    Returns None if the layer does not intersect the slice or the canvas.
+    """
+    ndim = layer.ndim
+    displayed = layer._slice_input.displayed
+    if len(displayed) != 2:
+        return None
+    world_displayed = [viewer.dims.ndim - ndim + d for d in displayed]
+    if world_displayed != list(viewer.dims.displayed):
+        return None
+
+    world_to_data = layer._data_to_world.inverse
+    linear = world_to_data.linear_matrix[:, displayed]
+    world_point = np.asarray(viewer.dims.point, dtype=float)
+    # Data coordinates at the dims point, and their change along the
+    # displayed world axes.
+    point = world_to_data(world_point[-ndim:])
+    pixel_to_data = np.empty((ndim, 3))
+    pixel_to_data[:, :2] = linear @ canvas_to_world[:, :2]
+    pixel_to_data[:, 2] = point + linear @ (
+        canvas_to_world[:, 2] - world_point[world_displayed]
+    )
+    # Size of a canvas pixel in level 0 data pixels.
+    pixel_size = float(np.abs(pixel_to_data[displayed, :2]).sum(1).max())
+
+    level = _choose_level(layer, pixel_size)
+    if layer.multiscale:
+        data = layer.data[level]
+        factors = np.asarray(layer.downsample_factors[level], dtype=float)
+        pixel_to_data /= factors[:, np.newaxis]
+        point = point / factors
+    else:
+        data = layer.data
+    data_shape = np.asarray(data.shape[:ndim])
+
+    key: list[int | slice] = []
+    for axis in range(ndim):
+        index = int(np.floor(point[axis] + 0.5))
+        if axis not in displayed and not 0 <= index < data_shape[axis]:
+            return None
+        key.append(index)
+
+    # Bounding box of the data covered by the canvas.
+    height, width = shape
+    corners = np.array(
+        [
+            [0, 0, 1],
+            [height - 1, 0, 1],
+            [0, width - 1, 1],
+            [height - 1, width - 1, 1],
+        ],
+        dtype=float,
+    )
+    matrix = pixel_to_data[displayed]
+    coords = np.floor(corners @ matrix.T + 0.5)
+    size = data_shape[displayed]
+    start = np.clip(coords.min(axis=0), 0, size).astype(int)
+    stop = np.clip(coords.max(axis=0) + 1, 0, size).astype(int)
+    if np.any(stop <= start):
+        return None
+    for axis, lo, hi in zip(displayed, start, stop, strict=True):
+        key[axis] = slice(lo, hi)
+
+    plane = np.asarray(data[tuple(key)])
+    if displayed[0] > displayed[1]:
+        plane = np.swapaxes(plane, 0, 1)
+    lut = _lookup_table(layer, plane.dtype)
+    return _LayerPlane(layer, plane, start.astype(float), matrix, lut)
+
+
+def _sample(layer_plane: _LayerPlane, rows: slice, width: int):
+    """Nearest neighbour samples of a layer for a band of canvas rows.
+
+    Returns
+    -------
+    values : np.ndarray
+        Sampled values, of shape (rows, width) plus a channel axis for RGB.
+    inside : np.ndarray
+        Boolean mask of the canvas pixels covered by the layer.
+    """
+    plane = layer_plane.plane
+    matrix = layer_plane.matrix
+    size = np.asarray(plane.shape[:2])
+    r = np.arange(rows.start, rows.stop, dtype=float)
+    c = np.arange(width, dtype=float)
+    if layer_plane.separable:
+        i = np.floor(matrix[0, 0] * r + matrix[0, 2] + 0.5)
+        j = np.floor(matrix[1, 1] * c + matrix[1, 2] + 0.5)
+        i -= layer_plane.origin[0]
+        j -= layer_plane.origin[1]
+        i_inside = (i >= 0) & (i < size[0])
+        j_inside = (j >= 0) & (j < size[1])
+        i = np.clip(i, 0, size[0] - 1).astype(np.intp)
+        j = np.clip(j, 0, size[1] - 1).astype(np.intp)
+        values = plane[np.ix_(i, j)]
+        inside = np.outer(i_inside, j_inside)
+        return values, inside
+    rr, cc = np.meshgrid(r, c, indexing='ij')
+    i = np.floor(matrix[0, 0] * rr + matrix[0, 1] * cc + matrix[0, 2] + 0.5)
+    j = np.floor(matrix[1, 0] * rr + matrix[1, 1] * cc + matrix[1, 2] + 0.5)
+    i -= layer_plane.origin[0]
+    j -= layer_plane.origin[1]
+    inside = (i >= 0) & (i < size[0]) & (j >= 0) & (j < size[1])
+    i = np.clip(i, 0, size[0] - 1).astype(np.intp)
+    j = np.clip(j, 0, size[1] - 1).astype(np.intp)
+    return plane[i, j], inside
+
+
+def _normalize(values: np.ndarray, layer: Image) -> np.ndarray:
+    """Apply the contrast limits and gamma of a layer, as the shaders do."""
+    low, high = layer.contrast_limits
+    scale = 1 / (high - low) if high != low else 1.0
+    normalized = values.astype(np.float32) - np.float32(low)
+    normalized *= np.float32(scale)
+    np.clip(normalized, 0, 1, out=normalized)
+    if layer.gamma != 1:
+        np.power(normalized, np.float32(layer.gamma), out=normalized)
+    return normalized
+
+
+def _lookup_table(layer: Image, dtype: np.dtype) -> np.ndarray | None:
+    """Colors of a layer for the values of its data, with its opacity.
+
+    The table has shape (4, N). Integer values of at most 16 bits index it
+    through their unsigned view. Other values index it after being binned
+    between the contrast limits in ``LOOKUP_TABLE_BINS`` bins, followed by
+    the color of NaN. None for RGB images.
+    """
+    if layer.rgb:
+        return None
+    if dtype.kind in 'biu' and dtype.itemsize <= 2:
+        values = np.arange(2 ** (8 * dtype.itemsize))
+        if dtype.kind == 'i':
+            values = values.astype(f'u{dtype.itemsize}').view(dtype)
+    else:
+        low, high = layer.contrast_limits
+        values = np.append(
+            np.linspace(low, high, LOOKUP_TABLE_BINS), np.nan
+        )
+    colors = layer.colormap.map(_normalize(values, layer))
+    colors[:, 3] *= layer.opacity
+    return np.ascontiguousarray(colors.T, dtype=np.float32)
+
+
+def _lookup_indices(values: np.ndarray, layer: Image) -> np.ndarray:
+    """Indices of values in the lookup table of a layer."""
+    if values.dtype.kind in 'biu' and values.dtype.itemsize <= 2:
+        return values.view(f'u{values.dtype.itemsize}')
+    low, high = layer.contrast_limits
+    scale = (LOOKUP_TABLE_BINS - 1) / (high - low) if high != low else 0.0
+    scaled = values.astype(np.float32) - np.float32(low)
+    scaled *= np.float32(scale)
+    scaled += np.float32(0.5)
+    np.clip(scaled, 0, LOOKUP_TABLE_BINS - 1, out=scaled)
+    with np.errstate(invalid='ignore'):
+        indices = scaled.astype(np.intp)
+    if values.dtype.kind == 'f':
+        indices[np.isnan(values)] = LOOKUP_TABLE_BINS
+    return indices
+
+
+def _colors(values: np.ndarray, layer_plane: _LayerPlane) -> np.ndarray:
+    """Colors of sampled values, as (4, rows, columns) RGBA planes."""
+    layer = layer_plane.layer
+    lut = layer_plane.lut
+    if lut is not None:
+        indices = _lookup_indices(values, layer)
+        colors = np.empty((4, *values.shape), dtype=np.float32)
+        for channel in range(4):
+            np.take(lut[channel], indices, out=colors[channel])
+        return colors
+    normalized = _normalize(values, layer)
+    colors = np.ones((4, *normalized.shape[:2]), dtype=np.float32)
+    channels = min(normalized.shape[-1], 4)
+    colors[:channels] = np.moveaxis(normalized[..., :channels], -1, 0)
+    colors[3] *= np.float32(layer.opacity)
+    return colors
+
+
+def _blend(
+    dst: np.ndarray, src: np.ndarray, inside: np.ndarray, blending: str
+) -> None:
+    """Blend source colors over destination colors in place.
+
+    Colors are (4, rows, columns) RGBA planes. This follows the blend
+    functions and equations of ``minapari._vispy.utils.gl.BLENDING_MODES``,
+    with colors clamped to [0, 1] after each layer like in a normalized
+    framebuffer. Only pixels inside the layer are blended.
+    """
+    covered = inside.all()
+    result = dst if covered else dst.copy()
+    rgb, alpha = result[:3], result[3]
+    src_rgb, src_alpha = src[:3], src[3]
+    if blending == Blending.OPAQUE:
+        result[...] = src
+    elif blending in (Blending.TRANSLUCENT, Blending.TRANSLUCENT_NO_DEPTH):
+        rgb *= 1 - src_alpha
+        src_rgb *= src_alpha
+        rgb += src_rgb
+        alpha += src_alpha
+    elif blending == Blending.ADDITIVE:
+        rgb *= alpha
+        src_rgb *= src_alpha
+        rgb += src_rgb
+        alpha += src_alpha
+        np.minimum(rgb, 1, out=rgb)
+    elif blending == Blending.MINIMUM:
+        np.minimum(result, src, out=result)
+    elif blending == Blending.MULTIPLICATIVE:
+        rgb *= src_rgb
+        alpha += src_alpha
+    else:
+        raise ValueError(
+            trans._(
+                'Unknown blending mode: {blending}',
+                deferred=True,
+                blending=blending,
+            )
+        )
+    np.minimum(alpha, 1, out=alpha)
+    if not covered:
+        np.copyto(dst, result, where=inside)
+
+
+def _render_rows(
+    planes: list[_LayerPlane],
+    out: np.ndarray,
+    rows: slice,
+    background: np.ndarray,
+) -> None:
+    """Render a band of rows of the canvas into ``out``."""
+    band = np.empty((4, rows.stop - rows.start, out.shape[1]), np.float32)
+    band[...] = background[:, np.newaxis, np.newaxis]
+    for layer_plane in planes:
+        values, inside = _sample(layer_plane, rows, out.shape[1])
+        if not inside.any():
+            continue
+        colors = _colors(values, layer_plane)
+        _blend(band, colors, inside, layer_plane.layer.blending)
+    band *= 255
+    band += 0.5
+    out[rows] = np.moveaxis(band, 0, -1)
+
+
+def composite(
+    viewer: ViewerModel,
+    size: tuple[int, int] | None = None,
+    *,
+    bgcolor=None,
+    tile_rows: int = DEFAULT_TILE_ROWS,
+    max_workers: int | None = None,
+) -> np.ndarray:
+    """Render the current 2D view of a viewer on the CPU.
+
+    The visible image layers are drawn from the bottom of the layer list to
+    the top, like on the canvas, using their colormap, contrast limits,
+    gamma, opacity and blending, with nearest neighbour interpolation.
+    Other layers, overlays and grid mode are not rendered.
+
+    Parameters
+    ----------
+    viewer : ViewerModel
+        Viewer to render, using its camera, dims and layers.
+    size : tuple of int, optional
+        Size (height, width) of the rendered image in pixels. The camera zoom
+        is scaled so that the same region is rendered as on a canvas of the
+        viewer canvas size. By default, the viewer canvas size.
+    bgcolor : color, optional
+        Background color. By default, the canvas color of the viewer theme.
+    tile_rows : int
+        Number of rows of each band of the image rendered by a thread.
+    max_workers : int, optional
+        Number of threads. By default, the number of CPUs.
+
+    Returns
+    -------
+    image : array
+        Numpy array of type ubyte and shape (h, w, 4). Index [0, 0] is the
+        upper-left corner of the rendered region.
+    """
+    if viewer.dims.ndisplay != 2:
+        raise NotImplementedError(
+            trans._(
+                'CPU compositing is only implemented for 2D views.',
+                deferred=True,
+            )
+        )
+    canvas_size = np.asarray(viewer._canvas_size, dtype=float)
+    shape = tuple(int(s) for s in (canvas_size if size is None else size))
+    if bgcolor is None:
+        bgcolor = get_theme(viewer.theme).canvas.as_hex()
+    background = transform_color(bgcolor)[0].astype(np.float32)
+
+    # Render the region shown on the canvas, scaled to the requested size.
+    ratio = min(np.asarray(shape, dtype=float) / canvas_size)
+    canvas_to_world = _canvas_to_world(
+        viewer, shape, viewer.camera.zoom * ratio
+    )
+
+    planes = []
+    for layer in viewer.layers:
+        if not (isinstance(layer, Image) and layer.visible):
+            continue
+        layer_plane = _slice_layer(viewer, layer, canvas_to_world, shape)
+        if layer_plane is not None:
+            planes.append(layer_plane)
+
+    out = np.empty((*shape, 4), dtype=np.uint8)
+    bands = [
+        slice(start, min(start + tile_rows, shape[0]))
+        for start in range(0, shape[0], tile_rows)
+    ]
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(bands) == 1:
+        for rows in bands:
+            _render_rows(planes, out, rows, background)
+        return out
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_render_rows, planes, out, rows, background)
+            for rows in bands
+        ]
+        for future in futures:
+            future.result()
+    return out
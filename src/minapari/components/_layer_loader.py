@@ -0,0 +1,156 @@
+"""Builds layers on background threads so that adding them does not block.
+
+Constructing an image layer may read its data: guessing whether it is
+multiscale, inspecting its dtype and estimating its contrast limits. For
+lazy or remote arrays, and for many channels, this can take seconds, which
+would otherwise freeze the GUI.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from minapari.utils.events.event import EmitterGroup, Event
+
+if TYPE_CHECKING:
+    from minapari.layers import Layer
+
+logger = logging.getLogger('minapari.components._layer_loader')
+
+
+class _LayerLoader:
+    """Runs layer constructors on worker threads.
+
+    A placeholder layer stands in the layer list while the layers are built.
+    When they are, the ``ready`` event is emitted, usually from the worker
+    thread, with the placeholder, the built layers (or the error raised
+    while building them) and the future to resolve. Listeners must swap the
+    placeholder for the layers on the main thread (e.g. by decorating the
+    callback with `@ensure_main_thread`).
+
+    Events
+    ------
+    ready
+        Emitted with ``placeholder``, ``layers``, ``error`` and ``future``
+        when the layers of a submitted constructor are built.
+    """
+
+    def __init__(self, max_workers: int = 2) -> None:
+        """
+        Parameters
+        ----------
+        max_workers : int
+            Number of layers built concurrently.
+
+        Attributes
+        ----------
+        _executor : concurrent.futures.ThreadPoolExecutor
+            runs the layer constructors.
+        _tasks : set of futures
+            constructors that are pending or running.
+        _lock_tasks : threading.Lock
+            lock to guard against changes to `_tasks`.
+        """
+        self.events = EmitterGroup(source=self, ready=Event)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='layer_loader'
+        )
+        self._tasks: set[Future] = set()
+        self._lock_tasks = Lock()
+
+    @property
+    def listening(self) -> bool:
+        """True if something swaps the built layers in on the main thread."""
+        return len(self.events.ready.callbacks) > 0
+
+    def submit(
+        self, build: Callable[[], Sequence[Layer]], placeholder: Layer
+    ) -> Future:
+        """Build layers in the background to replace a placeholder.
+
+        This should only be called from the main thread. The constructor
+        runs in a copy of the caller's context, so that the source of the
+        layers is the same as if they were built by the caller.
+
+        Parameters
+        ----------
+        build : callable
+            Returns the layers to add. It must not modify any layer that is
+            in a layer list.
+        placeholder : Layer
+            The layer standing in for the built layers.
+
+        Returns
+        -------
+        future
+            Resolved by the listener of ``ready`` once the built layers have
+            replaced the placeholder, or cancelled if the placeholder was
+            removed in the meantime.
+        """
+        result: Future = Future()
+        task = self._executor.submit(contextvars.copy_context().run, build)
+        logger.debug('Submitted task %s for %s', id(task), placeholder)
+        with self._lock_tasks:
+            self._tasks.add(task)
+        task.add_done_callback(
+            partial(self._on_build_done, placeholder=placeholder, result=result)
+        )
+        return result
+
+    def _on_build_done(
+        self, task: Future, *, placeholder: Layer, result: Future
+    ) -> None:
+        """The "done_callback" of each task, called from the worker."""
+        logger.debug('_LayerLoader._on_build_done: %s', id(task))
+        with self._lock_tasks:
+            self._tasks.discard(task)
+        if task.cancelled() or not self.listening:
+            result.cancel()
+            return
+        error = task.exception()
+        self.events.ready(
+            placeholder=placeholder,
+            layers=() if error is not None else list(task.result()),
+            error=error,
+            future=result,
+        )
+
+    def wait_until_idle(self, timeout: float | None = None) -> None:
+        """Wait for all layers to be built before returning.
+
+        Parameters
+        ----------
+        timeout : float or None
+            Time in seconds to wait before raising TimeoutError. If None,
+            there is no limit to the wait time.
+
+        Raises
+        ------
+        TimeoutError
+            When some layers are still being built after the timeout.
+        """
+        with self._lock_tasks:
+            tasks = list(self._tasks)
+        _, not_done = wait(tasks, timeout=timeout)
+        if not_done:
+            raise TimeoutError(
+                f'Building {len(not_done)} layers did not complete within timeout ({timeout}s).'
+            )
+
+    def shutdown(self) -> None:
+        """Shuts this down, cancelling the layers that are not built yet.
+
+        This waits for running constructors to finish and disconnects any
+        observers from this loader's events, so that their layers are
+        dropped. This should only be called from the main thread.
+        """
+        logger.debug('_LayerLoader.shutdown')
+        self.events.disconnect()
+        self.events.ready.disconnect()
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -5,12 +5,17 @@ See the NAP for more details: https://napari.org/dev/naps/4-async-slicing.html
 
 from __future__ import annotations
 
+import itertools
 import logging
+import math
 import weakref
-from collections.abc import Iterable
-from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from collections import Counter
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import Executor, Future, wait
 from contextlib import contextmanager
-from threading import RLock
+from queue import PriorityQueue
+from threading import Lock, RLock, Thread
+from time import perf_counter_ns
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,9 +23,17 @@ from typing import (
     runtime_checkable,
 )
 
+from minapari.components._slice_prefetcher import _SlicePrefetcher
 from minapari.layers import Layer
 from minapari.settings import get_settings
+from minapari.utils._slice_cache import (
+    _CachedSliceRequest,
+    _CachingSliceRequest,
+    get_slice_cache,
+    slice_cache_key,
+)
 from minapari.utils.events.event import EmitterGroup, Event
+from minapari.utils.perf import PerfEvent, add_counter_event, timers
 
 if TYPE_CHECKING:
     from minapari.components import Dims
@@ -76,12 +89,147 @@ class _AsyncSliceable(Protocol):
         """
 
 
+class _PriorityThreadPoolExecutor(Executor):
+    """Thread pool that runs the pending task with the lowest priority first.
+
+    Tasks with equal priorities run in submission order. This mirrors
+    ``concurrent.futures.ThreadPoolExecutor``, except that ``submit`` takes
+    an extra keyword-only ``priority``.
+
+    Parameters
+    ----------
+    max_workers : int
+        Maximum number of threads running tasks.
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        if max_workers <= 0:
+            raise ValueError('max_workers must be greater than 0')
+        self._max_workers = max_workers
+        self._queue: PriorityQueue = PriorityQueue()
+        self._counter = itertools.count()
+        self._threads: list[Thread] = []
+        self._shutdown = False
+        self._shutdown_lock = Lock()
+
+    def submit(  # type: ignore[override]
+        self,
+        fn: Callable,
+        /,
+        *args: Any,
+        priority: float = 0,
+        **kwargs: Any,
+    ) -> Future:
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError(
+                    'cannot schedule new futures after shutdown'
+                )
+            future: Future = Future()
+            self._queue.put(
+                (priority, next(self._counter), (future, fn, args, kwargs))
+            )
+            if len(self._threads) < self._max_workers:
+                thread = Thread(
+                    target=self._work,
+                    name=f'_LayerSlicer_{len(self._threads)}',
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _work(self) -> None:
+        while True:
+            _, _, item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def shutdown(
+        self, wait: bool = True, *, cancel_futures: bool = False
+    ) -> None:
+        with self._shutdown_lock:
+            self._shutdown = True
+            if cancel_futures:
+                pending = []
+                while not self._queue.empty():
+                    pending.append(self._queue.get_nowait())
+                for _, _, item in pending:
+                    if item is not None:
+                        item[0].cancel()
+            # Sentinels sort after every task, so queued work still runs.
+            for _ in self._threads:
+                self._queue.put((math.inf, next(self._counter), None))
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+def _gather(tasks: list[Future[dict]]) -> Future[dict]:
+    """Combine the tasks of the layers of one submission into one future.
+
+    The result merges the results of the tasks that were not cancelled, or
+    is the first exception raised. The future is cancelled if all tasks
+    were, and cancelling it cancels the tasks that have not started.
+    """
+    combined: Future[dict] = Future()
+    remaining = len(tasks)
+    lock = Lock()
+
+    def on_done(_: Future[dict]) -> None:
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            if remaining > 0:
+                return
+        if combined.cancelled():
+            return
+        if all(task.cancelled() for task in tasks):
+            combined.cancel()
+            return
+        result: dict = {}
+        for task in tasks:
+            if task.cancelled():
+                continue
+            if (error := task.exception()) is not None:
+                combined.set_exception(error)
+                return
+            result.update(task.result())
+        combined.set_result(result)
+
+    def on_cancel(future: Future[dict]) -> None:
+        if future.cancelled():
+            for task in tasks:
+                task.cancel()
+
+    combined.add_done_callback(on_cancel)
+    for task in tasks:
+        task.add_done_callback(on_done)
+    return combined
+
+
 class _LayerSlicer:
     """
     High level class to control the creation of a slice (via a slice request),
     submit it (synchronously or asynchronously) to a thread pool, and emit the
     results when complete.
 
+    Each layer is sliced by its own task, so slow layers do not hold up
+    others and a layer's pending task can be cancelled on its own when a
+    newer request supersedes it. Pending tasks run in priority order:
+    selected layers first, then the other layers, then prefetches of the
+    slices that are expected next while the dims are scrubbed. Only visible
+    layers are sliced asynchronously.
+
     Events
     ------
     ready
@@ -93,11 +241,17 @@ class _LayerSlicer:
         with `@ensure_main_thread`).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: int | None = None) -> None:
         """
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of slicing threads. Defaults to the
+            ``experimental.async_slicing_workers`` setting.
+
         Attributes
         ----------
-        _executor : concurrent.futures.ThreadPoolExecutor
+        _executor : _PriorityThreadPoolExecutor
             manager for the slicing threading
         _force_sync: bool
             if true, forces slicing to execute synchronously
@@ -106,14 +260,34 @@ class _LayerSlicer:
         _lock_layers_to_task : threading.RLock
             lock to guard against changes to `_layers_to_task` when finding,
             adding, or removing tasks.
+        _tasks : set of futures
+            every submitted task that has not finished, including those
+            superseded in `_layers_to_task` by a newer task of their layer.
+        _latest_request_ids : dict of layer weakrefs to int
+            ID of the most recent request of each layer. Responses to older
+            requests are dropped instead of being emitted.
+        _queue_depth : collections.Counter of layer weakrefs to int
+            Number of submitted but unfinished tasks per layer.
+        _prefetcher : _SlicePrefetcher
+            slices ahead of the dims along the axis being scrubbed into the
+            global slice cache.
         """
+        settings = get_settings().experimental
+        if max_workers is None:
+            max_workers = settings.async_slicing_workers
         self.events = EmitterGroup(source=self, ready=Event)
-        self._executor: Executor = ThreadPoolExecutor(max_workers=1)
-        self._force_sync = not get_settings().experimental.async_
+        self._executor: Executor = _PriorityThreadPoolExecutor(
+            max_workers=max_workers
+        )
+        self._force_sync = not settings.async_
         self._layers_to_task: dict[
             tuple[weakref.ReferenceType[Layer], ...], Future
         ] = {}
         self._lock_layers_to_task = RLock()
+        self._tasks: set[Future[dict]] = set()
+        self._latest_request_ids: dict[weakref.ReferenceType[Layer], int] = {}
+        self._queue_depth: Counter[weakref.ReferenceType[Layer]] = Counter()
+        self._prefetcher = _SlicePrefetcher(self._executor)
 
     @contextmanager
     def force_sync(self):
@@ -133,6 +307,22 @@ class _LayerSlicer:
         finally:
             self._force_sync = prev
 
+    @contextmanager
+    def force_async(self):
+        """Context manager to temporarily slice asynchronously.
+
+        This overrides the ``experimental.async_`` setting, e.g. to slice
+        layers that were built in the background without blocking. It should
+        only be used from the main thread, and only when something handles
+        the ``ready`` event.
+        """
+        prev = self._force_sync
+        self._force_sync = False
+        try:
+            yield None
+        finally:
+            self._force_sync = prev
+
     def wait_until_idle(self, timeout: float | None = None) -> None:
         """Wait for all slicing tasks to complete before returning.
 
@@ -147,7 +337,8 @@ class _LayerSlicer:
         TimeoutError: when the timeout limit has been exceeded and the task is
             not yet complete
         """
-        futures = self._layers_to_task.values()
+        with self._lock_layers_to_task:
+            futures = list(self._tasks)
         _, not_done_futures = wait(futures, timeout=timeout)
 
         if len(not_done_futures) > 0:
@@ -161,17 +352,17 @@ class _LayerSlicer:
         layers: Iterable[Layer],
         dims: Dims,
         force: bool = False,
+        selected: Collection[Layer] = (),
     ) -> Future[dict] | None:
         """Slices the given layers with the given dims.
 
-        Submitting multiple layers at one generates multiple requests, but only ONE task.
+        Submitting multiple layers generates one request and one task per
+        layer, and the returned future gathers the results of all of them.
 
         This will attempt to cancel all pending slicing tasks that can be entirely
-        replaced the new ones. If multiple layers are sliced, any task that contains
-        only one of those layers can safely be cancelled. If a single layer is sliced,
-        it will wait for any existing tasks that include that layer AND another layer,
-        In other words, it will only cancel if the new task will replace the
-        slices of all the layers in the pending task.
+        replaced by the new ones. A task that is already running cannot be
+        stopped, but its response is dropped once a newer request for the same
+        layer has been submitted.
 
         This should only be called from the main thread.
 
@@ -184,20 +375,27 @@ class _LayerSlicer:
         force : bool
             True if slicing should be forced to occur, even when some cache thinks
             it already has a valid slice ready. False otherwise.
+        selected : collection of layers
+            Layers that are currently selected, which are sliced first.
 
         Returns
         -------
         future of dict or none
             A future with a result that maps from a layer to an async layer
-            slice response. Or none if no async slicing tasks were submitted.
+            slice response, for all layers sliced asynchronously. Layers
+            whose task was cancelled, or whose response was dropped because
+            a newer request superseded it, are missing from the result. It
+            is cancelled if all tasks were, and cancelling it cancels the
+            pending tasks. Or none if no async slicing tasks were submitted.
         """
+        layers = list(layers)
         logger.debug(
             '_LayerSlicer.submit: layers=%s, dims=%s, force=%s',
             layers,
             dims,
             force,
         )
-        if existing_task := self._find_existing_task(layers):
+        for existing_task in self._find_existing_tasks(layers):
             logger.debug('Cancelling task %s', id(existing_task))
             existing_task.cancel()
 
@@ -221,7 +419,9 @@ class _LayerSlicer:
                 and layer.visible
             ):
                 logger.debug('Making async slice request for %s', layer)
-                request = layer._make_slice_request(dims)
+                request = self._cached_request(
+                    layer, dims, layer._make_slice_request(dims), force
+                )
                 weak_layer = weakref.ref(layer)
                 requests[weak_layer] = request
                 layer._set_unloaded_slice_id(request.id)
@@ -229,16 +429,17 @@ class _LayerSlicer:
                 logger.debug('Sync slicing for %s', layer)
                 sync_layers.append(layer)
 
-        # First maybe submit an async slicing task to start it ASAP.
-        task = None
-        if len(requests) > 0:
-            logger.debug('Submitting task %s', id(task))
-            task = self._executor.submit(self._slice_layers, requests)
-            # Store task before adding done callback to ensure there is always
-            # a task to remove in the done callback.
-            with self._lock_layers_to_task:
-                self._layers_to_task[tuple(requests)] = task
-            task.add_done_callback(self._on_slice_done)
+        # First maybe submit async slicing tasks to start them ASAP.
+        tasks = [
+            self._submit_request(weak_layer, request, priority)
+            for priority, weak_layer, request in sorted(
+                (
+                    (self._priority(weak_layer, selected), weak_layer, request)
+                    for weak_layer, request in requests.items()
+                ),
+                key=lambda item: item[0],
+            )
+        ]
 
         # Then execute sync slicing tasks to run concurrent with async ones.
         for layer in sync_layers:
@@ -247,8 +448,80 @@ class _LayerSlicer:
                 force=force,
             )
 
+        # Finally queue the slices expected next, behind all requested ones.
+        if requests:
+            self._prefetcher.observe(
+                [w() for w in requests if w() is not None], dims
+            )
+
+        return _gather(tasks) if tasks else None
+
+    def _cached_request(
+        self, layer: Layer, dims: Dims, request: _SliceRequest, force: bool
+    ) -> _SliceRequest:
+        """Serve a request from the slice cache, or make it fill the cache.
+
+        Forced requests are always recomputed and replace the cached slice.
+        """
+        if not getattr(layer, '_cache_slices', False):
+            return request
+        key = slice_cache_key(layer, dims)
+        if not force:
+            response = get_slice_cache().get(key)
+            if response is not None:
+                logger.debug('Slice cache hit for %s', layer)
+                return _CachedSliceRequest(request.id, response=response)
+            future = self._prefetcher.running(key)
+            if future is not None:
+                logger.debug('Waiting on running prefetch for %s', layer)
+                return _CachedSliceRequest(request.id, future=future)
+        return _CachingSliceRequest(request, key)
+
+    @staticmethod
+    def _priority(
+        weak_layer: weakref.ReferenceType[Layer], selected: Collection[Layer]
+    ) -> int:
+        """Priority of a layer's task, lower values are sliced first."""
+        return 0 if weak_layer() in selected else 1
+
+    def _submit_request(
+        self,
+        weak_layer: weakref.ReferenceType[Layer],
+        request: _SliceRequest,
+        priority: int,
+    ) -> Future[dict]:
+        """Submits one layer's slice request as its own task."""
+        for dead in [w for w in self._latest_request_ids if w() is None]:
+            del self._latest_request_ids[dead]
+        self._latest_request_ids[weak_layer] = request.id
+        submitted_ns = perf_counter_ns()
+        task = self._executor.submit(
+            self._slice_layers, {weak_layer: request}, priority=priority
+        )
+        logger.debug('Submitted task %s', id(task))
+        # Store task before adding done callback to ensure there is always
+        # a task to remove in the done callback.
+        with self._lock_layers_to_task:
+            self._layers_to_task[(weak_layer,)] = task
+            self._tasks.add(task)
+            self._queue_depth[weak_layer] += 1
+            self._report_queue_depth(weak_layer)
+        task.add_done_callback(
+            lambda t: self._on_slice_done(
+                t, weak_layer=weak_layer, submitted_ns=submitted_ns
+            )
+        )
         return task
 
+    def _report_queue_depth(
+        self, weak_layer: weakref.ReferenceType[Layer]
+    ) -> None:
+        if (layer := weak_layer()) is not None:
+            add_counter_event(
+                'slice_queue_depth',
+                **{layer.name: self._queue_depth[weak_layer]},
+            )
+
     def shutdown(self) -> None:
         """Shuts this down, preventing any new slice tasks from being submitted.
 
@@ -257,6 +530,7 @@ class _LayerSlicer:
         This should only be called from the main thread.
         """
         logger.debug('_LayerSlicer.shutdown')
+        self._prefetcher.clear()
         self._executor.shutdown(wait=True, cancel_futures=True)
         self.events.disconnect()
         self.events.ready.disconnect()
@@ -276,23 +550,65 @@ class _LayerSlicer:
         dict[Layer, SliceResponse]: which contains the results of the slice
         """
         logger.debug('_LayerSlicer._slice_layers: %s', requests)
-        result = {layer: request() for layer, request in requests.items()}
-        self.events.ready(value=result)
+        result = {}
+        for layer, request in requests.items():
+            if self._is_superseded(layer, request):
+                continue
+            response = request()
+            # Drop responses that became stale while the request was running.
+            if not self._is_superseded(layer, request):
+                result[layer] = response
+        if result:
+            self.events.ready(value=result)
         return result
 
-    def _on_slice_done(self, task: Future[dict]) -> None:
+    def _is_superseded(
+        self, weak_layer: weakref.ReferenceType[Layer], request: _SliceRequest
+    ) -> bool:
+        """True if a newer request was submitted for the same layer."""
+        latest_id = self._latest_request_ids.get(weak_layer, request.id)
+        return latest_id != request.id
+
+    def _on_slice_done(
+        self,
+        task: Future[dict],
+        *,
+        weak_layer: weakref.ReferenceType[Layer] | None = None,
+        submitted_ns: int | None = None,
+    ) -> None:
         """
         This is the "done_callback" which is added to each task.
         Can be called from the main or slicing thread.
         """
         logger.debug('_LayerSlicer._on_slice_done: %s', id(task))
+        with self._lock_layers_to_task:
+            self._tasks.discard(task)
         if not self._try_to_remove_task(task):
             logger.debug('Task not found: %s', id(task))
 
+        if weak_layer is not None:
+            with self._lock_layers_to_task:
+                self._queue_depth[weak_layer] -= 1
+                self._report_queue_depth(weak_layer)
+                if self._queue_depth[weak_layer] <= 0:
+                    del self._queue_depth[weak_layer]
+
         if task.cancelled():
             logger.debug('Cancelled task: %s', id(task))
             return
 
+        if submitted_ns is not None and not task.exception():
+            for weak_layer in task.result():
+                if (layer := weak_layer()) is not None:
+                    timers.add_event(
+                        PerfEvent(
+                            f'slice_latency:{layer.name}',
+                            submitted_ns,
+                            perf_counter_ns(),
+                            category='slicing',
+                        )
+                    )
+
     def _try_to_remove_task(self, task: Future[dict]) -> bool:
         """
         Attempt to remove task, return false if task not found, return true
@@ -308,21 +624,22 @@ class _LayerSlicer:
                     return True
         return False
 
-    def _find_existing_task(
+    def _find_existing_tasks(
         self, layers: Iterable[Layer]
-    ) -> Future[dict] | None:
-        """Find the task associated with a list of layers. Returns the first
-        task found for which the layers of the task are a subset of the input
+    ) -> list[Future[dict]]:
+        """Find the tasks associated with a list of layers. Returns all
+        tasks for which the layers of the task are a subset of the input
         layers.
 
         This function provides a lock to ensure that the layers_to_task dict
         is unmodified during this process.
         """
+        tasks = []
         with self._lock_layers_to_task:
             layer_set = set(layers)
             for weak_task_layers, task in self._layers_to_task.items():
                 task_layers = {w() for w in weak_task_layers} - {None}
                 if task_layers.issubset(layer_set):
                     logger.debug('Found existing task for %s', task_layers)
-                    return task
-        return None
+                    tasks.append(task)
+        return tasks
@@ -0,0 +1,163 @@
+"""Predictive prefetching of slices while scrubbing or playing dims.
+
+The prefetcher sits beside the ``_LayerSlicer``. It watches how the dims
+step changes between slice submissions and, while a single non-displayed
+axis is moving, slices the next few steps along that axis ahead of time on
+the slicer's thread pool. Responses are stored in the global slice cache,
+so that when the dims actually reach a prefetched step, the slice response
+is ready without touching the layer data again.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Hashable, Iterable
+from concurrent.futures import Future
+from threading import RLock
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from minapari.utils._slice_cache import (
+    _CachingSliceRequest,
+    get_slice_cache,
+    slice_cache_key,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from minapari.components import Dims
+    from minapari.layers import Layer
+
+logger = logging.getLogger('minapari.components._slice_prefetcher')
+
+#: Maximum number of steps prefetched ahead of the current one.
+DEFAULT_PREFETCH_DEPTH = 8
+#: How far ahead, in seconds, to prefetch at the current dims velocity.
+DEFAULT_LOOKAHEAD_S = 0.5
+#: Priority of prefetch tasks, after any requested slice.
+PREFETCH_PRIORITY = 10
+
+
+class _SlicePrefetcher:
+    """Slices ahead of the dims along the axis that is being scrubbed.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor
+        Pool used to run prefetch requests. If it accepts a ``priority``
+        keyword in ``submit``, prefetches are given ``PREFETCH_PRIORITY``.
+    depth : int
+        Maximum number of steps prefetched ahead of the current one.
+    lookahead : float
+        Prefetch enough steps to cover this many seconds at the current
+        dims velocity, up to ``depth``.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        *,
+        depth: int = DEFAULT_PREFETCH_DEPTH,
+        lookahead: float = DEFAULT_LOOKAHEAD_S,
+    ) -> None:
+        self.depth = depth
+        self.lookahead = lookahead
+        self._executor = executor
+        self._in_flight: dict[Hashable, Future] = {}
+        self._lock = RLock()
+        self._last_step: tuple[int, ...] | None = None
+        self._last_time = 0.0
+        self._last_layout: tuple | None = None
+
+    def running(self, key: Hashable) -> Future | None:
+        """Return the prefetch of a slice if it is currently running.
+
+        Prefetches that are still queued are not returned, since waiting on
+        them from a slicing task could leave every worker waiting.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+        if future is not None and future.running():
+            return future
+        return None
+
+    def observe(self, layers: Iterable[Layer], dims: Dims) -> None:
+        """Record a dims change and prefetch the steps that should follow.
+
+        This should only be called from the main thread.
+        """
+        now = perf_counter()
+        step = tuple(dims.current_step)
+        layout = (dims.ndim, dims.ndisplay, tuple(dims.order))
+        previous, elapsed = self._last_step, now - self._last_time
+        same_layout = layout == self._last_layout
+        self._last_step, self._last_time = step, now
+        self._last_layout = layout
+        if previous is None or not same_layout:
+            return
+
+        moved = [
+            axis
+            for axis in dims.not_displayed
+            if step[axis] != previous[axis]
+        ]
+        if len(moved) != 1:
+            return
+        axis = moved[0]
+        stride = step[axis] - previous[axis]
+        velocity = abs(stride) / max(elapsed, 1e-3)
+        count = min(
+            self.depth,
+            max(1, math.ceil(velocity * self.lookahead / abs(stride))),
+        )
+        nsteps = dims.nsteps[axis]
+        targets = [
+            step[axis] + stride * k
+            for k in range(1, count + 1)
+            if 0 <= step[axis] + stride * k < nsteps
+        ]
+        if not targets:
+            return
+        logger.debug('Prefetching axis %s steps %s', axis, targets)
+
+        layers = [
+            layer
+            for layer in layers
+            if layer.visible and getattr(layer, '_cache_slices', False)
+        ]
+        dims_state = dims.dict()
+        for target in targets:
+            target_step = list(step)
+            target_step[axis] = target
+            target_dims = type(dims)(**dims_state)
+            target_dims.current_step = tuple(target_step)
+            for layer in layers:
+                self._prefetch(layer, target_dims)
+
+    def clear(self) -> None:
+        """Cancel pending prefetches."""
+        with self._lock:
+            for future in self._in_flight.values():
+                future.cancel()
+            self._in_flight.clear()
+
+    def _prefetch(self, layer: Layer, dims: Dims) -> None:
+        key = slice_cache_key(layer, dims)
+        with self._lock:
+            if key in get_slice_cache() or key in self._in_flight:
+                return
+        request = _CachingSliceRequest(layer._make_slice_request(dims), key)
+        try:
+            future = self._executor.submit(request, priority=PREFETCH_PRIORITY)
+        except TypeError:
+            future = self._executor.submit(request)
+        with self._lock:
+            self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._done(key, future))
+
+    def _done(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
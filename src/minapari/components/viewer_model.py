@@ -5,7 +5,8 @@ import itertools
 import os
 import warnings
 from collections.abc import Iterator, Mapping, MutableMapping, Sequence
-from functools import lru_cache
+from concurrent.futures import Future
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -22,6 +23,7 @@ from app_model.expressions import Context
 
 from minapari import layers
 from minapari._pydantic_compat import Extra, Field, PrivateAttr, validator
+from minapari.components._layer_loader import _LayerLoader
 from minapari.components._layer_slicer import _LayerSlicer
 from minapari.components._viewer_mouse_bindings import (
     dims_scroll,
@@ -89,6 +91,7 @@ from minapari.utils.events import (
 from minapari.utils.key_bindings import KeymapProvider
 from minapari.utils.misc import ensure_list_of_layer_data_tuple, is_sequence
 from minapari.utils.mouse_bindings import MousemapProvider
+from minapari.utils.naming import magic_name
 from minapari.utils.progress import progress
 from minapari.utils.theme import available_themes, is_theme_available
 from minapari.utils.translations import trans
@@ -174,6 +177,8 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
         Viewer object context mapping.
     _layer_slicer: napari.components._layer_slicer._Layer_Slicer
         A layer slicer object controlling the creation of a slice
+    _layer_loader: minapari.components._layer_loader._LayerLoader
+        Builds the layers of `add_image_async` in the background
     _overlays: napari.utils.events.containers._evented_dict.EventedDict[str, Overlay]
         An EventedDict with as keys the string names of different napari overlays and as values the napari.Overlay
         objects.
@@ -207,6 +212,7 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
     # Need to use default factory because slicer is not copyable which
     # is required for default values.
     _layer_slicer: _LayerSlicer = PrivateAttr(default_factory=_LayerSlicer)
+    _layer_loader: _LayerLoader = PrivateAttr(default_factory=_LayerLoader)
 
     def __init__(
         self, title='napari', ndisplay=2, order=(), axis_labels=()
@@ -614,7 +620,10 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
 
     def _on_layer_reload(self, event: Event) -> None:
         self._layer_slicer.submit(
-            layers=[event.layer], dims=self.dims, force=True
+            layers=[event.layer],
+            dims=self.dims,
+            force=True,
+            selected=self.layers.selection,
         )
 
     def _update_layers(self, *, layers=None):
@@ -626,7 +635,9 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
             List of layers to update. If none provided updates all.
         """
         layers = layers or self.layers
-        self._layer_slicer.submit(layers=layers, dims=self.dims)
+        self._layer_slicer.submit(
+            layers=layers, dims=self.dims, selected=self.layers.selection
+        )
         # If the currently selected layer is sliced asynchronously, then the value
         # shown with this position may be incorrect. See the discussion for more details:
         # https://github.com/napari/napari/pull/5377#discussion_r1036280855
@@ -682,6 +693,21 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
                 list(self.cursor.position) + [0] * dim_diff
             )
 
+    def _on_data_appended(self, layer: Layer) -> None:
+        """Grow the dims after frames were appended to the data of a layer.
+
+        Frames may be appended at a high rate from any thread, so this is
+        not connected to the layer directly: the Qt viewer calls it on the
+        main thread, once for any number of frames appended in the meantime.
+        """
+        if layer not in self.layers:
+            return
+        layer._grow_extent()
+        self._on_layers_change()
+        if getattr(layer.data, 'follow', False):
+            axis = self.dims.ndim - layer.ndim
+            self.dims.set_point(axis, layer.extent.world[1, 0])
+
     def _update_mouse_pan(self, event):
         """Set the viewer interactive mouse panning"""
         if event.source is self.layers.selection.active:
@@ -1083,16 +1109,6 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
             The newly-created image layer or list of image layers.
         """
 
-        if colormap is not None:
-            # standardize colormap argument(s) to Colormaps, and make sure they
-            # are in AVAILABLE_COLORMAPS.  This will raise one of many various
-            # errors if the colormap argument is invalid.  See
-            # ensure_colormap for details
-            if isinstance(colormap, list):
-                colormap = [ensure_colormap(c) for c in colormap]
-            else:
-                colormap = ensure_colormap(colormap)
-
         # doing this here for IDE/console autocompletion in add_image function.
         kwargs = {
             'rgb': rgb,
@@ -1125,49 +1141,106 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
             'units': units,
         }
 
-        # these arguments are *already* iterables in the single-channel case.
-        iterable_kwargs = {
-            'scale',
-            'translate',
-            'rotate',
-            'shear',
-            'affine',
-            'contrast_limits',
-            'metadata',
-            'experimental_clipping_planes',
-            'custom_interpolation_kernel_2d',
-            'axis_labels',
-            'units',
-        }
-
+        kwargs = _image_layer_kwargs(channel_axis, kwargs)
+        layer_list = _make_image_layers(data, channel_axis, kwargs)
         if channel_axis is None:
-            kwargs['colormap'] = kwargs['colormap'] or 'gray'
-            kwargs['blending'] = kwargs['blending'] or 'translucent_no_depth'
-            # Helpful message if someone tries to add multi-channel kwargs,
-            # but forget the channel_axis arg
-            for k, v in kwargs.items():
-                if k not in iterable_kwargs and is_sequence(v):
-                    raise TypeError(
-                        trans._(
-                            "Received sequence for argument '{argument}', did you mean to specify a 'channel_axis'? ",
-                            deferred=True,
-                            argument=k,
-                        )
-                    )
-            layer = Image(data, **kwargs)
-            self.layers.append(layer)
-
-            return layer
+            self.layers.append(layer_list[0])
+            return layer_list[0]
 
-        layerdata_list = split_channels(data, channel_axis, **kwargs)
-
-        layer_list = [
-            Image(image, **i_kwargs) for image, i_kwargs, _ in layerdata_list
-        ]
         self.layers.extend(layer_list)
 
         return layer_list
 
+    def add_image_async(self, data=None, **kwargs) -> Future:
+        """Add one or more Image layers without blocking on their data.
+
+        A placeholder layer is added at once, with ``loaded`` False. The
+        Image layers are built on a background thread, which is where their
+        data is first read: to guess whether it is multiscale, to split its
+        channels and to estimate its contrast limits. They then replace the
+        placeholder and their first slice is also made in the background,
+        after which their ``loaded`` state turns True.
+
+        Without a viewer window, there is no event loop to hand the built
+        layers back to, and they are built and added before returning.
+
+        Parameters
+        ----------
+        data : array or list of array
+            Image data, as for `add_image`.
+        **kwargs
+            Any other argument of `add_image`.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Resolved with the newly-created image layer, or list of image
+            layers, once they are in the layer list. It is cancelled if the
+            placeholder is removed before then, and raises the error raised
+            while building the layers, if any. Cancelling it removes the
+            placeholder once the layers are built, and drops them.
+
+        Raises
+        ------
+        TypeError
+            If an argument is not an argument of `add_image`.
+        """
+        arguments = inspect.signature(self.add_image).bind(data, **kwargs)
+        arguments.apply_defaults()
+        kwargs = dict(arguments.arguments)
+        data = kwargs.pop('data')
+        channel_axis = kwargs.pop('channel_axis')
+        kwargs = _image_layer_kwargs(channel_axis, kwargs)
+        if not self._layer_loader.listening:
+            result: Future = Future()
+            result.set_result(
+                self.add_image(*arguments.args, **arguments.kwargs)
+            )
+            return result
+
+        if kwargs['name'] is None and channel_axis is None:
+            # The name of the variable can only be looked up from the
+            # caller's thread.
+            kwargs['name'] = magic_name(data)
+        name = kwargs['name']
+        placeholder = Image(
+            np.zeros((1, 1), dtype=np.uint8),
+            name=name if isinstance(name, str) else None,
+        )
+        with self._layer_slicer.force_sync():
+            self.layers.append(placeholder)
+        placeholder._set_loaded(False)
+        return self._layer_loader.submit(
+            partial(_make_image_layers, data, channel_axis, kwargs),
+            placeholder,
+        )
+
+    def _on_layers_loaded(self, event: Event) -> None:
+        """Replace a placeholder with the layers built in the background.
+
+        This should only be called from the main thread.
+        """
+        placeholder, future = event.placeholder, event.future
+        if future.cancelled():
+            # The caller no longer wants the layers.
+            if placeholder in self.layers:
+                self.layers.remove(placeholder)
+            return
+        if placeholder not in self.layers:
+            future.cancel()
+            return
+        index = self.layers.index(placeholder)
+        # Remove the placeholder first to free its name.
+        self.layers.remove(placeholder)
+        if event.error is not None:
+            future.set_exception(event.error)
+            return
+        with self._layer_slicer.force_async():
+            for i, layer in enumerate(event.layers):
+                self.layers.insert(index + i, layer)
+        layers = event.layers
+        future.set_result(layers if len(layers) > 1 else layers[0])
+
     def open_sample(
         self,
         plugin: str,
@@ -1716,6 +1789,82 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
         return layer if isinstance(layer, list) else [layer]
 
 
+def _image_layer_kwargs(
+    channel_axis: int | None, kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    """Check and complete the arguments of the Image layers of `add_image`.
+
+    Parameters
+    ----------
+    channel_axis : int, optional
+        Axis to split the image along, if any.
+    kwargs : dict
+        The arguments of `add_image`, other than data and channel_axis.
+
+    Returns
+    -------
+    dict
+        The arguments with colormaps standardized and defaults filled in.
+    """
+    kwargs = dict(kwargs)
+    colormap = kwargs['colormap']
+    if colormap is not None:
+        # standardize colormap argument(s) to Colormaps, and make sure they
+        # are in AVAILABLE_COLORMAPS.  This will raise one of many various
+        # errors if the colormap argument is invalid.  See
+        # ensure_colormap for details
+        if isinstance(colormap, list):
+            kwargs['colormap'] = [ensure_colormap(c) for c in colormap]
+        else:
+            kwargs['colormap'] = ensure_colormap(colormap)
+
+    if channel_axis is not None:
+        return kwargs
+
+    # these arguments are *already* iterables in the single-channel case.
+    iterable_kwargs = {
+        'scale',
+        'translate',
+        'rotate',
+        'shear',
+        'affine',
+        'contrast_limits',
+        'metadata',
+        'experimental_clipping_planes',
+        'custom_interpolation_kernel_2d',
+        'axis_labels',
+        'units',
+    }
+
+    kwargs['colormap'] = kwargs['colormap'] or 'gray'
+    kwargs['blending'] = kwargs['blending'] or 'translucent_no_depth'
+    # Helpful message if someone tries to add multi-channel kwargs,
+    # but forget the channel_axis arg
+    for k, v in kwargs.items():
+        if k not in iterable_kwargs and is_sequence(v):
+            raise TypeError(
+                trans._(
+                    "Received sequence for argument '{argument}', did you mean to specify a 'channel_axis'? ",
+                    deferred=True,
+                    argument=k,
+                )
+            )
+    return kwargs
+
+
+def _make_image_layers(
+    data: Any, channel_axis: int | None, kwargs: dict[str, Any]
+) -> list[Image]:
+    """Build the Image layers of `add_image`, one per channel.
+
+    This reads the data, and may be called from any thread.
+    """
+    if channel_axis is None:
+        return [Image(data, **kwargs)]
+    layerdata_list = split_channels(data, channel_axis, **kwargs)
+    return [Image(image, **i_kwargs) for image, i_kwargs, _ in layerdata_list]
+
+
 def _normalize_layer_data(data: LayerData) -> FullLayerData:
     """Accepts any layerdata tuple, and returns a fully qualified tuple.
 
@@ -1890,7 +2039,11 @@ def valid_add_kwargs() -> dict[str, set[str]]:
     """Return a dict where keys are layer types & values are valid kwargs."""
     valid = {}
     for meth in dir(ViewerModel):
-        if not meth.startswith('add_') or meth[4:] == 'layer':
+        if (
+            not meth.startswith('add_')
+            or meth[4:] == 'layer'
+            or meth.endswith('_async')
+        ):
             continue
         params = inspect.signature(getattr(ViewerModel, meth)).parameters
         valid[meth[4:]] = set(params) - {'self', 'kwargs'}
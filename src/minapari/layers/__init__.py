@@ -5,10 +5,20 @@ Custom layers must inherit from Layer and pass along the
 to the super constructor.
 """
 
-from minapari.layers.base import Layer
-from minapari.layers.image import Image
+from minapari._lazy import lazy_imports
+
+# Layer classes are imported on first access (PEP 562), so that importing a
+# submodule such as minapari.layers.utils does not import every layer.
+_LAZY_IMPORTS = {
+    'Image': 'minapari.layers.image',
+    'Layer': 'minapari.layers.base',
+    'RingBufferData': 'minapari.layers._ring_buffer_data',
+}
 
 __all__ = [
     'Image',
     'Layer',
+    'RingBufferData',
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
@@ -0,0 +1,9 @@
+from minapari.layers._ring_buffer_data import RingBufferData
+from minapari.layers.base import Layer
+from minapari.layers.image import Image
+
+__all__ = (
+    'Image',
+    'Layer',
+    'RingBufferData',
+)
@@ -0,0 +1,379 @@
+"""Channels of a multichannel array that share their reads.
+
+When the chunks of an array span several channels, each channel added as
+its own layer reads, and decompresses, the same chunks again: a 7 channel
+dataset is read 7 times per plane. A ``ChannelData`` views one channel of an
+array, and slices it by reading the same region of all channels at once,
+through a reader shared by the channels. The other channels, sliced right
+after, then find their slice in memory. The blocks read are kept in the
+global slice cache, within its budget.
+
+Channels are still separate layers, each drawn as its own visual: this
+shares the reads of the data, not its upload or its compositing.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import weakref
+from collections.abc import Hashable, Sequence
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any
+
+import numpy as np
+
+from minapari.layers._virtual_data import (
+    _drop_axis,
+    _expand_key,
+    _is_basic_key,
+)
+from minapari.utils._dask_utils import _is_dask_data
+from minapari.utils._slice_cache import get_slice_cache
+
+# Identifies the blocks of each reader in the global slice cache, unlike
+# ids, which are reused after a reader is garbage collected.
+_READER_IDS = itertools.count()
+
+# The channel read by each dask array made by ``channel_array``, by name.
+_DASK_CHANNELS: weakref.WeakValueDictionary[str, ChannelData] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _channel_chunk_size(data: Any, axis: int) -> int:
+    """Number of channels in a chunk of dask- or zarr-like data, else 1."""
+    chunks = getattr(data, 'chunks', None)
+    if chunks is None or len(chunks) != len(data.shape):
+        return 1
+    size = chunks[axis]
+    if isinstance(size, Sequence):
+        size = max(size, default=1)
+    try:
+        return int(size)
+    except (TypeError, ValueError):
+        return 1
+
+
+def chunks_span_channels(data: Any, axis: int) -> bool:
+    """True if the chunks of some data hold more than one channel.
+
+    Reading the channels of such data separately reads every chunk once per
+    channel. Numpy arrays are never read, and their channels are views.
+
+    Parameters
+    ----------
+    data : array
+        Multichannel data.
+    axis : int
+        Channel axis.
+
+    Returns
+    -------
+    bool
+        Whether the channels should share their reads.
+    """
+    if isinstance(data, np.ndarray):
+        return False
+    return _channel_chunk_size(data, axis % len(data.shape)) > 1
+
+
+def _hashable_key(key: tuple) -> Hashable:
+    """Make a key of integers and slices hashable."""
+    return tuple(
+        (k.start, k.stop, k.step) if isinstance(k, slice) else int(k)
+        for k in key
+    )
+
+
+def _index_bounds(index: Any, size: int) -> tuple[int, int]:
+    """Smallest and largest plus one position read by an index of an axis.
+
+    The index is an integer, a slice, or a slice as a hashable tuple.
+    """
+    if isinstance(index, tuple):
+        index = slice(*index)
+    if isinstance(index, slice):
+        positions = range(*index.indices(size))
+        if not positions:
+            return 0, 0
+        first, last = positions[0], positions[-1]
+        return min(first, last), max(first, last) + 1
+    position = range(size)[index]
+    return position, position + 1
+
+
+class _ChannelReader:
+    """Reads regions of all channels of an array at once.
+
+    Reads of the same region from several threads are coalesced: the first
+    thread reads the data while the others wait for its result. Blocks are
+    kept in the global slice cache until they are evicted, ``clear`` is
+    called, or a write drops the blocks it changes.
+
+    Parameters
+    ----------
+    data : array
+        Multichannel data.
+    channel_axis : int
+        Channel axis.
+    """
+
+    def __init__(self, data: Any, channel_axis: int) -> None:
+        self.data = data
+        self.channel_axis = channel_axis % len(data.shape)
+        self._id = ('_ChannelReader', next(_READER_IDS))
+        self._pending: dict[Hashable, Future] = {}
+        self._lock = Lock()
+        # Incremented when blocks are dropped, so that reads started before
+        # do not keep what they read.
+        self._generation = 0
+
+    def read(self, key: tuple) -> np.ndarray:
+        """Read a region of all channels.
+
+        Parameters
+        ----------
+        key : tuple of int or slice
+            Index of the region in the data without its channel axis, with
+            one entry per axis.
+
+        Returns
+        -------
+        np.ndarray
+            The region of all channels, with the channel axis in place.
+        """
+        hashable = _hashable_key(key)
+        with self._lock:
+            block = get_slice_cache().get((self._id, hashable))
+            if block is not None:
+                return block
+            future = self._pending.get(hashable)
+            if future is None:
+                future = self._pending[hashable] = Future()
+                owner = True
+            else:
+                owner = False
+            generation = self._generation
+        if not owner:
+            return future.result()
+
+        axis = self.channel_axis
+        try:
+            block = np.asarray(
+                self.data[(*key[:axis], slice(None), *key[axis:])]
+            )
+        except BaseException as e:
+            with self._lock:
+                del self._pending[hashable]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            if generation == self._generation:
+                get_slice_cache().put((self._id, hashable), block)
+            del self._pending[hashable]
+        future.set_result(block)
+        return block
+
+    def write(self, key: tuple, channel: int, values: Any) -> None:
+        """Write values into a region of one channel.
+
+        The blocks that overlap the region are dropped.
+
+        Parameters
+        ----------
+        key : tuple
+            Index of the region in the data without its channel axis, with
+            one entry per axis.
+        channel : int
+            Index of the channel along the channel axis.
+        values : array-like
+            Values to write, broadcastable to the shape of the region.
+        """
+        axis = self.channel_axis
+        self.data[(*key[:axis], channel, *key[axis:])] = values
+        shape = _drop_axis(tuple(self.data.shape), axis)
+        if not _is_basic_key(key, len(shape)):
+            self.clear()
+            return
+        bounds = [
+            _index_bounds(k, size) for k, size in zip(key, shape, strict=True)
+        ]
+
+        def overlaps(cache_key: Hashable) -> bool:
+            if not self._owns(cache_key):
+                return False
+            for index, size, (start, stop) in zip(
+                cache_key[1],  # type: ignore[index]
+                shape,
+                bounds,
+                strict=True,
+            ):
+                low, high = _index_bounds(index, size)
+                if high <= start or low >= stop:
+                    return False
+            return True
+
+        with self._lock:
+            self._generation += 1
+            get_slice_cache().discard(overlaps)
+
+    def clear(self) -> None:
+        """Drop the blocks kept in memory, e.g. because the data changed."""
+        with self._lock:
+            self._generation += 1
+            get_slice_cache().discard(self._owns)
+
+    def _owns(self, cache_key: Hashable) -> bool:
+        """True if a key of the slice cache is that of a block of this."""
+        return (
+            isinstance(cache_key, tuple)
+            and len(cache_key) == 2
+            and cache_key[0] == self._id
+        )
+
+
+# note: this implements `LayerDataProtocol`, but we don't need to inherit.
+class ChannelData:
+    """One channel of multichannel data, read together with the others.
+
+    Slicing with integers and slices reads the region of all channels through
+    the shared reader and returns this channel's part. Other indexing reads
+    this channel only. Writes go to the source data.
+
+    Parameters
+    ----------
+    reader : _ChannelReader
+        Reader shared by all channels of the data.
+    channel : int
+        Index of the channel along the channel axis.
+    """
+
+    def __init__(self, reader: _ChannelReader, channel: int) -> None:
+        self._reader = reader
+        self.channel = channel
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the data."""
+        return self._reader.data.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the data, without the channel axis."""
+        shape = tuple(self._reader.data.shape)
+        return _drop_axis(shape, self._reader.channel_axis)
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions, without the channel axis."""
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        """Number of elements of the data."""
+        return math.prod(self.shape)
+
+    @property
+    def chunks(self) -> tuple | None:
+        """Chunks of the data without the channel axis, if it has any.
+
+        Blocks that are aligned with these chunks are the same for all
+        channels, so that reading them is shared.
+        """
+        chunks = getattr(self._reader.data, 'chunks', None)
+        if chunks is None:
+            return None
+        return _drop_axis(chunks, self._reader.channel_axis)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        key = _expand_key(key, self.ndim)
+        axis = self._reader.channel_axis
+        if not _is_basic_key(key, self.ndim):
+            full_key = (*key[:axis], self.channel, *key[axis:])
+            return np.asarray(self._reader.data[full_key])
+        block = self._reader.read(key)
+        # Integer indices before the channel axis drop their axis.
+        position = sum(isinstance(k, slice) for k in key[:axis])
+        return block[(slice(None),) * position + (self.channel,)]
+
+    def __setitem__(self, key: Any, values: Any) -> None:
+        self._reader.write(_expand_key(key, self.ndim), self.channel, values)
+
+    def clear(self) -> None:
+        """Drop the blocks of all channels read so far."""
+        self._reader.clear()
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        axis = self._reader.channel_axis
+        key = (slice(None),) * axis + (self.channel,)
+        return np.asarray(self._reader.data[key], dtype=dtype)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} channel={self.channel} '
+            f'of {type(self._reader.data).__name__} '
+            f'shape={self._reader.data.shape} dtype={self.dtype}>'
+        )
+
+
+def channel_array(data: Any, reader: _ChannelReader, channel: int) -> Any:
+    """One channel of data, as the same kind of array when it is dask.
+
+    Dask data stays a dask array, with the chunks of the data, whose blocks
+    are read through the reader shared by the channels. Other data is a
+    ``ChannelData``.
+
+    Parameters
+    ----------
+    data : array
+        The multichannel data read by ``reader``.
+    reader : _ChannelReader
+        Reader shared by all channels of the data.
+    channel : int
+        Index of the channel along the channel axis.
+
+    Returns
+    -------
+    array
+        The channel, a dask array or a ``ChannelData``.
+    """
+    view = ChannelData(reader, channel)
+    if not _is_dask_data(data):
+        return view
+    import dask.array as da
+
+    name = f'minapari-channel-{reader._id[1]}-{channel}'
+    _DASK_CHANNELS[name] = view
+    return da.from_array(
+        view,
+        chunks=view.chunks,
+        name=name,
+        lock=False,
+        meta=np.empty((0,) * view.ndim, dtype=view.dtype),
+    )
+
+
+def find_channel(data: Any) -> ChannelData | None:
+    """The ``ChannelData`` that some layer data reads, if any.
+
+    Parameters
+    ----------
+    data : array
+        A level of layer data, possibly made by ``channel_array``.
+
+    Returns
+    -------
+    ChannelData or None
+        The channel read, None if the data is not a channel.
+    """
+    if isinstance(data, ChannelData):
+        return data
+    name = getattr(data, 'name', None)
+    if not isinstance(name, str):
+        return None
+    return _DASK_CHANNELS.get(name)
@@ -0,0 +1,193 @@
+"""Preallocated ring buffer of frames, for live time series such as cameras.
+
+Frames are appended along a new leading time axis. The buffer only keeps the
+last ``capacity`` frames in memory, but frames keep their index forever: the
+shape of the data grows by one along the time axis with every appended frame,
+and frames that were overwritten read as zeros. This means that a slice of an
+older frame never changes while frames are being appended, so the layer only
+needs its extent updated, and not to be sliced again, unless the dims follow
+the newest frame.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from threading import Lock
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from minapari.utils.events import EmitterGroup, Event
+from minapari.utils.translations import trans
+
+
+# note: this implements `LayerDataProtocol`, but we don't need to inherit.
+class RingBufferData:
+    """Growing time series of frames backed by a fixed size ring buffer.
+
+    Frames can be appended from any thread. Each append emits
+    ``events.appended`` from that thread, which is cheap to listen to: when
+    the data is shown in a viewer, appends are coalesced so that at most one
+    dims update is waiting on the main thread at any time.
+
+    Parameters
+    ----------
+    frame_shape : sequence of int
+        Shape of each frame.
+    dtype : dtype-like
+        Data type of the frames.
+    capacity : int
+        Number of most recent frames kept in memory.
+    follow : bool
+        If True, a viewer showing the data moves its dims slider to the
+        newest frame whenever frames are appended.
+
+    Attributes
+    ----------
+    events : EmitterGroup
+        Event emitter group, with an ``appended`` event whose ``count`` is
+        the number of frames appended so far.
+    follow : bool
+        Whether a viewer follows the newest frame.
+    """
+
+    def __init__(
+        self,
+        frame_shape: Sequence[int],
+        dtype: npt.DTypeLike = np.float32,
+        capacity: int = 100,
+        *,
+        follow: bool = True,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(
+                trans._(
+                    'Ring buffer capacity must be at least 1, got {capacity}.',
+                    deferred=True,
+                    capacity=capacity,
+                )
+            )
+        self._frame_shape = tuple(int(s) for s in frame_shape)
+        self._buffer = np.zeros((capacity, *self._frame_shape), dtype=dtype)
+        self._count = 0
+        self._lock = Lock()
+        self.follow = follow
+        self.events = EmitterGroup(source=self, appended=Event)
+
+    @property
+    def capacity(self) -> int:
+        """Number of most recent frames kept in memory."""
+        return self._buffer.shape[0]
+
+    @property
+    def frame_shape(self) -> tuple[int, ...]:
+        """Shape of each frame."""
+        return self._frame_shape
+
+    @property
+    def count(self) -> int:
+        """Number of frames appended so far."""
+        return self._count
+
+    @property
+    def available(self) -> range:
+        """Indices of the frames still held in memory."""
+        count = self._count
+        return range(max(count - self.capacity, 0), count)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the frames."""
+        return self._buffer.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the data, with one frame of zeros until one is appended."""
+        return (max(self._count, 1), *self._frame_shape)
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions, including the time axis."""
+        return len(self._frame_shape) + 1
+
+    @property
+    def size(self) -> int:
+        """Number of elements of the data."""
+        return math.prod(self.shape)
+
+    def append(self, frame: npt.ArrayLike) -> int:
+        """Copy a frame into the buffer, overwriting the oldest one if full.
+
+        This can be called from any thread.
+
+        Parameters
+        ----------
+        frame : array-like
+            Frame of shape ``frame_shape``, cast to ``dtype``.
+
+        Returns
+        -------
+        int
+            Index of the frame along the time axis.
+        """
+        frame = np.asarray(frame)
+        if frame.shape != self._frame_shape:
+            raise ValueError(
+                trans._(
+                    'Frame shape {shape} does not match the buffer frame shape {frame_shape}.',
+                    deferred=True,
+                    shape=frame.shape,
+                    frame_shape=self._frame_shape,
+                )
+            )
+        with self._lock:
+            index = self._count
+            self._buffer[index % self.capacity] = frame
+            self._count = index + 1
+        self.events.appended(count=index + 1)
+        return index
+
+    def _frame(self, index: int, key: tuple) -> np.ndarray:
+        """Copy of part of a frame, or zeros if it was overwritten.
+
+        Frames are copied so that slices stay valid when their slot in the
+        buffer is reused. This must be called with the lock held.
+        """
+        if index < self._count - self.capacity or self._count == 0:
+            return np.zeros_like(self._buffer[0][key])
+        return np.array(self._buffer[index % self.capacity][key])
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(k is Ellipsis for k in key):
+            i = next(i for i, k in enumerate(key) if k is Ellipsis)
+            missing = self.ndim - len(key) + 1
+            key = key[:i] + (slice(None),) * missing + key[i + 1 :]
+        if not key:
+            key = (slice(None),)
+        time_key, frame_key = key[0], key[1:]
+        with self._lock:
+            times = range(max(self._count, 1))
+            if isinstance(time_key, slice):
+                times = times[time_key]
+            elif isinstance(time_key, (int, np.integer)):
+                return self._frame(times[time_key], frame_key)
+            else:
+                times = np.arange(len(times))[np.asarray(time_key)]
+            if len(times) == 0:
+                empty = self._buffer[:0]
+                return np.array(empty[(slice(None), *frame_key)])
+            return np.stack([self._frame(t, frame_key) for t in times])
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} frames={self._count} '
+            f'capacity={self.capacity} frame_shape={self._frame_shape} '
+            f'dtype={self.dtype}>'
+        )
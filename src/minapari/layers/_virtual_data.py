@@ -0,0 +1,247 @@
+"""Lazy views that stack arrays or take one index along an axis.
+
+The layer actions that stack images into one layer or split a layer into
+channels would otherwise copy all of the data, which doubles the memory used
+by multi-gigabyte images and can take minutes. These views read from their
+source arrays only when sliced, so that memmap, dask and zarr data stays on
+its original backing.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from minapari.utils.translations import trans
+
+
+def _expand_key(key: Any, ndim: int) -> tuple:
+    """Expand an index to a tuple with one entry per axis.
+
+    Only an Ellipsis is expanded, and missing trailing entries are filled
+    with full slices. Keys with ``None`` are returned as they are.
+    """
+    if not isinstance(key, tuple):
+        key = (key,)
+    if any(k is Ellipsis for k in key):
+        i = next(i for i, k in enumerate(key) if k is Ellipsis)
+        missing = ndim - len(key) + 1
+        key = key[:i] + (slice(None),) * missing + key[i + 1 :]
+    return key + (slice(None),) * (ndim - len(key))
+
+
+def _is_basic_key(key: tuple, ndim: int) -> bool:
+    """True if a key only has one integer or slice per axis."""
+    return len(key) == ndim and all(
+        isinstance(k, (slice, int, np.integer)) for k in key
+    )
+
+
+def _drop_axis(values: Sequence, axis: int) -> tuple:
+    """Drop the entry of an axis from a shape, chunks or key."""
+    return tuple(values[:axis]) + tuple(values[axis + 1 :])
+
+
+# note: this implements `LayerDataProtocol`, but we don't need to inherit.
+class StackedData:
+    """Arrays stacked along a new axis, without copying them.
+
+    Slicing reads the selected part of each selected array and stacks only
+    that, like ``np.stack(arrays, axis)[key]`` would.
+
+    Parameters
+    ----------
+    arrays : sequence of arrays
+        Arrays of the same shape.
+    axis : int
+        Axis of the result along which the arrays are stacked.
+
+    Attributes
+    ----------
+    arrays : tuple of arrays
+        The stacked arrays.
+    axis : int
+        Axis along which the arrays are stacked, between 0 and ``ndim - 1``.
+    """
+
+    def __init__(self, arrays: Sequence[Any], axis: int = 0) -> None:
+        arrays = tuple(arrays)
+        if not arrays:
+            raise ValueError(
+                trans._('need at least one array to stack', deferred=True)
+            )
+        shapes = {tuple(a.shape) for a in arrays}
+        if len(shapes) != 1:
+            raise ValueError(
+                trans._(
+                    'all arrays must have the same shape to be stacked, got {shapes}',
+                    deferred=True,
+                    shapes=sorted(shapes),
+                )
+            )
+        ndim = len(arrays[0].shape) + 1
+        if not -ndim <= axis < ndim:
+            raise ValueError(
+                trans._(
+                    'axis {axis} is out of bounds for {ndim} dimensions',
+                    deferred=True,
+                    axis=axis,
+                    ndim=ndim,
+                )
+            )
+        self.arrays = arrays
+        self.axis = axis % ndim
+        self._dtype = np.result_type(*(a.dtype for a in arrays))
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the stack."""
+        return self._dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the stack."""
+        shape = tuple(self.arrays[0].shape)
+        return shape[: self.axis] + (len(self.arrays),) + shape[self.axis :]
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the stack."""
+        return len(self.arrays[0].shape) + 1
+
+    @property
+    def size(self) -> int:
+        """Number of elements of the stack."""
+        return math.prod(self.shape)
+
+    @property
+    def chunks(self) -> tuple | None:
+        """Chunks of the first array with one array per chunk, if any."""
+        chunks = getattr(self.arrays[0], 'chunks', None)
+        if chunks is None:
+            return None
+        n = len(self.arrays)
+        # dask lists the size of every chunk, zarr only the chunk shape.
+        stacked = (1,) * n if chunks and isinstance(chunks[0], tuple) else 1
+        axis = self.axis
+        return tuple(chunks[:axis]) + (stacked,) + tuple(chunks[axis:])
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        key = _expand_key(key, self.ndim)
+        index = key[self.axis] if len(key) == self.ndim else None
+        rest = _drop_axis(key, self.axis)
+        if index is None or not _is_basic_key(rest, self.ndim - 1):
+            # Advanced indexing may move axes, so follow numpy.
+            return np.asarray(self)[key]
+        if isinstance(index, (int, np.integer)):
+            return np.asarray(self.arrays[index][rest], dtype=self.dtype)
+        selected = np.arange(len(self.arrays))[index]
+        parts = [np.asarray(self.arrays[i][rest]) for i in selected]
+        # Integer indices before the stacking axis drop their axis.
+        position = sum(isinstance(k, slice) for k in key[: self.axis])
+        if not parts:
+            empty = np.asarray(self.arrays[0][rest])
+            return np.empty(
+                empty.shape[:position] + (0,) + empty.shape[position:],
+                dtype=self.dtype,
+            )
+        return np.stack(parts, axis=position).astype(self.dtype, copy=False)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        stacked = np.stack([np.asarray(a) for a in self.arrays], self.axis)
+        return stacked.astype(dtype or self.dtype, copy=False)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} of {len(self.arrays)} arrays '
+            f'axis={self.axis} shape={self.shape} dtype={self.dtype}>'
+        )
+
+
+# note: this implements `LayerDataProtocol`, but we don't need to inherit.
+class AxisView:
+    """One index along an axis of an array, without reading it.
+
+    This is ``array.take(index, axis)`` for arrays, such as zarr or h5py,
+    that read all of the requested data when they are indexed.
+
+    Parameters
+    ----------
+    array : array
+        Source array.
+    axis : int
+        Axis of the source array to take an index along.
+    index : int
+        Index along the axis.
+
+    Attributes
+    ----------
+    array : array
+        Source array.
+    axis : int
+        Axis of the source array, between 0 and ``array.ndim - 1``.
+    index : int
+        Index along the axis.
+    """
+
+    def __init__(self, array: Any, axis: int, index: int) -> None:
+        ndim = len(array.shape)
+        self.array = array
+        self.axis = axis % ndim
+        self.index = range(array.shape[self.axis])[index]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the view."""
+        return self.array.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the view, without the axis."""
+        return _drop_axis(tuple(self.array.shape), self.axis)
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the view."""
+        return len(self.array.shape) - 1
+
+    @property
+    def size(self) -> int:
+        """Number of elements of the view."""
+        return math.prod(self.shape)
+
+    @property
+    def chunks(self) -> tuple | None:
+        """Chunks of the source array without the axis, if it has any."""
+        chunks = getattr(self.array, 'chunks', None)
+        if chunks is None:
+            return None
+        return _drop_axis(chunks, self.axis)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        key = _expand_key(key, self.ndim)
+        if not _is_basic_key(key, self.ndim):
+            # Advanced indexing may move axes, so follow numpy.
+            return np.asarray(self)[key]
+        full_key = (*key[: self.axis], self.index, *key[self.axis :])
+        return np.asarray(self.array[full_key])
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        key = (slice(None),) * self.axis + (self.index,)
+        return np.asarray(self.array[key], dtype=dtype)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} index={self.index} axis={self.axis} '
+            f'of {type(self.array).__name__} shape={self.array.shape} '
+            f'dtype={self.dtype}>'
+        )
@@ -28,8 +28,8 @@ def highlight_box_handles(layer: 'Layer', event: Event) -> None:
     # we work in data space so we're axis aligned which simplifies calculation
     # same as Layer.world_to_data
     world_to_data = (
-        layer._transforms[1:].set_slice(layer._slice_input.displayed).inverse
-    )
+        layer._transforms[1:].simplified_slice(layer._slice_input.displayed)
+    ).inverse
     pos = np.array(world_to_data(event.position))[event.dims_displayed]
     handle_coords = generate_transform_box_from_layer(
         layer, layer._slice_input.displayed
@@ -181,8 +181,9 @@ def transform_with_box(
 
     # we work in data space so we're axis aligned which simplifies calculation
     # same as Layer.data_to_world
-    simplified = layer._transforms[1:].simplified
-    initial_data_to_world = simplified.set_slice(layer._slice_input.displayed)
+    initial_data_to_world = layer._transforms[1:].simplified_slice(
+        layer._slice_input.displayed
+    )
     initial_world_to_data = initial_data_to_world.inverse
     initial_mouse_pos = np.array(event.position)[event.dims_displayed]
     initial_mouse_pos_data = initial_world_to_data(initial_mouse_pos)
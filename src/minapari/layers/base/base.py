@@ -42,6 +42,7 @@ from minapari.layers.utils.layer_utils import (
     convert_to_uint8,
     dims_displayed_world_to_layer,
     get_extent_world,
+    snap_corners_to_tiles,
 )
 from minapari.layers.utils.plane import ClippingPlane, ClippingPlaneList
 from minapari.settings import get_settings
@@ -51,6 +52,7 @@ from minapari.utils._magicgui import (
     add_layers_to_viewer,
     get_layers,
 )
+from minapari.utils._slice_cache import invalidate_slice_cache
 from minapari.utils.events import EmitterGroup, Event, EventedDict
 from minapari.utils.geometry import (
     find_front_back_face,
@@ -70,6 +72,7 @@ from minapari.utils.translations import trans
 if TYPE_CHECKING:
     import numpy.typing as npt
 
+    from minapari.components.camera import Camera
     from minapari.components.dims import Dims
     from minapari.components.overlays.base import Overlay
     from minapari.layers._source import Source
@@ -141,8 +144,8 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         alpha values of the layer visual get mixed. Allowed values are
         {'opaque', 'translucent', 'translucent_no_depth', 'additive', and 'minimum'}.
     cache : bool
-        Whether slices of out-of-core datasets should be cached upon retrieval.
-        Currently, this only applies to dask arrays.
+        Whether slices should be cached upon retrieval, in the global slice
+        cache and, for dask arrays, in the dask opportunistic cache.
     experimental_clipping_planes : list of dicts, list of ClippingPlane, or ClippingPlaneList
         Each dict defines a clipping plane in 3D in data coordinates.
         Valid dictionary keys are {'position', 'normal', and 'enabled'}.
@@ -220,8 +223,8 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             corresponds to ``depth_test=False``, ``cull_face=False``, ``blend=True``,
             ``blend_equation=('min')``.
     cache : bool
-        Whether slices of out-of-core datasets should be cached upon retrieval.
-        Currently, this only applies to dask arrays.
+        Whether slices should be cached upon retrieval, in the global slice
+        cache and, for dask arrays, in the dask opportunistic cache.
     corner_pixels : array
         Coordinates of the top-left and bottom-right canvas pixels in the data
         coordinates of each layer. For multiscale data the coordinates are in
@@ -297,6 +300,9 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
 
     _modeclass: type[StringEnum] = Mode
     _projectionclass: type[StringEnum] = BaseProjectionMode
+    # Shape of the tiles multiscale corner pixels are aligned to in 2D, or
+    # None to slice exactly the visible region.
+    _multiscale_tile_shape: ClassVar[tuple[int, ...] | None] = None
 
     ModeCallable = Callable[
         ['Layer', Event], None | Generator[None, None, None]
@@ -362,6 +368,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         self._unique_id = None
         self._source = current_source()
         self.dask_optimized_slicing = configure_dask(data, cache)
+        self._cache_slices = cache
         self._metadata = dict(metadata or {})
         self._opacity = opacity
         self._blending = Blending(blending)
@@ -481,6 +488,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             _extent_augmented=Event,
             _overlays=Event,
         )
+        self.events.data.connect(self._clear_slice_cache)
         self.name = name
         self.mode = mode
         self.projection_mode = projection_mode
@@ -1515,6 +1523,9 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             logger.debug('Layer.refresh blocked: %s', self)
             return
         logger.debug('Layer.refresh: %s', self)
+        # A full refresh is how in-place changes to the data are signalled.
+        if data_displayed and extent:
+            self._clear_slice_cache()
         # If async is enabled then emit an event that the viewer should handle.
         if get_settings().experimental.async_ and data_displayed:
             # full async slice reload, it will also update everything when done slicing
@@ -1530,6 +1541,10 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
                 force=force,
             )
 
+    def _clear_slice_cache(self, event: Event | None = None) -> None:
+        """Remove the cached slices of this layer, e.g. when data changed."""
+        invalidate_slice_cache(self)
+
     def _refresh_sync(
         self,
         *,
@@ -1997,7 +2012,11 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         return start_point, end_point
 
     def _update_draw(
-        self, scale_factor, corner_pixels_displayed, shape_threshold
+        self,
+        scale_factor,
+        corner_pixels_displayed,
+        shape_threshold,
+        camera: Camera | None = None,
     ):
         """Update canvas scale and corner values on draw.
 
@@ -2013,6 +2032,9 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             world coordinates.
         shape_threshold : tuple
             Requested shape of field of view in data coordinates.
+        camera : Camera, optional
+            Camera of the canvas, used by layers that choose the level of
+            detail from the camera position in 3D.
         """
         self.scale_factor = scale_factor
 
@@ -2025,7 +2047,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         # Note that we ignore the first transform which is tile2data
         data_corners = (
             self._transforms[1:]
-            .simplified.set_slice(displayed_axes)
+            .simplified_slice(displayed_axes)
             .inverse(all_corners)
         )
 
@@ -2051,6 +2073,14 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             # handle now and downsample_factors is also only on image layers.
             max_coords = np.take(self.data[level].shape, displayed_axes) - 1
             corners[:, displayed_axes] = np.clip(scaled_corners, 0, max_coords)
+            if self._multiscale_tile_shape is not None:
+                # Align the corners to whole tiles, so that panning only
+                # triggers a new slice once a tile enters the field of view.
+                corners[:, displayed_axes] = snap_corners_to_tiles(
+                    corners[:, displayed_axes],
+                    self._multiscale_tile_shape,
+                    max_coords + 1,
+                )
             display_shape = tuple(
                 corners[1, displayed_axes] - corners[0, displayed_axes]
             )
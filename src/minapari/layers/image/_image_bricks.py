@@ -0,0 +1,621 @@
+"""Brick bookkeeping for 3D rendering of multiscale images."""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import RLock
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+import numpy as np
+
+from minapari.utils._cache import ByteLRUCache
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from minapari.layers._multiscale_data import MultiScaleData
+
+logger = logging.getLogger(__name__)
+
+
+#: Default shape of one brick along the displayed dimensions.
+DEFAULT_BRICK_SHAPE = (128, 128, 128)
+#: Default byte budget for the bricks kept in memory by one layer.
+DEFAULT_BRICK_CACHE_BYTES = 512 * 2**20
+#: Default maximum number of bricks covering the volume.
+DEFAULT_MAX_BRICKS = 512
+#: Default maximum number of voxels of the assembled volume.
+DEFAULT_MAX_VOLUME_VOXELS = 2**27
+
+
+class _BrickKey(NamedTuple):
+    """Identifies one brick of a multiscale image.
+
+    Attributes
+    ----------
+    level : int
+        Level of the multiscale the brick belongs to.
+    index : tuple of int
+        For displayed dimensions, the index of the brick on the brick grid
+        of its level. For non-displayed dimensions, the data index of the
+        slice at that level.
+    """
+
+    level: int
+    index: tuple[int, ...]
+
+
+class _BrickPlan(NamedTuple):
+    """Bricks covering a volume, each at the level required where it is.
+
+    Attributes
+    ----------
+    keys : tuple of _BrickKey
+        Bricks covering the volume, from coarse to fine.
+    roots : tuple of _BrickKey
+        Bricks of the coarsest level, which cover the volume while finer
+        bricks are loading.
+    level : int
+        Level the volume is assembled at: the finest level of the bricks,
+        or coarser if the volume would exceed the voxel budget.
+    """
+
+    keys: tuple[_BrickKey, ...]
+    roots: tuple[_BrickKey, ...]
+    level: int
+
+
+class _BrickPatch(NamedTuple):
+    """Part of the bricked volume, resampled from one loaded brick.
+
+    Attributes
+    ----------
+    key : _BrickKey
+        Brick the patch was resampled from.
+    target : tuple of slice
+        Region of the volume the patch covers, along the displayed
+        dimensions in increasing order.
+    data : np.ndarray
+        Values of the region, at the level of the volume.
+    """
+
+    key: _BrickKey
+    target: tuple[slice, ...]
+    data: np.ndarray
+
+
+class _BrickRequest(NamedTuple):
+    """What the planner needs to choose the bricks of a view."""
+
+    data: MultiScaleData
+    shapes: npt.NDArray
+    factors: npt.NDArray
+    displayed: tuple[int, ...]
+    point: tuple[int, ...]
+    levels_for: Callable[[np.ndarray], np.ndarray]
+    notify: Callable[[], None]
+
+
+def screen_footprint(
+    centers: npt.NDArray,
+    radii: npt.NDArray,
+    camera_center: Sequence[float],
+    view_direction: Sequence[float],
+    zoom: float,
+    fov: float,
+    canvas_height: float,
+) -> np.ndarray:
+    """Size in world units of one screen pixel near some 3D points.
+
+    With a perspective camera, the footprint of a pixel grows with the
+    distance from the camera, and is measured at the point of each sphere
+    closest to the camera. Spheres entirely outside the field of view have
+    an infinite footprint.
+
+    Parameters
+    ----------
+    centers : array (N, 3)
+        Centers of spheres in world coordinates.
+    radii : array (N,)
+        Radii of the spheres in world units.
+    camera_center : sequence of float
+        Point the camera looks at, in world coordinates.
+    view_direction : sequence of float
+        Direction the camera looks in.
+    zoom : float
+        Screen pixels per world unit at the camera center.
+    fov : float
+        Field of view of the camera in degrees, 0 for orthographic.
+    canvas_height : float
+        Height of the canvas in screen pixels.
+
+    Returns
+    -------
+    footprint : array (N,)
+    """
+    centers = np.atleast_2d(centers)
+    pixel = 1 / zoom
+    if fov <= 0:
+        return np.full(len(centers), pixel)
+    direction = np.asarray(view_direction, dtype=float)
+    direction = direction / np.linalg.norm(direction)
+    tan_half = math.tan(math.radians(fov) / 2)
+    distance = canvas_height / (2 * zoom * tan_half)
+    eye = np.asarray(camera_center, dtype=float) - direction * distance
+    relative = centers - eye
+    depth = relative @ direction
+    lateral = np.linalg.norm(relative - depth[:, None] * direction, axis=1)
+    near = np.maximum(depth - radii, distance * 1e-3)
+    footprint = pixel * near / distance
+    # The canvas may be wider than high, allow for twice the height.
+    outside = (depth + radii <= 0) | (
+        lateral - radii > 2 * np.abs(depth) * tan_half
+    )
+    footprint[outside] = np.inf
+    return footprint
+
+
+def required_levels(
+    footprint: npt.NDArray, voxel_sizes: npt.NDArray
+) -> np.ndarray:
+    """Coarsest levels whose voxels are not larger than a screen pixel.
+
+    Parameters
+    ----------
+    footprint : array (N,)
+        Size of one screen pixel in world units.
+    voxel_sizes : array (L,)
+        Size of one voxel of each level in world units, increasing.
+
+    Returns
+    -------
+    levels : array (N,) of int
+    """
+    levels = np.searchsorted(voxel_sizes, footprint, side='right') - 1
+    return np.clip(levels, 0, len(voxel_sizes) - 1)
+
+
+class _ImageBricks:
+    """Fixed-size bricks of a multiscale volume, at a level of detail each.
+
+    The coarsest level is split into bricks of ``brick_shape`` voxels.
+    Bricks that need more detail, because they are close to the camera, are
+    replaced by the bricks of the next finer level that cover them, until
+    every brick is at the level it requires or the brick budget is spent.
+    Bricks are read on a thread pool, at most once, and kept in a
+    byte-bounded LRU cache.
+
+    Planning also runs in the background, on a thread of its own: requests
+    made while a plan is being chosen replace each other, so that only the
+    latest view is planned. Bricks of a previous plan that are not being
+    read yet are cancelled. Loaded bricks are resampled, in the background,
+    to the level of the volume, into patches that the layer writes into
+    the volume and uploads one by one. The coarsest bricks are painted
+    first, so that finer bricks are never covered by them.
+
+    Parameters
+    ----------
+    brick_shape : tuple of int
+        Shape of one brick along the displayed dimensions.
+    max_bytes : int
+        Byte budget of the brick cache.
+    max_bricks : int
+        Maximum number of bricks of a plan.
+    max_voxels : int
+        Maximum number of voxels of the assembled volume.
+    max_workers : int, optional
+        Number of bricks read in parallel. Defaults to the number of CPUs,
+        up to 8.
+    """
+
+    def __init__(
+        self,
+        brick_shape: tuple[int, ...] = DEFAULT_BRICK_SHAPE,
+        max_bytes: int = DEFAULT_BRICK_CACHE_BYTES,
+        max_bricks: int = DEFAULT_MAX_BRICKS,
+        max_voxels: int = DEFAULT_MAX_VOLUME_VOXELS,
+        max_workers: int | None = None,
+    ) -> None:
+        self.brick_shape = tuple(brick_shape)
+        self.cache = ByteLRUCache(max_bytes)
+        self.max_bricks = max_bricks
+        self.max_voxels = max_voxels
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._planner: ThreadPoolExecutor | None = None
+        self._in_flight: dict[_BrickKey, Future] = {}
+        self._lock = RLock()
+        # The latest request not planned yet, and whether a planner job is
+        # queued or running, which will plan it.
+        self._request: _BrickRequest | None = None
+        self._planning = False
+        # The current plan and what its patches are made from.
+        self._plan: _BrickPlan | None = None
+        self._current: _BrickRequest | None = None
+        # Bricks of the current volume that have a patch, and the patches
+        # not taken by the layer yet.
+        self._painted: set[_BrickKey] = set()
+        self._patches: list[_BrickPatch] = []
+        self._notified = False
+        # Incremented when the data changes, to drop bricks read before,
+        # and when patches start a new volume.
+        self._generation = 0
+        self._volume = 0
+
+    def reset(self) -> None:
+        """Stop streaming bricks, keeping those already loaded."""
+        with self._lock:
+            for future in self._in_flight.values():
+                future.cancel()
+            self._in_flight.clear()
+            self._volume += 1
+            self._request = None
+            self._plan = None
+            self._current = None
+            self._painted.clear()
+            self._patches.clear()
+            self._notified = False
+
+    def clear(self) -> None:
+        """Forget all loaded bricks, e.g. after the layer data changed."""
+        with self._lock:
+            self.reset()
+            self._generation += 1
+            self.cache.clear()
+
+    def bounds(
+        self,
+        key: _BrickKey,
+        factors: npt.NDArray,
+        displayed: Sequence[int],
+    ) -> np.ndarray:
+        """Half-open bounds (2, 3) of a brick in the data space of level 0."""
+        displayed = list(displayed)
+        size = np.multiply(self.brick_shape, factors[key.level, displayed])
+        start = np.multiply([key.index[d] for d in displayed], size)
+        return np.stack([start, start + size])
+    def _keys(
+        self,
+        level: int,
+        start: Sequence[int],
+        stop: Sequence[int],
+        displayed: Sequence[int],
+        point: Sequence[int],
+        factors: npt.NDArray,
+    ) -> list[_BrickKey]:
+        """Keys of the bricks of a level with grid indices in [start, stop)."""
+        index = [
+            int(p // f) for p, f in zip(point, factors[level], strict=True)
+        ]
+        start = np.asarray(start, dtype=int)
+        keys = []
+        for grid_index in np.ndindex(*(np.asarray(stop, dtype=int) - start)):
+            for axis, i, s in zip(displayed, grid_index, start, strict=True):
+                index[axis] = int(s + i)
+            keys.append(_BrickKey(level, tuple(index)))
+        return keys
+
+    def _grid(
+        self, shape: Sequence[int], displayed: Sequence[int]
+    ) -> np.ndarray:
+        return -(-np.take(shape, displayed) // self.brick_shape)
+
+    def plan(
+        self,
+        shapes: npt.NDArray,
+        factors: npt.NDArray,
+        displayed: Sequence[int],
+        point: Sequence[int],
+        levels_for: Callable[[np.ndarray], np.ndarray],
+    ) -> _BrickPlan:
+        """Choose the bricks covering a volume and the level of each.
+
+        Parameters
+        ----------
+        shapes : array (L, D)
+            Shapes of the levels.
+        factors : array (L, D)
+            Downsampling factors of the levels.
+        displayed : sequence of int
+            Displayed dimensions, in increasing order.
+        point : sequence of int
+            Slice indices in the data space of level 0. Values of displayed
+            dimensions are ignored.
+        levels_for : callable
+            Maps bounds (N, 2, 3) of bricks in the data space of level 0 to
+            the levels (N,) those bricks require.
+
+        Returns
+        -------
+        _BrickPlan
+        """
+        displayed = list(displayed)
+        coarsest = len(shapes) - 1
+        roots = self._keys(
+            coarsest,
+            [0] * len(displayed),
+            self._grid(shapes[coarsest], displayed),
+            displayed,
+            point,
+            factors,
+        )
+        shape0 = np.take(shapes[0], displayed)
+        planned: list[_BrickKey] = []
+        frontier = roots
+        while frontier:
+            bounds = np.stack(
+                [self.bounds(key, factors, displayed) for key in frontier]
+            )
+            bounds[:, 1] = np.minimum(bounds[:, 1], shape0)
+            wanted = np.asarray(levels_for(bounds))
+            missing = wanted - [key.level for key in frontier]
+            count = len(planned) + len(frontier)
+            children: dict[_BrickKey, None] = {}
+            # Refine the bricks lacking the most detail first.
+            for i in np.argsort(missing, kind='stable'):
+                key = frontier[i]
+                if missing[i] < 0:
+                    level = key.level - 1
+                    size = np.multiply(
+                        self.brick_shape, factors[level, displayed]
+                    )
+                    start = bounds[i, 0] // size
+                    stop = np.minimum(
+                        -(-bounds[i, 1] // size),
+                        self._grid(shapes[level], displayed),
+                    )
+                    new = self._keys(
+                        level, start, stop, displayed, point, factors
+                    )
+                    if count - 1 + len(new) <= self.max_bricks:
+                        children.update(dict.fromkeys(new))
+                        count += len(new) - 1
+                        continue
+                planned.append(key)
+            frontier = list(children)
+
+        planned.sort(key=lambda key: -key.level)
+        level = min((key.level for key in planned), default=coarsest)
+        while level < coarsest and (
+            math.prod(np.take(shapes[level], displayed)) > self.max_voxels
+        ):
+            level += 1
+        return _BrickPlan(tuple(planned), tuple(roots), level)
+
+    def fetch(
+        self,
+        data: MultiScaleData,
+        key: _BrickKey,
+        displayed: Sequence[int],
+    ) -> np.ndarray:
+        """Read one brick from the data and keep it in the cache.
+
+        This may be slow and can be called from a non-main thread.
+        """
+        brick = self.cache.get(key)
+        if brick is None:
+            brick = self._read(data, key, displayed)
+            self.cache.put(key, brick)
+        return brick
+
+    def _read(
+        self,
+        data: MultiScaleData,
+        key: _BrickKey,
+        displayed: Sequence[int],
+    ) -> np.ndarray:
+        shape = data[key.level].shape
+        slices: list[int | slice] = list(key.index)
+        for axis, size in zip(displayed, self.brick_shape, strict=True):
+            start = key.index[axis] * size
+            slices[axis] = slice(start, min(start + size, shape[axis]))
+        return np.asarray(data[key.level][tuple(slices)])
+
+    def request(self, request: _BrickRequest) -> None:
+        """Plan the bricks of a view and stream them in the background.
+
+        ``request.notify`` is called from a background thread when patches
+        are ready to be taken with ``take_patches``, and not again until
+        they are taken.
+        """
+        with self._lock:
+            self._request = request
+            if self._planning:
+                return
+            self._planning = True
+            if self._planner is None:
+                self._planner = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='brick-plan'
+                )
+            self._planner.submit(self._plan_requests)
+
+    def _plan_requests(self) -> None:
+        """Plan the latest request until no newer request is made."""
+        while True:
+            with self._lock:
+                request, self._request = self._request, None
+                if request is None:
+                    self._planning = False
+                    return
+                generation = self._generation
+            try:
+                plan = self.plan(
+                    request.shapes,
+                    request.factors,
+                    request.displayed,
+                    request.point,
+                    request.levels_for,
+                )
+                with self._lock:
+                    if generation != self._generation:
+                        continue
+                    notify = self._switch(request, plan)
+                if notify:
+                    request.notify()
+            except Exception:
+                logger.exception('Could not plan the bricks of the view')
+
+    def _switch(self, request: _BrickRequest, plan: _BrickPlan) -> bool:
+        """Make a plan current, return True if the layer must be notified.
+
+        The lock must be held.
+        """
+        previous = self._plan
+        if plan == previous:
+            self._current = request
+            return False
+        wanted = set(plan.roots) | set(plan.keys)
+        for key, future in list(self._in_flight.items()):
+            if key not in wanted:
+                # Cancelled futures are forgotten by their done callback.
+                future.cancel()
+        if (
+            previous is not None
+            and previous.level == plan.level
+            and previous.roots == plan.roots
+        ):
+            # Same volume: bricks that stay keep their patch.
+            self._painted &= wanted
+            self._patches = [p for p in self._patches if p.key in wanted]
+        else:
+            self._volume += 1
+            self._painted.clear()
+            self._patches.clear()
+        self._plan = plan
+        self._current = request
+        for key in dict.fromkeys(plan.roots + plan.keys):
+            if key not in self._painted and key not in self.cache:
+                self._load(key)
+        return self._paint_loaded()
+
+    def _load(self, key: _BrickKey) -> None:
+        """Start reading a brick of the current plan. The lock must be held."""
+        if key in self._in_flight:
+            return
+        request = cast(_BrickRequest, self._current)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix='bricks'
+            )
+        future = self._executor.submit(
+            self._fetch_and_paint,
+            self._generation,
+            request.data,
+            key,
+            request.displayed,
+        )
+        self._in_flight[key] = future
+        future.add_done_callback(lambda f, key=key: self._done(key, f))
+
+    def _done(self, key: _BrickKey, future: Future) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def _fetch_and_paint(
+        self,
+        generation: int,
+        data: MultiScaleData,
+        key: _BrickKey,
+        displayed: Sequence[int],
+    ) -> None:
+        brick = self._read(data, key, displayed)
+        with self._lock:
+            if generation != self._generation:
+                # The data changed while the brick was read.
+                return
+            self.cache.put(key, brick)
+            notify = self._paint_loaded({key: brick})
+            request = self._current
+        if notify and request is not None:
+            request.notify()
+
+    def _paint_loaded(
+        self, loaded: dict[_BrickKey, np.ndarray] | None = None
+    ) -> bool:
+        """Make the patches of the loaded bricks of the current plan.
+
+        Finer bricks are only painted once all the coarsest bricks are, so
+        that they are never covered by them. Returns True if the layer must
+        be notified of new patches. The lock must be held.
+        """
+        plan = self._plan
+        if plan is None:
+            return False
+        loaded = loaded or {}
+        count = len(self._patches)
+        roots = set(plan.roots)
+        for key in dict.fromkeys(plan.roots + plan.keys):
+            if key not in roots and not roots <= self._painted:
+                break
+            if key in self._painted:
+                continue
+            brick = loaded.get(key)
+            if brick is None:
+                brick = self.cache.get(key)
+            if brick is None:
+                # Evicted since it was read, or not read yet.
+                self._load(key)
+                continue
+            patch = self._resample(key, brick)
+            if patch.data.size:
+                self._patches.append(patch)
+            self._painted.add(key)
+        if len(self._patches) == count or self._notified:
+            return False
+        self._notified = True
+        return True
+
+    def _resample(self, key: _BrickKey, brick: np.ndarray) -> _BrickPatch:
+        """Resample a brick to the level of the current plan.
+
+        Bricks are resampled with nearest neighbour interpolation. Trailing
+        non-spatial axes of the data, e.g. RGB channels, are preserved.
+        """
+        plan = cast(_BrickPlan, self._plan)
+        request = cast(_BrickRequest, self._current)
+        displayed = list(request.displayed)
+        factors = request.factors
+        out_shape = np.take(request.shapes[plan.level], displayed)
+        out_factors = factors[plan.level, displayed]
+        start = self.bounds(key, factors, displayed)[0]
+        factor = factors[key.level, displayed]
+        target = []
+        sources = []
+        for axis in range(len(displayed)):
+            stop = start[axis] + brick.shape[axis] * factor[axis]
+            first = round(start[axis] / out_factors[axis])
+            last = min(round(stop / out_factors[axis]), int(out_shape[axis]))
+            centers = (np.arange(first, last) + 0.5) * out_factors[axis]
+            source = (centers - start[axis]) // factor[axis]
+            target.append(slice(first, last))
+            sources.append(
+                np.clip(source, 0, brick.shape[axis] - 1).astype(int)
+            )
+        return _BrickPatch(key, tuple(target), brick[np.ix_(*sources)])
+
+    def take_patches(
+        self,
+    ) -> tuple[_BrickPlan | None, int, list[_BrickPatch]]:
+        """Take the patches made since the last call.
+
+        Returns
+        -------
+        plan : _BrickPlan or None
+            The current plan, None if bricks are not streamed.
+        volume : int
+            Identifies the volume the patches are part of. Patches of a new
+            volume start from an empty volume, at the level of the plan.
+        patches : list of _BrickPatch
+            Patches to write into the volume, in order.
+        """
+        with self._lock:
+            patches, self._patches = self._patches, []
+            self._notified = False
+            return self._plan, self._volume, patches
@@ -0,0 +1,411 @@
+"""Incremental projection of thick slices along a sliding window.
+
+Stepping through a thick slice moves its window by one plane along the
+projected axis. Instead of reading and reducing the whole window again, the
+projection keeps its state from the previous window: sums are updated by
+adding the incoming planes and subtracting the outgoing ones, and maxima and
+minima are kept in a deque of partial aggregates, so each step costs about
+one plane.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from collections.abc import Callable, Sequence
+from threading import Lock
+from typing import Any
+
+import numpy as np
+
+from minapari.layers.image._image_constants import ImageProjectionMode
+from minapari.utils._cache import ByteLRUCache
+
+#: Memory budget of the state of the projection of each layer: the running
+#: sum or the partial maxima or minima, and the planes of the window, which
+#: otherwise need to be read again when they leave the window.
+DEFAULT_PLANE_CACHE_BYTES = 256 * 2**20
+
+
+class _AggregateDeque:
+    """Deque of planes that keeps their element-wise maximum or minimum.
+
+    This is the two stacks queue, extended to both ends: each stack stores,
+    for every plane, the aggregate of that plane and all planes between it
+    and the middle of the deque. Only aggregates are stored. When one stack
+    is empty, the planes of the other are read again to split it in halves,
+    which costs one plane read per pop, amortized.
+
+    Parameters
+    ----------
+    reduce : callable
+        Element-wise aggregate of two planes, ``np.maximum`` or
+        ``np.minimum``.
+    read : callable
+        Returns the plane of an index.
+    start : int
+        Index of the first plane, for an empty deque.
+    """
+
+    def __init__(
+        self,
+        reduce: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        read: Callable[[int], np.ndarray],
+        start: int,
+    ) -> None:
+        self._reduce = reduce
+        self._read = read
+        # The top of each stack is the plane at that end of the deque.
+        self._front: list[np.ndarray] = []
+        self._back: list[np.ndarray] = []
+        self.start = start
+        self.stop = start
+
+    def _push(self, stack: list[np.ndarray], plane: np.ndarray) -> None:
+        stack.append(self._reduce(stack[-1], plane) if stack else plane)
+
+    def push_front(self, plane: np.ndarray) -> None:
+        self._push(self._front, plane)
+        self.start -= 1
+
+    def push_back(self, plane: np.ndarray) -> None:
+        self._push(self._back, plane)
+        self.stop += 1
+
+    def _rebalance(self) -> None:
+        """Split the planes between both stacks again."""
+        middle = (self.start + self.stop) // 2
+        self._front, self._back = [], []
+        for index in reversed(range(self.start, middle)):
+            self._push(self._front, self._read(index))
+        for index in range(middle, self.stop):
+            self._push(self._back, self._read(index))
+
+    def pop_front(self) -> None:
+        if not self._front:
+            self._rebalance()
+        if self._front:
+            self._front.pop()
+        else:
+            # A single plane is in the back stack.
+            self._back.pop()
+        self.start += 1
+
+    def pop_back(self) -> None:
+        if not self._back:
+            self._rebalance()
+        self._back.pop()
+        self.stop -= 1
+
+    def aggregate(self) -> np.ndarray:
+        """Aggregate of all planes, as a new array."""
+        if self._front and self._back:
+            return self._reduce(self._front[-1], self._back[-1])
+        return np.array((self._front or self._back)[-1])
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of the partial aggregates."""
+        return sum(a.nbytes for a in self._front) + sum(
+            a.nbytes for a in self._back
+        )
+
+
+class _SlidingProjection:
+    """Projection of a thick slice updated as its window slides.
+
+    One window is kept per layer, with the fixed indices of the other axes
+    and the projection mode that it was computed for. A new window that
+    overlaps it, by more than half, is projected by updating it. This
+    runs where slice requests run, which is a slicing thread for
+    asynchronous slicing, and is thread-safe.
+
+    The partial aggregates of a maximum or minimum take one plane per plane
+    of the window. Windows whose aggregates do not fit in the budget are
+    projected the usual way, and the planes kept get what the aggregates
+    leave of it.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Memory budget of the projection state and of the planes of the
+        window kept in memory.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PLANE_CACHE_BYTES) -> None:
+        self._lock = Lock()
+        self._max_bytes = max_bytes
+        self._planes = ByteLRUCache(max_bytes)
+        self._data: Any = None
+        self._key: tuple | None = None
+        self._start = 0
+        self._stop = 0
+        self._total: np.ndarray | None = None
+        self._deque: _AggregateDeque | None = None
+
+    def clear(self) -> None:
+        """Forget the window, e.g. because the data changed."""
+        with self._lock:
+            self._planes.clear()
+            self._data = None
+            self._key = None
+            self._total = None
+            self._deque = None
+
+    def prepare(self, request: Any) -> Any:
+        """Project a thick slice request, if it can be done incrementally.
+
+        Parameters
+        ----------
+        request : callable
+            Slice request of a scalar field layer.
+
+        Returns
+        -------
+        callable
+            The request with its data replaced by the projected slice and no
+            projection left to do, or the request unchanged if it does not
+            project a single-scale thick slice along one axis.
+        """
+        fields = ('data', 'data_slice', 'slice_input', 'projection_mode')
+        if (
+            not dataclasses.is_dataclass(request)
+            or getattr(request, 'multiscale', True)
+            or not all(hasattr(request, f) for f in fields)
+        ):
+            return request
+        mode = ImageProjectionMode(str(request.projection_mode))
+        if mode == ImageProjectionMode.NONE:
+            return request
+        data = request.data
+        displayed = sorted(request.slice_input.displayed)
+        shape = tuple(data.shape)
+        # The same window as the thick slice that the request would read.
+        bounds = {}
+        for axis, (point, left, right) in enumerate(
+            zip(
+                request.data_slice.point,
+                request.data_slice.margin_left,
+                request.data_slice.margin_right,
+                strict=True,
+            )
+        ):
+            if axis in displayed:
+                continue
+            low = min(max(int(np.round(point - left)), 0), shape[axis] - 1)
+            high = min(int(np.round(point + right)) + 1, shape[axis])
+            bounds[axis] = (low, max(high, low + 1))
+        thick = [a for a, (low, high) in bounds.items() if high > low + 1]
+        if len(thick) != 1:
+            return request
+        axis = thick[0]
+        if mode in (ImageProjectionMode.MAX, ImageProjectionMode.MIN):
+            low, high = bounds[axis]
+            plane_bytes = np.dtype(data.dtype).itemsize * math.prod(
+                shape[a] for a in displayed
+            )
+            if (high - low) * plane_bytes > self._max_bytes:
+                return request
+        fixed = tuple((a, b[0]) for a, b in bounds.items() if a != axis)
+        projected = self.project(
+            data, axis, bounds[axis], fixed, tuple(displayed), mode
+        )
+        return dataclasses.replace(
+            request,
+            data=_ProjectedData(projected, shape, displayed),
+            projection_mode=ImageProjectionMode.NONE,
+        )
+
+    def project(
+        self,
+        data: Any,
+        axis: int,
+        window: tuple[int, int],
+        fixed: tuple[tuple[int, int], ...],
+        displayed: tuple[int, ...],
+        mode: ImageProjectionMode,
+    ) -> np.ndarray:
+        """Project a window of planes of the data.
+
+        Parameters
+        ----------
+        data : array
+            Data to project.
+        axis : int
+            Axis along which the window slides.
+        window : tuple of int
+            First and last plus one index of the window along the axis.
+        fixed : tuple of (int, int)
+            Axis and index of the other axes that are not displayed.
+        displayed : tuple of int
+            Displayed axes, read in full, in increasing order.
+        mode : ImageProjectionMode
+            SUM, MEAN, MAX or MIN.
+
+        Returns
+        -------
+        np.ndarray
+            The projection over the displayed axes, as ``project_slice``
+            would compute it.
+        """
+        start, stop = window
+        key = (axis, fixed, displayed, mode)
+        with self._lock:
+            if (
+                self._data is not data
+                or self._key != key
+                # Updating is only worth it when most of the window stays.
+                or abs(start - self._start) + abs(stop - self._stop)
+                >= stop - start
+            ):
+                self._reset(data, key, start, stop)
+            else:
+                self._slide(start, stop)
+            self._fit_budget()
+            return self._result(mode)
+
+    def _fit_budget(self) -> None:
+        """Give the planes what the projection state leaves of the budget."""
+        state = 0
+        if self._deque is not None:
+            state += self._deque.nbytes
+        if self._total is not None:
+            state += self._total.nbytes
+        self._planes.resize(max(self._max_bytes - state, 0))
+
+    def _plane_key(self, index: int) -> tuple:
+        axis, fixed, _, _ = self._key  # type: ignore[misc]
+        ndim = len(self._data.shape)
+        key: list[Any] = [slice(None)] * ndim
+        for a, i in fixed:
+            key[a] = i
+        key[axis] = index
+        return tuple(key)
+
+    def _read(self, index: int) -> np.ndarray:
+        """Read a plane, from memory if it was kept."""
+        plane = self._planes.get(index)
+        if plane is None:
+            plane = np.asarray(self._data[self._plane_key(index)])
+            self._planes.put(index, plane)
+        return plane
+
+    def _reset(self, data: Any, key: tuple, start: int, stop: int) -> None:
+        """Read the whole window at once and project it."""
+        axis, _, _, mode = key
+        self._planes.clear()
+        self._data = data
+        self._key = key
+        block_key = list(self._plane_key(start))
+        block_key[axis] = slice(start, stop)
+        block = np.asarray(data[tuple(block_key)])
+        # The window axis is the first one left after the fixed indices.
+        position = sum(isinstance(k, slice) for k in block_key[:axis])
+        # Copy the planes, views would keep the whole block in memory.
+        planes = [plane.copy() for plane in np.moveaxis(block, position, 0)]
+        for offset, plane in enumerate(planes):
+            self._planes.put(start + offset, plane)
+        self._start, self._stop = start, stop
+        if mode in (ImageProjectionMode.SUM, ImageProjectionMode.MEAN):
+            self._deque = None
+            self._total = block.sum(
+                axis=position, dtype=_sum_dtype(block.dtype)
+            )
+            return
+        self._total = None
+        reduce = np.maximum if mode == ImageProjectionMode.MAX else np.minimum
+        self._deque = _AggregateDeque(reduce, self._read, start)
+        for plane in planes:
+            self._deque.push_back(plane)
+
+    def _slide(self, start: int, stop: int) -> None:
+        """Move the window, one plane at a time."""
+        if self._deque is not None:
+            deque = self._deque
+            while deque.start > start:
+                deque.push_front(self._read(deque.start - 1))
+            while deque.stop < stop:
+                deque.push_back(self._read(deque.stop))
+            while deque.start < start:
+                deque.pop_front()
+            while deque.stop > stop:
+                deque.pop_back()
+            self._start, self._stop = start, stop
+            return
+
+        total = self._total
+        outgoing = [*range(self._start, min(start, self._stop))]
+        outgoing += range(max(stop, self._start), self._stop)
+        incoming = [*range(start, min(self._start, stop))]
+        incoming += range(max(self._stop, start), stop)
+        for index in outgoing:
+            plane = self._read(index)
+            if plane.dtype.kind in 'fc' and not np.isfinite(plane).all():
+                # inf - inf is nan: sum the window again instead.
+                self._reset(self._data, self._key, start, stop)
+                return
+            np.subtract(total, plane, out=total, casting='unsafe')
+        for index in incoming:
+            np.add(total, self._read(index), out=total, casting='unsafe')
+        for index in outgoing:
+            self._planes.pop(index)
+        self._start, self._stop = start, stop
+
+    def _result(self, mode: ImageProjectionMode) -> np.ndarray:
+        if self._deque is not None:
+            return self._deque.aggregate()
+        total = self._total
+        dtype = np.dtype(self._data.dtype)
+        if mode == ImageProjectionMode.SUM:
+            return total.astype(np.sum(np.zeros(1, dtype)).dtype)
+        count = self._stop - self._start
+        return (total / count).astype(np.mean(np.zeros(1, dtype)).dtype)
+
+
+def _sum_dtype(dtype: np.dtype) -> np.dtype:
+    """Exact accumulator of a sum: 64 bit integers, or float64."""
+    if dtype.kind == 'u':
+        return np.dtype(np.uint64)
+    if dtype.kind in 'ib':
+        return np.dtype(np.int64)
+    if dtype.kind == 'c':
+        return np.dtype(np.complex128)
+    return np.dtype(np.float64)
+
+
+# note: this implements `LayerDataProtocol`, but we don't need to inherit.
+class _ProjectedData:
+    """Stands in for the data of a request whose projection is computed.
+
+    Indexing it with integers along the axes that are not displayed, as
+    the request does when it has no projection to do, returns the
+    projection.
+    """
+
+    def __init__(
+        self,
+        projected: np.ndarray,
+        shape: tuple[int, ...],
+        displayed: Sequence[int],
+    ) -> None:
+        self._projected = projected
+        self._displayed = tuple(displayed)
+        self.shape = shape
+        self.dtype = projected.dtype
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if not isinstance(key, tuple):
+            key = (key,)
+        key = key + (slice(None),) * (self.ndim - len(key))
+        return self._projected[tuple(key[a] for a in self._displayed)]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.asarray(self._projected, dtype=dtype)
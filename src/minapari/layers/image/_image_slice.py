@@ -0,0 +1,225 @@
+"""Image slice requests and responses that carry a histogram of the slice."""
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from minapari.layers._scalar_field._slice import _ScalarFieldSliceResponse
+from minapari.layers.image._image_projection import _SlidingProjection
+from minapari.layers.image._image_tiles import (
+    _ImageTiles,
+    _TiledData,
+    _TileLayout,
+)
+from minapari.layers.utils._data_range import _histogram
+
+#: Number of bins of slice histograms.
+SLICE_HISTOGRAM_BINS = 256
+#: Maximum number of values used to count a slice histogram. Larger slices
+#: are subsampled with a stride, the range is always computed on all values.
+SLICE_HISTOGRAM_MAX_VALUES = 2**20
+
+
+class SliceHistogram(NamedTuple):
+    """Histogram of the values of an image slice.
+
+    Attributes
+    ----------
+    counts : np.ndarray
+        Number of values in each bin.
+    bin_edges : np.ndarray
+        Edges of the uniform bins, one more than ``counts``.
+    min : float
+        Minimum finite value of the slice.
+    max : float
+        Maximum finite value of the slice.
+    """
+
+    counts: np.ndarray
+    bin_edges: np.ndarray
+    min: float
+    max: float
+
+    def percentile(self, q: float) -> float:
+        """Approximate percentile of the values, from 0 to 100.
+
+        Values are assumed to be uniformly distributed within each bin.
+        """
+        if q <= 0:
+            return self.min
+        if q >= 100:
+            return self.max
+        cumulative = np.cumsum(self.counts)
+        total = cumulative[-1]
+        if total == 0:
+            return self.min
+        target = q / 100 * total
+        index = int(np.searchsorted(cumulative, target))
+        before = cumulative[index - 1] if index > 0 else 0
+        fraction = (target - before) / max(self.counts[index], 1)
+        low, high = self.bin_edges[index], self.bin_edges[index + 1]
+        value = low + fraction * (high - low)
+        return float(np.clip(value, self.min, self.max))
+
+    def limits(self, percentiles: tuple[float, float]) -> tuple[float, float]:
+        """Contrast limits clipping the given lower and upper percentiles."""
+        low = self.percentile(percentiles[0])
+        high = self.percentile(percentiles[1])
+        if high <= low:
+            low, high = self.min, self.max
+        if low == high:
+            low, high = min(low, 0), max(high, 1)
+        return low, high
+
+
+def slice_histogram(
+    data: np.ndarray,
+    bins: int = SLICE_HISTOGRAM_BINS,
+    max_values: int = SLICE_HISTOGRAM_MAX_VALUES,
+) -> SliceHistogram | None:
+    """Compute the histogram of an image slice.
+
+    This may be slow and can be called from a non-main thread.
+
+    Returns
+    -------
+    SliceHistogram or None
+        None if the slice has no finite values.
+    """
+    values = np.asarray(data)
+    if values.dtype == bool:
+        values = values.view(np.uint8)
+    values = values.ravel()
+    if values.size == 0:
+        return None
+    low, high = values.min(), values.max()
+    if not (np.isfinite(low) and np.isfinite(high)):
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return None
+        low, high = values.min(), values.max()
+    stride = -(-values.size // max_values)
+    low, high = float(low), float(high)
+    counts, edges = _histogram(values[::stride], bins, low, high)
+    return SliceHistogram(counts, edges, low, high)
+
+
+@dataclass(frozen=True)
+class _ImageSliceResponse(_ScalarFieldSliceResponse):
+    """Slice response of an image layer, with a histogram of the slice.
+
+    Attributes
+    ----------
+    histogram : SliceHistogram, optional
+        Histogram of the sliced values. None for RGB images and empty
+        slices.
+    tiles : _TileLayout, optional
+        Tiles the 2D slice of a multiscale image is made of, starting at
+        the first pixel of the slice. None for other slices.
+    """
+
+    histogram: SliceHistogram | None = None
+    tiles: _TileLayout | None = None
+
+    @property
+    def provisional(self) -> bool:
+        """True if some tiles are filled from coarser levels for now."""
+        return self.tiles is not None and bool(self.tiles.pending)
+
+
+class _ImageSliceRequest:
+    """Slice request that can also compute the histogram of the slice.
+
+    The histogram is computed where the request runs, which is a slicing
+    thread for asynchronous slicing.
+
+    Parameters
+    ----------
+    request : callable
+        The scalar field slice request to wrap.
+    rgb : bool
+        True if the image is RGB, in which case no histogram is computed.
+    projection : _SlidingProjection, optional
+        Projection of the thick slices of the layer, updated incrementally
+        as the window slides.
+    tiles : _ImageTiles, optional
+        Tiles of a multiscale layer. 2D slices are read through them, so
+        that only the tiles that are not cached yet are read.
+    fill_tiles : bool
+        If True, tiles that are not cached are filled from coarser levels
+        and read in the background. Otherwise they are read by the request.
+    histogram : bool
+        If False, no histogram is computed, e.g. because the contrast
+        limits do not follow the slice.
+    """
+
+    def __init__(
+        self,
+        request: Any,
+        rgb: bool,
+        projection: _SlidingProjection | None = None,
+        tiles: _ImageTiles | None = None,
+        fill_tiles: bool = True,
+        histogram: bool = True,
+    ) -> None:
+        self.id = request.id
+        self._request = request
+        self._rgb = rgb
+        self._histogram = histogram
+        self._projection = projection
+        self._tiles = tiles
+        self._fill_tiles = fill_tiles
+
+    def __call__(self) -> _ImageSliceResponse:
+        request = self._request
+        if self._projection is not None:
+            request = self._projection.prepare(request)
+        tiled = None
+        if self._tiles is not None and self._reads_tiles(request):
+            slice_input = request.slice_input
+            tiled = _TiledData(
+                self._tiles,
+                request.data,
+                slice_input.displayed,
+                len(slice_input.order),
+                fill=self._fill_tiles,
+            )
+            request = dataclasses.replace(request, data=tiled)
+        response = request()
+        histogram = None
+        if self._histogram and not (self._rgb or response.empty):
+            histogram = slice_histogram(response.image.raw)
+        fields = {
+            f.name: getattr(response, f.name)
+            for f in dataclasses.fields(response)
+        }
+        return _ImageSliceResponse(
+            **fields,
+            histogram=histogram,
+            tiles=None if tiled is None else self._layout(request, tiled),
+        )
+
+    @staticmethod
+    def _layout(request: Any, tiled: _TiledData) -> _TileLayout | None:
+        """Layout of the region read for the slice, not the thumbnail."""
+        displayed = sorted(request.slice_input.displayed)
+        origin = tuple(
+            int(i) for i in np.asarray(request.corner_pixels)[0, displayed]
+        )
+        for layout in tiled.layouts:
+            if layout.level == request.data_level and layout.origin == origin:
+                return layout
+        return None
+
+    def _reads_tiles(self, request: Any) -> bool:
+        """True if a request reads a 2D region of multiscale data."""
+        return (
+            dataclasses.is_dataclass(request)
+            and getattr(request, 'multiscale', False)
+            and request.slice_input.ndisplay
+            == len(self._tiles.tile_shape)  # type: ignore[union-attr]
+        )
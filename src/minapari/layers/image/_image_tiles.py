@@ -0,0 +1,602 @@
+"""Tile bookkeeping for 2D rendering of multiscale images."""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from minapari.layers._virtual_data import _expand_key, _is_basic_key
+from minapari.layers.utils.layer_utils import (
+    compute_tile_indices,
+    snap_corners_to_tiles,
+)
+from minapari.utils._cache import ByteLRUCache
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from minapari.layers._multiscale_data import MultiScaleData
+
+
+logger = logging.getLogger(__name__)
+
+#: Default shape of one tile along the displayed dimensions.
+DEFAULT_TILE_SHAPE = (512, 512)
+#: Default byte budget for the tiles kept in memory by one layer.
+DEFAULT_TILE_CACHE_BYTES = 256 * 2**20
+
+
+class _TileKey(NamedTuple):
+    """Identifies one tile of a multiscale image.
+
+    Attributes
+    ----------
+    level : int
+        Level of the multiscale the tile belongs to.
+    index : tuple of int
+        For displayed dimensions, the index of the tile on the tile grid.
+        For non-displayed dimensions, the data index of the slice at that
+        level.
+    """
+
+    level: int
+    index: tuple[int, ...]
+
+
+class _TileLayout(NamedTuple):
+    """Tiles a 2D region of a level is made of.
+
+    Attributes
+    ----------
+    level : int
+        Level of the multiscale the region was read from.
+    origin : tuple of int
+        Index in the level of the first pixel of the region, along the
+        displayed dimensions in increasing order.
+    shape : tuple of int
+        Shape of the level along the displayed dimensions.
+    tile_shape : tuple of int
+        Shape of a whole tile.
+    keys : tuple of _TileKey
+        Tiles overlapping the region.
+    pending : frozenset of _TileKey
+        Tiles filled from a coarser level while they are being read.
+    generation : int
+        Generation of the tile cache. Tiles with the same key but another
+        generation may hold other data.
+    """
+
+    level: int
+    origin: tuple[int, ...]
+    shape: tuple[int, ...]
+    tile_shape: tuple[int, ...]
+    keys: tuple[_TileKey, ...]
+    pending: frozenset[_TileKey]
+    generation: int
+
+
+class _ImageTiles:
+    """Fixed-size tiles of a multiscale image, fetched on demand.
+
+    The visible region of the selected level is split into tiles of
+    ``tile_shape`` pixels. Each tile is read from the data at most once and
+    then kept in a byte-bounded LRU cache, so that panning only reads the
+    tiles that newly enter the field of view. Tiles that are not loaded yet
+    are filled from coarser levels and read in the background, which gives
+    a coarse-to-fine display while finer tiles stream in.
+
+    Parameters
+    ----------
+    tile_shape : tuple of int
+        Shape of one tile along the displayed dimensions.
+    max_bytes : int
+        Byte budget of the tile cache.
+    notify : callable, optional
+        Called without arguments from a loading thread when tiles read in
+        the background are in the cache.
+    """
+
+    def __init__(
+        self,
+        tile_shape: tuple[int, ...] = DEFAULT_TILE_SHAPE,
+        max_bytes: int = DEFAULT_TILE_CACHE_BYTES,
+        notify: Callable[[], None] | None = None,
+    ) -> None:
+        self.tile_shape = tuple(tile_shape)
+        self.cache = ByteLRUCache(max_bytes)
+        self.notify = notify
+        # Bumped when the cache is cleared, so that reads of the previous
+        # data are not cached.
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        # Generation of the tiles being read in the background.
+        self._in_flight: dict[_TileKey, int] = {}
+        # Tiles still to be read for the latest view.
+        self._wanted: frozenset[_TileKey] = frozenset()
+
+    def clear(self) -> None:
+        """Forget all loaded tiles, e.g. after the layer data changed.
+
+        Tiles that are being read are not cached.
+        """
+        with self._lock:
+            self.generation += 1
+            self._in_flight.clear()
+            self._wanted = frozenset()
+            self.cache.clear()
+
+    def snap_corners(
+        self,
+        corners: npt.NDArray,
+        shape: Sequence[int],
+        displayed: Sequence[int],
+    ) -> npt.NDArray:
+        """Expand corner pixels of one level to whole tiles on displayed axes.
+
+        Parameters
+        ----------
+        corners : array (2, D)
+            Inclusive corner pixels in the data space of the level.
+        shape : tuple of int
+            Shape of the level data.
+        displayed : sequence of int
+            Displayed dimensions.
+
+        Returns
+        -------
+        corners : array (2, D)
+            Inclusive corner pixels aligned with the tile grid.
+        """
+        corners = np.array(corners, dtype=int)
+        displayed = list(displayed)
+        corners[:, displayed] = snap_corners_to_tiles(
+            corners[:, displayed],
+            self.tile_shape,
+            np.take(shape, displayed),
+        )
+        return corners
+
+    def tile_keys(
+        self,
+        level: int,
+        corners: npt.NDArray,
+        displayed: Sequence[int],
+        point: Sequence[int],
+    ) -> list[_TileKey]:
+        """Keys of the tiles overlapping the corners of a level.
+
+        Parameters
+        ----------
+        level : int
+            Level of the multiscale.
+        corners : array (2, D)
+            Inclusive corner pixels in the data space of the level.
+        displayed : sequence of int
+            Displayed dimensions.
+        point : sequence of int
+            Slice indices in the data space of the level. Values of displayed
+            dimensions are ignored.
+
+        Returns
+        -------
+        keys : list of _TileKey
+        """
+        displayed = list(displayed)
+        corners = np.asarray(corners)
+        keys = []
+        for grid_index in compute_tile_indices(
+            corners[:, displayed], self.tile_shape
+        ):
+            index = [int(p) for p in point]
+            for axis, i in zip(displayed, grid_index, strict=True):
+                index[axis] = i
+            keys.append(_TileKey(level, tuple(index)))
+        return keys
+
+    def fetch(
+        self,
+        data: MultiScaleData,
+        key: _TileKey,
+        displayed: Sequence[int],
+    ) -> np.ndarray:
+        """Read one tile from the data and keep it in the cache.
+
+        This may be slow and can be called from a non-main thread.
+        """
+        tile = self.cache.get(key)
+        if tile is not None:
+            return tile
+        generation = self.generation
+        slices = self._tile_slices(data, key, displayed)
+        tile = np.asarray(data[key.level][slices])
+        with self._lock:
+            if generation == self.generation:
+                self.cache.put(key, tile)
+        return tile
+
+    def load(
+        self,
+        data: MultiScaleData,
+        keys: Sequence[_TileKey],
+        displayed: Sequence[int],
+    ) -> None:
+        """Read tiles in the background, then call ``notify``.
+
+        Tiles that are already being read are skipped, as are tiles that
+        are no longer wanted by the time their turn comes.
+        """
+        with self._lock:
+            generation = self.generation
+            self._wanted = frozenset(keys)
+            new = [key for key in keys if key not in self._in_flight]
+            if not new:
+                return
+            for key in new:
+                self._in_flight[key] = generation
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='tile-load'
+                )
+            self._executor.submit(
+                self._load, generation, data, new, list(displayed)
+            )
+
+    def _load(
+        self,
+        generation: int,
+        data: MultiScaleData,
+        keys: list[_TileKey],
+        displayed: list[int],
+    ) -> None:
+        loaded = False
+        try:
+            for key in keys:
+                with self._lock:
+                    if generation != self.generation:
+                        return
+                    if key not in self._wanted:
+                        continue
+                tile = np.asarray(
+                    data[key.level][self._tile_slices(data, key, displayed)]
+                )
+                with self._lock:
+                    if generation != self.generation:
+                        return
+                    self.cache.put(key, tile)
+                    loaded = True
+        except Exception:
+            logger.exception('Reading image tiles failed')
+        finally:
+            with self._lock:
+                for key in keys:
+                    if self._in_flight.get(key) == generation:
+                        del self._in_flight[key]
+                current = generation == self.generation
+        if loaded and current and self.notify is not None:
+            self.notify()
+
+    def read_region(
+        self,
+        data: MultiScaleData,
+        level: int,
+        corners: npt.NDArray,
+        displayed: Sequence[int],
+        point: Sequence[int],
+        fill: bool = False,
+    ) -> tuple[np.ndarray, _TileLayout]:
+        """Assemble the displayed region of a level from its tiles.
+
+        Only tiles that are not in the cache are read from ``data``.
+
+        Parameters
+        ----------
+        data : MultiScaleData
+            The multiscale data of the layer.
+        level : int
+            Level of the multiscale to read.
+        corners : array (2, D)
+            Inclusive corner pixels in the data space of the level. They are
+            expanded to whole tiles.
+        displayed : sequence of int
+            Displayed dimensions, in increasing order.
+        point : sequence of int
+            Slice indices in the data space of the level.
+        fill : bool
+            If True, tiles that are not cached are filled from coarser
+            levels and read in the background. Otherwise they are read
+            before returning.
+
+        Returns
+        -------
+        region : np.ndarray
+            The data of the tile-aligned region. Trailing non-spatial axes of
+            the data, e.g. RGB channels, are preserved.
+        layout : _TileLayout
+            The tiles of the region, starting at its first pixel.
+        """
+        displayed = list(displayed)
+        generation = self.generation
+        shape = data[level].shape
+        corners = self.snap_corners(corners, shape, displayed)
+        keys = self.tile_keys(level, corners, displayed, point)
+        tiles = {}
+        pending = []
+        for key in keys:
+            tile = self.cache.get(key)
+            if tile is None and fill:
+                tile = self._from_coarser(data, key, displayed)
+                if tile is not None:
+                    pending.append(key)
+            if tile is None:
+                tile = self.fetch(data, key, displayed)
+            tiles[key] = tile
+        if fill and level < len(data) - 1:
+            self.load(data, pending, displayed)
+        region = self._assemble(tiles, corners, displayed, data[level].dtype)
+        layout = _TileLayout(
+            level=level,
+            origin=tuple(corners[0, displayed].tolist()),
+            shape=tuple(np.take(shape, displayed).tolist()),
+            tile_shape=self.tile_shape,
+            keys=tuple(keys),
+            pending=frozenset(pending),
+            generation=generation,
+        )
+        return region, layout
+
+    def _assemble(
+        self,
+        tiles: dict[_TileKey, np.ndarray],
+        corners: npt.NDArray,
+        displayed: list[int],
+        dtype: np.dtype,
+    ) -> np.ndarray:
+        """Place tiles into the tile-aligned region of their corners."""
+        origin = corners[0, displayed]
+        region_shape = tuple(corners[1, displayed] - origin + 1)
+        region: np.ndarray | None = None
+        for key, tile in tiles.items():
+            if region is None:
+                region = np.zeros(
+                    region_shape + tile.shape[len(displayed) :],
+                    dtype=tile.dtype,
+                )
+            start = np.multiply(
+                [key.index[d] for d in displayed], self.tile_shape
+            )
+            offset = start - origin
+            region[
+                tuple(
+                    slice(o, o + s)
+                    for o, s in zip(offset, tile.shape, strict=False)
+                )
+            ] = tile
+        if region is None:
+            region = np.zeros(region_shape, dtype=dtype)
+        return region
+
+    def _from_coarser(
+        self,
+        data: MultiScaleData,
+        key: _TileKey,
+        displayed: list[int],
+    ) -> np.ndarray | None:
+        """Upsample the finest coarser data covering a tile, or None.
+
+        Coarser levels are used if all their tiles covering the tile are
+        cached. Otherwise the tiles of the coarsest level are read, which
+        are small. None is returned for tiles of the coarsest level.
+        """
+        ndim = len(key.index)
+        last = len(data) - 1
+        fine_shape = np.asarray(data[key.level].shape[:ndim])
+        fine = self._tile_slices(data, key, displayed)
+        for level in range(key.level + 1, last + 1):
+            shape = np.asarray(data[level].shape[:ndim])
+            ratio = fine_shape / shape
+            point = [
+                min(int(i // r), s - 1)
+                for i, r, s in zip(key.index, ratio, shape, strict=True)
+            ]
+            # Nearest coarse pixel of each fine pixel of the tile.
+            indices = {
+                axis: np.minimum(
+                    (
+                        (np.arange(fine[axis].start, fine[axis].stop) + 0.5)
+                        / ratio[axis]
+                    ).astype(int),
+                    shape[axis] - 1,
+                )
+                for axis in displayed
+            }
+            corners = np.array([point, point], dtype=int)
+            for axis, index in indices.items():
+                corners[:, axis] = index[0], index[-1]
+            corners = self.snap_corners(corners, data[level].shape, displayed)
+            tiles = {}
+            for coarse_key in self.tile_keys(
+                level, corners, displayed, point
+            ):
+                tile = self.cache.get(coarse_key)
+                if tile is None and level == last:
+                    tile = self.fetch(data, coarse_key, displayed)
+                if tile is None:
+                    break
+                tiles[coarse_key] = tile
+            else:
+                region = self._assemble(
+                    tiles, corners, displayed, data[level].dtype
+                )
+                return region[
+                    np.ix_(
+                        *(
+                            index - corners[0, axis]
+                            for axis, index in indices.items()
+                        )
+                    )
+                ]
+        return None
+
+    def _tile_slices(
+        self,
+        data: MultiScaleData,
+        key: _TileKey,
+        displayed: Sequence[int],
+    ) -> tuple[int | slice, ...]:
+        shape = data[key.level].shape
+        slices: list[int | slice] = list(key.index)
+        for axis, tile_size in zip(displayed, self.tile_shape, strict=True):
+            start = key.index[axis] * tile_size
+            slices[axis] = slice(start, min(start + tile_size, shape[axis]))
+        return tuple(slices)
+
+
+class _TiledData:
+    """Multiscale data whose levels are read through the tile cache.
+
+    This stands in for the data of a 2D multiscale slice request, so that
+    the request only reads the tiles of its region that are not cached.
+
+    Parameters
+    ----------
+    tiles : _ImageTiles
+        Tiles of the layer.
+    data : MultiScaleData
+        The multiscale data of the layer.
+    displayed : sequence of int
+        Displayed dimensions, as many as the tiles have.
+    ndim : int
+        Number of spatial dimensions of the data, without RGB(A).
+    fill : bool
+        If True, tiles that are not cached are filled from coarser levels
+        and read in the background. Otherwise they are read on access.
+
+    Attributes
+    ----------
+    layouts : list of _TileLayout
+        Layouts of the regions read so far, starting at the first pixel of
+        each returned region.
+    """
+
+    def __init__(
+        self,
+        tiles: _ImageTiles,
+        data: MultiScaleData,
+        displayed: Sequence[int],
+        ndim: int,
+        fill: bool = True,
+    ) -> None:
+        self._tiles = tiles
+        self._data = data
+        self._displayed = sorted(displayed)
+        self._ndim = ndim
+        self._fill = fill
+        self.layouts: list[_TileLayout] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._data, name)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, level: int) -> _TiledLevel:
+        return _TiledLevel(self, range(len(self._data))[level])
+
+
+# note: this implements `LayerDataProtocol`, but we don't need to inherit.
+class _TiledLevel:
+    """One level of multiscale data, read through the tile cache.
+
+    Indexing a 2D region, with integers along the other spatial axes, reads
+    the tiles covering it. Other indexing reads the data directly.
+    """
+
+    def __init__(self, tiled: _TiledData, level: int) -> None:
+        self._tiled = tiled
+        self._level = level
+        self._array = tiled._data[level]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._array.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(self._array.shape)
+
+    @property
+    def ndim(self) -> int:
+        return len(self._array.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def _region(self, key: tuple) -> tuple[np.ndarray, list[int]] | None:
+        """Inclusive corners and point of the region of a key, or None."""
+        ndim = self._tiled._ndim
+        displayed = self._tiled._displayed
+        corners = np.zeros((2, ndim), dtype=int)
+        point = [0] * ndim
+        for axis, k in enumerate(key):
+            if axis >= ndim:
+                # Trailing axes, e.g. RGB, must be read whole.
+                if k != slice(None):
+                    return None
+            elif axis in displayed:
+                if not isinstance(k, slice):
+                    return None
+                start, stop, step = k.indices(self.shape[axis])
+                if step != 1 or stop <= start:
+                    return None
+                corners[:, axis] = start, stop - 1
+            elif isinstance(k, slice):
+                return None
+            else:
+                point[axis] = range(self.shape[axis])[k]
+                corners[:, axis] = point[axis]
+        return corners, point
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        key = _expand_key(key, self.ndim)
+        region = (
+            self._region(key) if _is_basic_key(key, self.ndim) else None
+        )
+        if region is None:
+            return np.asarray(self._array[key])
+        corners, point = region
+        tiles = self._tiled._tiles
+        displayed = self._tiled._displayed
+        data, layout = tiles.read_region(
+            self._tiled._data,
+            self._level,
+            corners,
+            displayed,
+            point,
+            fill=self._tiled._fill,
+        )
+        snapped = tiles.snap_corners(corners, self.shape, displayed)
+        crop = tuple(
+            slice(
+                corners[0, axis] - snapped[0, axis],
+                corners[1, axis] - snapped[0, axis] + 1,
+            )
+            for axis in displayed
+        )
+        # The layout starts at the first pixel of the cropped region.
+        self._tiled.layouts.append(
+            layout._replace(
+                origin=tuple(int(corners[0, axis]) for axis in displayed)
+            )
+        )
+        return data[crop]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.asarray(self._array, dtype=dtype)
@@ -2,34 +2,107 @@
 
 from __future__ import annotations
 
+import dataclasses
 import typing
 import warnings
+import weakref
+from collections.abc import Generator
+from concurrent.futures import Future
+from contextlib import contextmanager
 from typing import Any, Literal, cast
 
 import numpy as np
-from scipy import ndimage as ndi
+import numpy.typing as npt
 
+from minapari.layers._channel_data import find_channel
 from minapari.layers._data_protocols import LayerDataProtocol
 from minapari.layers._multiscale_data import MultiScaleData
-from minapari.layers._scalar_field._slice import _ScalarFieldSliceResponse
+from minapari.layers._ring_buffer_data import RingBufferData
+from minapari.layers._scalar_field._slice import (
+    _ImageView,
+    _ScalarFieldSliceResponse,
+)
 from minapari.layers._scalar_field.scalar_field import ScalarFieldBase
+from minapari.layers.image._image_bricks import (
+    DEFAULT_BRICK_SHAPE,
+    _BrickPlan,
+    _BrickRequest,
+    _ImageBricks,
+    required_levels,
+    screen_footprint,
+)
 from minapari.layers.image._image_constants import (
     ImageProjectionMode,
     ImageRendering,
     Interpolation,
     InterpolationStr,
 )
+from minapari.layers.image._image_projection import _SlidingProjection
+from minapari.layers.image._image_slice import (
+    SliceHistogram,
+    _ImageSliceRequest,
+    slice_histogram,
+)
+from minapari.layers.image._image_tiles import (
+    DEFAULT_TILE_SHAPE,
+    _ImageTiles,
+)
 from minapari.layers.image._image_utils import guess_rgb
 from minapari.layers.intensity_mixin import IntensityVisualizationMixin
+from minapari.layers.utils._data_range import (
+    DataRangeEstimate,
+    iter_data_range,
+    refine_executor,
+)
 from minapari.layers.utils.layer_utils import calc_data_range
+from minapari.settings import get_settings
 from minapari.utils._dtype import get_dtype_limits, normalize_dtype
 from minapari.utils.colormaps import ensure_colormap
 from minapari.utils.colormaps.colormap_utils import _coerce_contrast_limits
+from minapari.utils.events import Event
+from minapari.utils.transforms import Affine
 from minapari.utils.translations import trans
 
 __all__ = ('Image',)
 
 
+def _region_bounds(
+    region: int | slice | tuple[int | slice, ...], shape: tuple[int, ...]
+) -> list[tuple[int, int]]:
+    """Start and stop along each axis of a region of an array of a shape."""
+    if not isinstance(region, tuple):
+        region = (region,)
+    if len(region) > len(shape):
+        raise IndexError(
+            trans._(
+                'region has {n} axes but the data only has {ndim}',
+                deferred=True,
+                n=len(region),
+                ndim=len(shape),
+            )
+        )
+    region = region + (slice(None),) * (len(shape) - len(region))
+    bounds = []
+    for index, size in zip(region, shape, strict=True):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            if step != 1:
+                raise ValueError(
+                    trans._(
+                        'region slices must have a step of 1, got {step}',
+                        deferred=True,
+                        step=step,
+                    )
+                )
+            bounds.append((start, max(start, stop)))
+        else:
+            index = int(index)
+            if index < 0:
+                index += size
+            bounds.append((index, index + 1))
+    return bounds
+
+
 class Image(IntensityVisualizationMixin, ScalarFieldBase):
     """Image layer.
 
@@ -39,9 +112,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         Image data. Can be N >= 2 dimensional. If the last dimension has length
         3 or 4 can be interpreted as RGB or RGBA if rgb is `True`. If a
         list and arrays are decreasing in shape then the data is treated as
-        a multiscale image. Please note multiscale rendering is only
-        supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        a multiscale image. In 3D, the volume is split into bricks
+        whose level is chosen from their distance to the camera.
     affine : n-D array or napari.utils.transforms.Affine
         (N+1, N+1) affine transformation matrix in homogeneous coordinates.
         The first (N, N) entries correspond to a linear transform and
@@ -102,9 +174,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         represented by a list of array-like image data. If not specified by
         the user and if the data is a list of arrays that decrease in shape,
         then it will be taken to be multiscale. The first image in the list
-        should be the largest. Please note multiscale rendering is only
-        supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        should be the largest. In 3D, the volume is split into bricks
+        whose level is chosen from their distance to the camera.
     name : str
         Name of the layer.
     opacity : float
@@ -149,9 +220,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         Image data. Can be N dimensional. If the last dimension has length
         3 or 4 can be interpreted as RGB or RGBA if rgb is `True`. If a list
         and arrays are decreasing in shape then the data is treated as a
-        multiscale image. Please note multiscale rendering is only
-        supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        multiscale image. In 3D, the volume is split into bricks
+        whose level is chosen from their distance to the camera.
     axis_labels : tuple of str
         Dimension names of the layer data.
     metadata : dict
@@ -164,9 +234,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
     multiscale : bool
         Whether the data is a multiscale image or not. Multiscale data is
         represented by a list of array like image data. The first image in the
-        list should be the largest. Please note multiscale rendering is only
-        supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        list should be the largest. In 3D, the volume is split into bricks
+        whose level is chosen from their distance to the camera.
     mode : str
         Interactive mode. The normal, default mode is PAN_ZOOM, which
         allows for normal interactivity with the canvas.
@@ -184,6 +253,13 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
     contrast_limits_range : list (2,) of float
         Range for the color limits for luminance images. If the image is
         rgb the contrast_limits_range is ignored.
+    auto_contrast_percentiles : tuple (2,) of float
+        Lower and upper percentiles of the values of the current slice used
+        as contrast limits when they are automatically reset.
+    histogram : SliceHistogram or None
+        Histogram of the values of the current slice, computed while slicing
+        when the contrast limits follow the slice, else on first access.
+        None for rgb images. ``events.histogram`` is emitted when it changes.
     gamma : float
         Gamma correction for determining colormap linearity.
     interpolation2d : str
@@ -221,6 +297,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
     """
 
     _projectionclass = ImageProjectionMode
+    _multiscale_tile_shape = DEFAULT_TILE_SHAPE
+    _multiscale_brick_shape = DEFAULT_BRICK_SHAPE
 
     def __init__(
         self,
@@ -267,6 +345,31 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             rgb = guess_rgb(data_shape)
 
         self.rgb = rgb
+        # Tiles of the multiscale levels that have been read so far, keyed by
+        # (level, tile index). Only tiles entering the view need to be read,
+        # in the background, while coarser levels fill them in.
+        self._tiles = _ImageTiles(self._multiscale_tile_shape)
+        self._fill_tiles = True
+        # Bricks of the multiscale levels for 3D rendering, each at the level
+        # of detail required by its distance to the camera.
+        self._bricks = _ImageBricks(self._multiscale_brick_shape)
+        self._brick_plan: _BrickPlan | None = None
+        self._brick_volume: np.ndarray | None = None
+        self._brick_volume_id = -1
+        # The view last requested from the brick planner.
+        self._brick_view: tuple | None = None
+        # Thick slices are projected incrementally as their window slides.
+        self._projection = _SlidingProjection()
+        self._data_range_generation = 0
+        self._data_range_future: Future | None = None
+        self._histogram: SliceHistogram | None = None
+        self._histogram_pending = False
+        self._auto_contrast_percentiles = (0.0, 100.0)
+        # The thumbnail is rendered lazily, from a cached downsampled slice
+        # and a cached lookup table.
+        self._thumbnail_dirty = False
+        self._thumbnail_source_cache: tuple | None = None
+        self._thumbnail_lut_cache: tuple | None = None
         super().__init__(
             data,
             affine=affine,
@@ -292,6 +395,27 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             visible=visible,
         )
 
+        self.events.add(
+            data_range=Event,
+            auto_contrast_percentiles=Event,
+            histogram=Event,
+            region_update=Event,
+            data_appended=Event,
+            bricks_loaded=Event,
+            tiles_loaded=Event,
+        )
+        layer_ref = weakref.ref(self)
+
+        def notify_tiles_loaded() -> None:
+            layer = layer_ref()
+            if layer is not None:
+                layer.events.tiles_loaded()
+
+        self._tiles.notify = notify_tiles_loaded
+        self._watch_appended(None, self._data)
+        self._data_range_estimate: DataRangeEstimate | None = None
+        self._estimated_contrast_limits: list[float] | None = None
+
         self.rgb = rgb
         self._colormap = ensure_colormap(colormap)
         self._gamma = gamma
@@ -316,6 +440,10 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             self.contrast_limits_range = contrast_limits
         self._contrast_limits: tuple[float, float] = self.contrast_limits_range
         self.contrast_limits = self._contrast_limits
+        if contrast_limits is None:
+            # Refined by the viewer showing the layer, see
+            # _refine_data_range.
+            self._estimated_contrast_limits = self.contrast_limits
 
         if iso_threshold is None:
             cmin, cmax = self.contrast_limits_range
@@ -389,17 +517,59 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         )
         return state
 
+    def _make_slice_request_internal(
+        self, *args: Any, **kwargs: Any
+    ) -> _ImageSliceRequest:
+        # The histogram of the slice is computed by the request, off the main
+        # thread when slicing asynchronously, if the contrast limits follow
+        # the slice. Otherwise it is only computed if it is accessed.
+        request = super()._make_slice_request_internal(*args, **kwargs)
+        return _ImageSliceRequest(
+            request,
+            rgb=self.rgb,
+            projection=self._projection,
+            tiles=self._tiles if self.multiscale else None,
+            fill_tiles=self._fill_tiles,
+            histogram=self._keep_auto_contrast,
+        )
+
+    def _clear_slice_cache(self, event: Event | None = None) -> None:
+        """Remove cached slices, tiles, projections and channel blocks."""
+        super()._clear_slice_cache(event)
+        self._tiles.clear()
+        self._projection.clear()
+        for level in self.data if self.multiscale else [self.data]:
+            channel = find_channel(level)
+            if channel is not None:
+                channel.clear()
+
     def _update_slice_response(
         self, response: _ScalarFieldSliceResponse
     ) -> None:
+        if self._brick_plan is not None:
+            response = self._bricked_response(response)
+        previous = self._histogram
+        self._histogram = getattr(response, 'histogram', None)
+        self._histogram_pending = self._histogram is None and not (
+            self.rgb or response.empty
+        )
+        # A pending histogram is that of the new slice, computed on access.
+        histogram_changed = (
+            self._histogram is not previous or self._histogram_pending
+        )
         if self._keep_auto_contrast:
-            data = response.image.raw
-            input_data = data[-1] if self.multiscale else data
-            self.contrast_limits = calc_data_range(
-                typing.cast(LayerDataProtocol, input_data),
-                rgb=self.rgb,
-                dtype=self.dtype,
+            limits = self._histogram_limits(
+                self._histogram, self._auto_contrast_percentiles
             )
+            if limits is None:
+                data = response.image.raw
+                input_data = data[-1] if self.multiscale else data
+                limits = calc_data_range(
+                    typing.cast(LayerDataProtocol, input_data),
+                    rgb=self.rgb,
+                    dtype=self.dtype,
+                )
+            self.contrast_limits = limits
 
         super()._update_slice_response(response)
 
@@ -408,9 +578,87 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             self.reset_contrast_limits_range()
             self.reset_contrast_limits()
             self._should_calc_clims = False
+            if self._estimated_contrast_limits is not None:
+                self._estimated_contrast_limits = self.contrast_limits
         elif self._keep_auto_contrast:
             self.reset_contrast_limits()
 
+        if histogram_changed:
+            self.events.histogram()
+
+    def reset_contrast_limits(self, mode=None):
+        """Scale contrast limits to data range
+
+        For the slice, the ``auto_contrast_percentiles`` of its histogram are
+        used, unless the dtype alone gives the limits, e.g. for uint8.
+        """
+        mode = mode or self._auto_contrast_source
+        limits = None
+        if mode == 'slice':
+            percentiles = self._auto_contrast_percentiles
+            # The minimum and maximum do not need a histogram.
+            histogram = self._histogram
+            if percentiles != (0.0, 100.0):
+                histogram = self.histogram
+            limits = self._histogram_limits(histogram, percentiles)
+        if limits is None:
+            super().reset_contrast_limits(mode)
+        else:
+            self.contrast_limits = limits
+
+    def _histogram_limits(
+        self,
+        histogram: SliceHistogram | None,
+        percentiles: tuple[float, float],
+    ) -> tuple[float, float] | None:
+        """Contrast limits at percentiles of a slice histogram.
+
+        None if there is no histogram, or if ``calc_data_range`` gives the
+        range of the slice from its dtype alone, e.g. (0, 255) for uint8.
+        """
+        if histogram is None or normalize_dtype(self.dtype) == np.uint8:
+            return None
+        return histogram.limits(percentiles)
+
+    @property
+    def histogram(self) -> SliceHistogram | None:
+        """Histogram of the values of the current slice.
+
+        It is computed while slicing when the contrast limits follow the
+        slice, and from the current slice on first access otherwise.
+        ``events.histogram`` is emitted when the slice, and so its
+        histogram, changes.
+        """
+        if self._histogram_pending:
+            self._histogram_pending = False
+            self._histogram = slice_histogram(self._slice.image.raw)
+        return self._histogram
+
+    @property
+    def auto_contrast_percentiles(self) -> tuple[float, float]:
+        """Percentiles of the slice values used as automatic contrast limits.
+
+        (0, 100) uses the minimum and maximum of the slice. For example,
+        (0.1, 99.9) ignores the most extreme values, such as hot pixels.
+        """
+        return self._auto_contrast_percentiles
+
+    @auto_contrast_percentiles.setter
+    def auto_contrast_percentiles(self, value: tuple[float, float]) -> None:
+        low, high = (float(v) for v in value)
+        if not 0 <= low < high <= 100:
+            raise ValueError(
+                trans._(
+                    'auto_contrast_percentiles must be increasing and within [0, 100], got {value}',
+                    deferred=True,
+                    value=value,
+                )
+            )
+        self._auto_contrast_percentiles = (low, high)
+        if self._keep_auto_contrast:
+            self.reset_contrast_limits()
+        self.events.auto_contrast_percentiles()
+
     @property
     def attenuation(self) -> float:
         """float: attenuation rate for attenuated_mip rendering."""
@@ -429,15 +677,136 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
 
     @data.setter
     def data(self, data: LayerDataProtocol | MultiScaleData) -> None:
+        self._watch_appended(getattr(self, '_data', None), data)
         self._data_raw = data
         # note, we don't support changing multiscale in an Image instance
         self._data = MultiScaleData(data) if self.multiscale else data  # type: ignore
+        self._tiles.clear()
+        self._bricks.clear()
+        self._brick_view = None
+        self._brick_plan = None
+        self._brick_volume = None
+        # Stop refining the range of the previous data.
+        self._stop_refining_data_range()
         self._update_dims()
         if self._keep_auto_contrast:
             self.reset_contrast_limits()
         self.events.data(value=self.data)
         self._reset_editable()
 
+    def _watch_appended(self, old: Any, new: Any) -> None:
+        """Forward appended frames of ring buffer data to the layer events."""
+        if not hasattr(self.events, 'data_appended'):
+            # Still initializing, connected once the event exists.
+            return
+        if isinstance(old, RingBufferData):
+            old.events.appended.disconnect(self._on_data_appended)
+        if isinstance(new, RingBufferData):
+            new.events.appended.connect(self._on_data_appended)
+
+    def _on_data_appended(self, event) -> None:
+        """Emit ``events.data_appended`` from the thread appending frames.
+
+        Listeners must not touch the layer state on that thread, see
+        :meth:`_grow_extent` for the update to run on the main thread.
+        """
+        self.events.data_appended(count=event.count)
+
+    def _grow_extent(self) -> None:
+        """Update the extent after frames were appended to the data.
+
+        Only the extent is cleared: appending frames does not change the
+        frames that are already sliced, except for the first one, which
+        replaces the zeros shown while the data is empty. This should only be
+        called from the main thread.
+        """
+        first_frame = self.extent.data[1, 0] == 0
+        self._clear_extent()
+        if first_frame:
+            self._clear_slice_cache()
+            self.refresh(highlight=False, extent=False)
+
+    def update_region(
+        self,
+        region: int | slice | tuple[int | slice, ...],
+        values: npt.ArrayLike,
+    ) -> None:
+        """Write values into a region of the data and refresh only it.
+
+        Unlike setting ``data``, this does not update the dims, contrast
+        limits or data range, and does not slice the layer again. When the
+        region intersects the current slice, only that part of the slice is
+        updated and ``events.region_update`` is emitted with it, so that
+        only the changed part of the texture is uploaded. The slice is
+        refreshed in full when it cannot be updated in place, e.g. for
+        thick slices or when contrast limits are kept automatic.
+
+        Parameters
+        ----------
+        region : int, slice or tuple of int and slice
+            Region of the data to write to, in data coordinates. Slices must
+            have a step of 1. Missing trailing axes are written in full.
+        values : array-like
+            Values to write, broadcastable to the shape of the region.
+        """
+        if self.multiscale:
+            raise NotImplementedError(
+                trans._(
+                    'update_region is not supported for multiscale images.',
+                    deferred=True,
+                )
+            )
+        bounds = _region_bounds(region, self.data.shape)
+        key = tuple(slice(start, stop) for start, stop in bounds)
+        self.data[key] = values
+        self._clear_slice_cache()
+
+        displayed = list(self._slice_input.displayed)
+        not_displayed = self._slice_input.not_displayed
+        image = self._slice.image
+        thick = str(self.projection_mode) != 'none' and any(
+            self._data_slice.margin_left[axis]
+            or self._data_slice.margin_right[axis]
+            for axis in not_displayed
+        )
+        if (
+            self._keep_auto_contrast
+            or self.rgb
+            or thick
+            or self._slice.empty
+            or displayed != sorted(displayed)
+            or image.raw.shape != tuple(self.data.shape[a] for a in displayed)
+        ):
+            self.refresh(highlight=False, extent=False)
+            return
+
+        read_key = list(key)
+        for axis in not_displayed:
+            index = int(np.round(self._data_slice.point[axis]))
+            index = min(max(index, 0), self.data.shape[axis] - 1)
+            if not bounds[axis][0] <= index < bounds[axis][1]:
+                # The region is not in the displayed slice.
+                return
+            read_key[axis] = index
+        sub = tuple(key[axis] for axis in displayed)
+        raw = np.asarray(self.data[tuple(read_key)])
+        image.raw[sub] = raw
+        if image.view is not image.raw:
+            image.view[sub] = self._raw_to_displayed(raw)
+        self._thumbnail_source_cache = None
+        self._update_thumbnail()
+        # The histogram of the slice is computed again on access.
+        self._histogram = None
+        self._histogram_pending = True
+        self.events.histogram()
+        self.events.region_update(
+            region=key,
+            offset=tuple(bounds[axis][0] for axis in displayed),
+            # Raw values, coerced for the texture by the canvas the same way
+            # as `_raw_to_displayed` coerces the whole slice.
+            data=image.raw[sub],
+        )
+
     @property
     def interpolation2d(self) -> InterpolationStr:
         return cast(InterpolationStr, str(self._interpolation2d))
@@ -493,44 +862,315 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         self._update_thumbnail()
         self.events.iso_threshold()
 
+    def _update_draw(
+        self,
+        scale_factor,
+        corner_pixels_displayed,
+        shape_threshold,
+        camera=None,
+    ):
+        super()._update_draw(
+            scale_factor, corner_pixels_displayed, shape_threshold, camera
+        )
+        if (
+            camera is None
+            or not self.multiscale
+            or self._slice_input.ndisplay != 3
+        ):
+            if self._brick_view is not None:
+                self._stop_bricks()
+            return
+        # Draws that do not move the camera, e.g. once a texture is
+        # uploaded, keep the plan. Others are planned in the background,
+        # where only the latest of quickly following views is planned.
+        view, request = self._brick_request(camera, shape_threshold[0])
+        if view == self._brick_view:
+            return
+        self._brick_view = view
+        self._bricks.request(request)
+
+    def _stop_bricks(self) -> None:
+        """Stop streaming bricks and drop the bricked volume."""
+        self._bricks.reset()
+        self._brick_view = None
+        self._brick_plan = None
+        self._brick_volume = None
+
+    def _brick_request(
+        self, camera, canvas_height: float
+    ) -> tuple[tuple, _BrickRequest]:
+        """Describe the view for the brick planner.
+
+        Each brick gets the coarsest level whose voxels are not larger than
+        a screen pixel at the point of the brick closest to the camera. The
+        camera is copied, since the planner runs in the background.
+
+        Returns
+        -------
+        view : tuple
+            Hashable description of the view, equal for views that get the
+            same plan.
+        request : _BrickRequest
+        """
+        displayed = tuple(sorted(self._slice_input.displayed))
+        factors = np.asarray(self.downsample_factors, dtype=float)
+        data_to_world = self._transforms[1:].simplified_slice(
+            list(displayed)
+        )
+        scale = np.abs(data_to_world.scale)
+        voxel_sizes = np.max(factors[:, displayed] * scale, axis=1)
+        center = tuple(camera.center)
+        view_direction = tuple(camera.view_direction)
+        zoom = camera.zoom
+        fov = camera.perspective
+        point = tuple(np.round(self._data_slice.point).astype(int).tolist())
+
+        def levels_for(bounds: np.ndarray) -> np.ndarray:
+            centers = data_to_world(bounds.mean(axis=1))
+            sizes = (bounds[:, 1] - bounds[:, 0]) * scale
+            footprint = screen_footprint(
+                centers,
+                np.linalg.norm(sizes, axis=1) / 2,
+                center,
+                view_direction,
+                zoom,
+                fov,
+                canvas_height,
+            )
+            return required_levels(footprint, voxel_sizes)
+
+        layer_ref = weakref.ref(self)
+
+        def notify() -> None:
+            layer = layer_ref()
+            if layer is not None:
+                layer.events.bricks_loaded()
+
+        view = (
+            center,
+            view_direction,
+            zoom,
+            fov,
+            canvas_height,
+            displayed,
+            point,
+            tuple(data_to_world.affine_matrix.ravel().tolist()),
+        )
+        request = _BrickRequest(
+            data=self.data,
+            shapes=np.asarray(self.level_shapes),
+            factors=factors,
+            displayed=displayed,
+            point=point,
+            levels_for=levels_for,
+            notify=notify,
+        )
+        return view, request
+
+    def _on_tiles_loaded(self) -> None:
+        """Slice again to show the tiles read in the background.
+
+        The new slice reads them from the tile cache, and only they are
+        uploaded to the texture. This should only be called from the main
+        thread.
+        """
+        if not self.multiscale or self._slice_input.ndisplay != 2:
+            return
+        self.refresh(extent=False, thumbnail=False)
+
+    @contextmanager
+    def _read_all_tiles(self) -> Generator[None, None, None]:
+        """Slice without filling tiles from coarser levels, e.g. to export.
+
+        Tiles that are not cached are read by the slice request itself.
+        """
+        previous = self._fill_tiles
+        self._fill_tiles = False
+        try:
+            yield
+        finally:
+            self._fill_tiles = previous
+
+    def _on_bricks_loaded(self) -> None:
+        """Write the bricks loaded so far into the volume and show them.
+
+        Only the region of each brick is uploaded, unless the bricks start a
+        new volume, e.g. at another level. This should only be called from
+        the main thread.
+        """
+        plan, volume, patches = self._bricks.take_patches()
+        if plan is None or not patches or self._slice_input.ndisplay != 3:
+            return
+        self._brick_plan = plan
+        if self._brick_volume is None or volume != self._brick_volume_id:
+            displayed = sorted(self._slice_input.displayed)
+            shape = np.take(self.level_shapes[plan.level], displayed)
+            first = patches[0].data
+            self._brick_volume = np.zeros(
+                tuple(shape.tolist()) + first.shape[len(displayed) :],
+                dtype=first.dtype,
+            )
+            self._brick_volume_id = volume
+            for patch in patches:
+                self._brick_volume[patch.target] = patch.data
+            self.refresh(extent=False, thumbnail=False)
+            return
+        for patch in patches:
+            self._brick_volume[patch.target] = patch.data
+        image = self._slice.image
+        if self._slice.empty or not np.may_share_memory(
+            image.raw, self._brick_volume
+        ):
+            # The slice does not show the volume yet.
+            self.refresh(extent=False, thumbnail=False)
+            return
+        displayed = list(self._slice_input.displayed)
+        # The volume has the displayed axes in increasing order, the
+        # slice has them in display order, followed by the RGB(A) axis.
+        order = list(np.argsort(np.argsort(displayed)))
+        for patch in patches:
+            sub = tuple(patch.target[axis] for axis in order)
+            if image.view is not image.raw:
+                image.view[sub] = self._raw_to_displayed(image.raw[sub])
+            self.events.region_update(
+                offset=tuple(region.start for region in sub),
+                # Raw values, coerced for the texture by the canvas.
+                data=image.raw[sub],
+            )
+        self._thumbnail_source_cache = None
+        self._update_thumbnail()
+        self._histogram = None
+        self._histogram_pending = True
+        self.events.histogram()
+
+    def _bricked_response(
+        self, response: _ScalarFieldSliceResponse
+    ) -> _ScalarFieldSliceResponse:
+        """Replace the coarsest level of a 3D slice by the bricked volume.
+
+        The response is returned unchanged if it is not a 3D slice of the
+        brick plan, or if no brick is loaded yet.
+        """
+        if response.empty or response.slice_input.ndisplay != 3:
+            return response
+        volume = self._brick_volume
+        if volume is None:
+            return response
+        plan = cast(_BrickPlan, self._brick_plan)
+        displayed = list(response.slice_input.displayed)
+        # The volume has the displayed axes in increasing order, the
+        # slice has them in display order, followed by the RGB(A) axis.
+        order = list(np.argsort(np.argsort(displayed)))
+        order += range(len(order), volume.ndim)
+        volume = np.transpose(volume, order)
+        scale = np.ones(self.ndim)
+        for axis in displayed:
+            scale[axis] = self.downsample_factors[plan.level][axis]
+        return dataclasses.replace(
+            response,
+            image=_ImageView.from_raw(
+                raw=volume, converter=self._raw_to_displayed
+            ),
+            tile_to_data=Affine(
+                name='tile2data',
+                translate=np.zeros(self.ndim),
+                scale=scale,
+                ndim=self.ndim,
+            ),
+        )
+
     def _get_level_shapes(self):
         shapes = super()._get_level_shapes()
         if self.rgb:
             shapes = [s[:-1] for s in shapes]
         return shapes
 
+    @property
+    def thumbnail(self) -> np.ndarray:
+        """array: Integer array of thumbnail for the layer"""
+        if self._thumbnail_dirty:
+            self._thumbnail_dirty = False
+            with self.events.thumbnail.blocker():
+                self._render_thumbnail()
+        return self._thumbnail
+
+    @thumbnail.setter
+    def thumbnail(self, thumbnail: np.ndarray) -> None:
+        self._thumbnail_dirty = False
+        ScalarFieldBase.thumbnail.fset(self, thumbnail)
+
     def _update_thumbnail(self):
-        """Update thumbnail with current image data and colormap."""
+        """Mark the thumbnail as outdated.
+
+        The thumbnail is only rendered when it is next read, so that many
+        changes in a row, e.g. while dragging the contrast limits slider,
+        cost a single render per redraw of the thumbnail.
+        """
+        if self._thumbnail_dirty:
+            return
+        self._thumbnail_dirty = True
+        self.events.thumbnail()
+
+    def _thumbnail_source(self) -> np.ndarray | None:
+        """Downsampled slice the thumbnail is rendered from.
+
+        The slice is downsampled with a stride, or upsampled by repetition,
+        to fit the thumbnail. The result is cached until the slice changes.
+        """
         # don't bother updating thumbnail if we don't have any data
         # this also avoids possible dtype mismatch issues below
         # for example np.clip may raise an OverflowError (in numpy 2.0)
         if self._slice.empty:
-            return
-
+            return None
         image = self._slice.thumbnail.raw
+        ndisplay = self._slice_input.ndisplay
+        cached = self._thumbnail_source_cache
+        if cached is not None and cached[0] is image and cached[1] == ndisplay:
+            return cached[2]
+
+        downsampled = image
+        if ndisplay == 3 and self.ndim > 2:
+            downsampled = np.max(downsampled, axis=0)
+        shape = np.array(downsampled.shape[:2])
+        step = int(np.ceil(np.max(shape / self._thumbnail_shape[:2])))
+        if step > 1:
+            downsampled = downsampled[::step, ::step]
+        else:
+            repeat = int(np.min(np.array(self._thumbnail_shape[:2]) // shape))
+            if repeat > 1:
+                downsampled = np.repeat(downsampled, repeat, axis=0)
+                downsampled = np.repeat(downsampled, repeat, axis=1)
+        self._thumbnail_source_cache = (image, ndisplay, downsampled)
+        return downsampled
+
+    def _thumbnail_lut(self) -> np.ndarray:
+        """(256, 4) uint8 lookup table from normalized values to RGBA.
+
+        The table applies the gamma, colormap and opacity of the layer and is
+        cached until one of them changes.
+        """
+        colormap, gamma, opacity = self.colormap, self.gamma, self.opacity
+        cached = self._thumbnail_lut_cache
+        if (
+            cached is not None
+            and cached[0] is colormap
+            and cached[1:3] == (gamma, opacity)
+        ):
+            return cached[3]
+        colors = colormap.map(np.linspace(0, 1, 256) ** gamma)
+        colors[:, 3] *= opacity
+        lut = np.round(np.clip(colors, 0, 1) * 255).astype(np.uint8)
+        self._thumbnail_lut_cache = (colormap, gamma, opacity, lut)
+        return lut
+
+    def _render_thumbnail(self) -> None:
+        """Render the thumbnail from the current slice and colormap."""
+        downsampled = self._thumbnail_source()
+        if downsampled is None:
+            return
 
-        if self._slice_input.ndisplay == 3 and self.ndim > 2:
-            image = np.max(image, axis=0)
-
-        # float16 not supported by ndi.zoom
-        dtype = np.dtype(image.dtype)
-        if dtype in [np.dtype(np.float16)]:
-            image = image.astype(np.float32)
-
-        raw_zoom_factor = np.divide(
-            self._thumbnail_shape[:2], image.shape[:2]
-        ).min()
-        new_shape = np.clip(
-            raw_zoom_factor * np.array(image.shape[:2]),
-            1,  # smallest side should be 1 pixel wide
-            self._thumbnail_shape[:2],
-        )
-        zoom_factor = tuple(new_shape / image.shape[:2])
         if self.rgb:
-            downsampled = ndi.zoom(
-                image, zoom_factor + (1,), prefilter=False, order=0
-            )
-            if image.shape[2] == 4:  # image is RGBA
+            if downsampled.shape[2] == 4:  # image is RGBA
                 colormapped = np.copy(downsampled)
                 colormapped[..., 3] = downsampled[..., 3] * self.opacity
                 if self.dtype == np.uint8:
@@ -547,21 +1187,13 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
                     alpha = np.full(downsampled.shape[:2] + (1,), self.opacity)
                 colormapped = np.concatenate([downsampled, alpha], axis=2)
         else:
-            downsampled = ndi.zoom(
-                image, zoom_factor, prefilter=False, order=0
-            )
             low, high = self.contrast_limits
-            if np.issubdtype(downsampled.dtype, np.integer):
-                low = max(low, np.iinfo(downsampled.dtype).min)
-                high = min(high, np.iinfo(downsampled.dtype).max)
-            downsampled = np.clip(downsampled, low, high)
-            color_range = high - low
-            if color_range != 0:
-                downsampled = (downsampled - low) / color_range
-            downsampled = downsampled**self.gamma
-            color_array = self.colormap.map(downsampled.ravel())
-            colormapped = color_array.reshape((*downsampled.shape, 4))
-            colormapped[..., 3] *= self.opacity
+            scale = 255 / (high - low) if high != low else 0
+            index = np.subtract(downsampled, low, dtype=np.float32)
+            index *= scale
+            np.clip(index, 0, 255, out=index)
+            np.rint(np.nan_to_num(index, copy=False), out=index)
+            colormapped = self._thumbnail_lut()[index.astype(np.uint8)]
         self.thumbnail = colormapped
 
     def _calc_data_range(
@@ -574,6 +1206,11 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         if mode == 'data':
             input_data = self.data[-1] if self.multiscale else self.data
         elif mode == 'slice':
+            # Use the histogram computed while slicing, to not scan the
+            # slice again on the main thread.
+            limits = self._histogram_limits(self._histogram, (0, 100))
+            if limits is not None:
+                return limits
             input_data = self._slice.image.raw  # ugh
         else:
             raise ValueError(
@@ -587,6 +1224,82 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             cast(LayerDataProtocol, input_data), rgb=self.rgb, dtype=self.dtype
         )
 
+    @property
+    def data_range_estimate(self) -> DataRangeEstimate | None:
+        """Latest estimate of the range and histogram of the full data.
+
+        This is only computed for large images, for which the initial
+        contrast limits are estimated from a sample of the data and then
+        refined in the background.
+        """
+        return self._data_range_estimate
+
+    def _refine_data_range(self) -> None:
+        """Scan large data in the background to refine the contrast limits.
+
+        This is started by the viewer showing the layer, if its contrast
+        limits were estimated rather than given and the refinement is
+        enabled in the application settings, which also cap the amount of
+        data scanned. Scans run on an executor shared by all layers.
+
+        Each new estimate is stored in ``data_range_estimate`` and emitted
+        with ``events.data_range`` from a background thread. Listeners should
+        apply it on the main thread with ``_apply_data_range``.
+        """
+        settings = get_settings().application.data_range
+        if (
+            not settings.refine
+            or self._estimated_contrast_limits is None
+            or self._data_range_future is not None
+        ):
+            return
+        data = self.data[-1] if self.multiscale else self.data
+        if self.rgb or data.size <= 1e7 or data.dtype == np.uint8:
+            return
+        generation = self._data_range_generation
+        max_bytes = int(settings.max_scan * 1e9)
+        layer_ref = weakref.ref(self)
+
+        def _scan() -> None:
+            for estimate in iter_data_range(data, max_bytes=max_bytes):
+                layer = layer_ref()
+                if layer is None or layer._data_range_generation != generation:
+                    return
+                layer._data_range_estimate = estimate
+                layer.events.data_range(value=estimate)
+                del layer
+
+        self._data_range_future = refine_executor().submit(_scan)
+
+    def _stop_refining_data_range(self) -> None:
+        """Stop the scan of the data range, e.g. when the layer is removed.
+
+        A scan that is running stops after its current batch of blocks.
+        """
+        self._data_range_generation += 1
+        if self._data_range_future is not None:
+            self._data_range_future.cancel()
+            self._data_range_future = None
+
+    def _apply_data_range(self, estimate: DataRangeEstimate) -> None:
+        """Update the contrast limits from a refined estimate.
+
+        This should only be called from the main thread. Contrast limits that
+        were changed since the previous estimate are left alone.
+        """
+        self._data_range_estimate = estimate
+        if (
+            self._keep_auto_contrast
+            or self._estimated_contrast_limits != self.contrast_limits
+        ):
+            return
+        limits = estimate.limits
+        if not np.issubdtype(normalize_dtype(self.dtype), np.integer):
+            self.contrast_limits_range = limits
+        self.contrast_limits = limits
+        self._estimated_contrast_limits = self.contrast_limits
+        self._should_calc_clims = False
+
     def _raw_to_displayed(self, raw: np.ndarray) -> np.ndarray:
         """Determine displayed image from raw image.
 
@@ -0,0 +1,325 @@
+"""Streaming, chunk-parallel estimation of the range of layer data.
+
+The data is split into blocks aligned with its chunks, when it has any.
+Blocks are visited in a random order, so that every estimate is computed
+from a sample spread over the whole array, and are processed in parallel
+batches. After each batch an estimate of the range and histogram of the
+data is yielded, until the range stops changing or the data is exhausted.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from minapari.layers._data_protocols import LayerDataProtocol
+
+#: Target size in bytes of the blocks the data is split into.
+DEFAULT_BLOCK_BYTES = 4 * 2**20
+#: Default number of histogram bins.
+DEFAULT_HISTOGRAM_BINS = 256
+#: Number of layers whose data range is refined at once, see
+#: ``refine_executor``.
+REFINE_WORKERS = 2
+
+_refine_executor: ThreadPoolExecutor | None = None
+_refine_executor_lock = Lock()
+
+
+def refine_executor() -> ThreadPoolExecutor:
+    """Executor shared by the layers refining their data range.
+
+    It runs at most ``REFINE_WORKERS`` scans at once, the others wait in
+    its queue, where they can be cancelled.
+    """
+    global _refine_executor
+    with _refine_executor_lock:
+        if _refine_executor is None:
+            _refine_executor = ThreadPoolExecutor(
+                max_workers=REFINE_WORKERS,
+                thread_name_prefix='data_range_refine',
+            )
+        return _refine_executor
+
+
+class DataRangeEstimate(NamedTuple):
+    """Estimate of the range and histogram of some data.
+
+    Attributes
+    ----------
+    min : float
+        Smallest finite value seen so far.
+    max : float
+        Largest finite value seen so far.
+    counts : np.ndarray
+        Histogram counts of the values seen so far.
+    bin_edges : np.ndarray
+        Edges of the histogram bins, one more than ``counts``.
+    fraction : float
+        Fraction of the data scanned, between 0 and 1.
+    converged : bool
+        True if this is the last estimate, because the range changed by less
+        than the error bound, or all data or the maximum number of bytes
+        was scanned.
+    """
+
+    min: float
+    max: float
+    counts: np.ndarray
+    bin_edges: np.ndarray
+    fraction: float
+    converged: bool
+
+    @property
+    def limits(self) -> tuple[float, float]:
+        """Range as contrast limits, widened if all values are equal."""
+        low, high = self.min, self.max
+        if low == high:
+            low, high = min(low, 0), max(high, 1)
+        return float(low), float(high)
+
+
+def _chunk_shape(data: LayerDataProtocol) -> tuple[int, ...] | None:
+    """Shape of the first chunk of dask-, zarr- or tensorstore-like data."""
+    chunks = getattr(data, 'chunks', None)
+    if chunks is None:
+        chunk_layout = getattr(data, 'chunk_layout', None)
+        chunks = getattr(chunk_layout, 'read_chunk', None)
+        chunks = getattr(chunks, 'shape', None)
+    if chunks is None or len(chunks) != len(data.shape):
+        return None
+    try:
+        return tuple(
+            max(1, int(c[0] if isinstance(c, Sequence) else c))
+            for c in chunks
+        )
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _block_shape(
+    shape: Sequence[int],
+    itemsize: int,
+    block_bytes: int,
+    chunks: Sequence[int] | None = None,
+) -> tuple[int, ...]:
+    """Shape of blocks of about ``block_bytes``, aligned with ``chunks``.
+
+    Blocks are halved along leading axes while too large, and doubled, which
+    keeps them aligned with the chunks, while too small.
+    """
+    block = [
+        min(int(s), int(c))
+        for s, c in zip(shape, chunks or shape, strict=True)
+    ]
+
+    def nbytes() -> int:
+        return math.prod(block) * itemsize
+
+    for axis in range(len(block)):
+        while nbytes() > block_bytes and block[axis] > 1:
+            block[axis] = max(1, block[axis] // 2)
+    for axis in reversed(range(len(block))):
+        while nbytes() * 2 <= block_bytes and block[axis] < shape[axis]:
+            block[axis] = min(int(shape[axis]), block[axis] * 2)
+    return tuple(max(1, b) for b in block)
+
+
+def _block_slices(
+    shape: Sequence[int], block: Sequence[int]
+) -> list[tuple[slice, ...]]:
+    """Slices of the blocks tiling an array of the given shape."""
+    ranges = [
+        [slice(start, min(start + b, s)) for start in range(0, s, b)]
+        for s, b in zip(shape, block, strict=True)
+    ]
+    return list(itertools.product(*ranges))
+
+
+def _histogram(
+    values: np.ndarray, bins: int, low: float, high: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Histogram of values within [low, high] with uniform bins.
+
+    Faster than ``np.histogram`` for large arrays, since bins are computed
+    directly from the values.
+    """
+    if high <= low:
+        high = low + 1
+    edges = np.linspace(low, high, bins + 1)
+    scale = bins / (high - low)
+    index = ((values.ravel() - low) * scale).astype(np.intp)
+    np.clip(index, 0, bins - 1, out=index)
+    return np.bincount(index, minlength=bins), edges
+
+
+def _block_stats(
+    data: LayerDataProtocol, slices: tuple[slice, ...], bins: int
+) -> tuple[int, float, float, np.ndarray, np.ndarray]:
+    """Size, finite range and histogram of one block of the data.
+
+    This may be slow and runs on a worker thread.
+    """
+    block = np.asarray(data[slices])
+    if block.dtype == bool:
+        block = block.view(np.uint8)
+    empty = (block.size, math.inf, -math.inf, np.zeros(0), np.zeros(1))
+    if block.size == 0:
+        return empty
+    values = block
+    low, high = float(values.min()), float(values.max())
+    if not (math.isfinite(low) and math.isfinite(high)):
+        values = block[np.isfinite(block)]
+        if values.size == 0:
+            return empty
+        low, high = float(values.min()), float(values.max())
+    if bins == 0:
+        return block.size, low, high, np.zeros(0), np.zeros(1)
+    counts, edges = _histogram(values, bins, low, high)
+    return block.size, low, high, counts, edges
+
+
+def _rebin(
+    counts: np.ndarray, edges: np.ndarray, new_edges: np.ndarray
+) -> np.ndarray:
+    """Move histogram counts into new bins, by the centres of the old bins."""
+    if counts.size == 0:
+        return np.zeros(len(new_edges) - 1, dtype=np.int64)
+    centers = (edges[:-1] + edges[1:]) / 2
+    rebinned, _ = np.histogram(
+        np.clip(centers, new_edges[0], new_edges[-1]),
+        bins=new_edges,
+        weights=counts,
+    )
+    return rebinned.astype(np.int64)
+
+
+def iter_data_range(
+    data: LayerDataProtocol,
+    *,
+    bins: int = DEFAULT_HISTOGRAM_BINS,
+    block_bytes: int = DEFAULT_BLOCK_BYTES,
+    max_workers: int | None = None,
+    rtol: float = 0.01,
+    min_fraction: float = 0.1,
+    max_bytes: int | None = None,
+    seed: int | None = 0,
+) -> Iterator[DataRangeEstimate]:
+    """Progressively estimate the range and histogram of some data.
+
+    Parameters
+    ----------
+    data : array
+        Data to estimate the range of values over.
+    bins : int
+        Number of histogram bins. Use 0 to only estimate the range.
+    block_bytes : int
+        Target size in bytes of the blocks read at once. Blocks are aligned
+        with the chunks of the data, when it has any.
+    max_workers : int, optional
+        Number of blocks processed in parallel, which is also the number of
+        blocks between two estimates. Defaults to the number of CPUs, up
+        to 8.
+    rtol : float
+        Error bound. Scanning stops once a batch of blocks changes the range
+        by at most this fraction of its width, and at least ``min_fraction``
+        of the data was scanned. It does not stop while all values seen are
+        equal, as in sparse data. Use 0 to scan all data.
+    min_fraction : float
+        Fraction of the data to scan before stopping early.
+    max_bytes : int, optional
+        Maximum number of bytes to scan, after which the estimate is final.
+        If None, all data can be scanned.
+    seed : int, optional
+        Seed of the random order in which blocks are visited.
+
+    Yields
+    ------
+    DataRangeEstimate
+        Estimates computed from more and more data. The last one has
+        ``converged`` set to True.
+    """
+    shape = tuple(int(s) for s in data.shape)
+    total = math.prod(shape)
+    counts = np.zeros(bins, dtype=np.int64)
+    edges = np.linspace(0, 1, bins + 1)
+    if total == 0:
+        yield DataRangeEstimate(0, 1, counts, edges, 1.0, True)
+        return
+    itemsize = np.dtype(data.dtype).itemsize
+    block = _block_shape(shape, itemsize, block_bytes, _chunk_shape(data))
+    blocks = _block_slices(shape, block)
+    order = np.random.default_rng(seed).permutation(len(blocks))
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    low, high = math.inf, -math.inf
+    scanned = 0
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='data_range'
+    ) as pool:
+        for start in range(0, len(order), max_workers):
+            batch = [blocks[i] for i in order[start : start + max_workers]]
+            results = list(
+                pool.map(lambda sl: _block_stats(data, sl, bins), batch)
+            )
+            prev_low, prev_high = low, high
+            low = min([low] + [r[1] for r in results])
+            high = max([high] + [r[2] for r in results])
+            scanned += sum(r[0] for r in results)
+            if low <= high and bins > 0:
+                new_edges = np.linspace(
+                    low, high if high > low else low + 1, bins + 1
+                )
+                new_counts = _rebin(counts, edges, new_edges)
+                for _, _, _, block_counts, block_edges in results:
+                    new_counts += _rebin(block_counts, block_edges, new_edges)
+                counts, edges = new_counts, new_edges
+
+            fraction = scanned / total
+            width = high - low if high > low else 1
+            change = max(abs(low - prev_low), abs(high - prev_high)) / width
+            converged = (
+                fraction >= 1
+                or (max_bytes is not None and scanned * itemsize >= max_bytes)
+                or (
+                    rtol > 0
+                    and fraction >= min_fraction
+                    and high > low
+                    and change <= rtol
+                )
+            )
+            if low > high:
+                # No finite value seen yet.
+                estimate = DataRangeEstimate(
+                    0, 1, counts, edges, fraction, converged
+                )
+            else:
+                estimate = DataRangeEstimate(
+                    low, high, counts, edges, fraction, converged
+                )
+            yield estimate
+            if converged:
+                return
+
+
+def estimate_data_range(
+    data: LayerDataProtocol, **kwargs
+) -> DataRangeEstimate:
+    """Return the last estimate of :func:`iter_data_range`.
+
+    Keyword arguments are passed to :func:`iter_data_range`.
+    """
+    estimate = None
+    for estimate in iter_data_range(data, **kwargs):
+        pass
+    assert estimate is not None
+    return estimate
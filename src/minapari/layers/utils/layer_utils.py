@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 import inspect
+import itertools
 import warnings
 from collections.abc import Callable, Sequence
 from typing import (
@@ -10,19 +11,24 @@ from typing import (
     NamedTuple,
 )
 
-import dask
 import numpy as np
-import pandas as pd
 
+from minapari.layers.utils._data_range import (
+    estimate_data_range,
+    iter_data_range,
+)
 from minapari.utils.action_manager import action_manager
 from minapari.utils.events.custom_types import Array
 from minapari.utils.transforms import Affine
 from minapari.utils.translations import trans
 
+# pandas is only needed by layers with features, it is imported by the
+# functions that use it to keep it out of the import of minapari.layers.
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
     import numpy.typing as npt
+    import pandas as pd
 
     from minapari.layers._data_protocols import LayerDataProtocol
 
@@ -223,12 +229,16 @@ def calc_data_range(
     Notes
     -----
     If the data type is uint8, no calculation is performed, and 0-255 is
-    returned.
+    returned. For data with more than 1e7 elements, the range is estimated
+    from a random sample of blocks of the data.
     """
     if (dtype is not None and dtype == np.uint8) or data.dtype == np.uint8:
         return (0, 255)
 
     if isinstance(data, np.ndarray) and data.ndim < 3:
+        if data.size > 1e7:
+            # Scan very large planes fully, but in parallel blocks.
+            return estimate_data_range(data, bins=0, rtol=0).limits
         min_val = _nanmin(data)
         max_val = _nanmax(data)
         if min_val == max_val:
@@ -236,53 +246,14 @@ def calc_data_range(
             max_val = max(max_val, 1)
         return float(min_val), float(max_val)
 
-    center: int | list[int]
-    reduced_data: list | LayerDataProtocol
-    if data.size > 1e7 and (data.ndim == 1 or (rgb and data.ndim == 2)):
-        # If data is very large take the average of start, middle and end.
-        center = int(data.shape[0] // 2)
-        slices = [
-            slice(0, 4096),
-            slice(center - 2048, center + 2048),
-            slice(-4096, None),
-        ]
-        reduced_data = [
-            [_nanmax(data[sl]) for sl in slices],
-            [_nanmin(data[sl]) for sl in slices],
-        ]
-    elif data.size > 1e7:
-        # If data is very large take the average of the top, bottom, and
-        # middle slices
-        offset = 2 + int(rgb)
-        bottom_plane_idx = (0,) * (data.ndim - offset)
-        middle_plane_idx = tuple(s // 2 for s in data.shape[:-offset])
-        top_plane_idx = tuple(s - 1 for s in data.shape[:-offset])
-        idxs = [bottom_plane_idx, middle_plane_idx, top_plane_idx]
-        # If each plane is also very large, look only at a subset of the image
-        if (
-            np.prod(data.shape[-offset:]) > 1e7
-            and data.shape[-offset] > 64
-            and data.shape[-offset + 1] > 64
-        ):
-            # Find a central patch of the image to take
-            center = [int(s // 2) for s in data.shape[-offset:]]
-            central_slice = tuple(slice(c - 31, c + 31) for c in center[:2])
-            reduced_data = [
-                [_nanmax(data[idx + central_slice]) for idx in idxs],
-                [_nanmin(data[idx + central_slice]) for idx in idxs],
-            ]
-        else:
-            reduced_data = [
-                [_nanmax(data[idx]) for idx in idxs],
-                [_nanmin(data[idx]) for idx in idxs],
-            ]
-        # compute everything in one go
-        reduced_data = dask.compute(*reduced_data)
-    else:
-        reduced_data = data
+    if data.size > 1e7:
+        # If data is very large, use a first estimate from a random sample of
+        # blocks spread over the whole array. See ``iter_data_range`` to
+        # refine it progressively.
+        return next(iter_data_range(data, bins=0)).limits
 
-    min_val = _nanmin(reduced_data)
-    max_val = _nanmax(reduced_data)
+    min_val = _nanmin(data)
+    max_val = _nanmax(data)
 
     if min_val == max_val:
         min_val = min(min_val, 0)
@@ -602,6 +573,62 @@ def compute_multiscale_level_and_corners(
     return level, corners
 
 
+def snap_corners_to_tiles(corners, tile_shape, shape):
+    """Expand corner pixels outwards so they cover whole tiles.
+
+    Tiles are fixed-size blocks laid out on a regular grid starting at the
+    origin of the data, the last tile along each axis may be truncated by
+    the data shape.
+
+    Parameters
+    ----------
+    corners : array (2, D)
+        Inclusive corner pixels at the resolution of the tiles.
+    tile_shape : int or tuple of int
+        Shape of one tile, either one value for all dimensions or one value
+        per dimension.
+    shape : tuple of int
+        Shape of the data along the same D dimensions.
+
+    Returns
+    -------
+    corners : array (2, D)
+        Inclusive corner pixels aligned to the tile grid.
+    """
+    corners = np.asarray(corners, dtype=int)
+    tile_shape = np.broadcast_to(tile_shape, corners.shape[1:])
+    first = corners[0] // tile_shape * tile_shape
+    last = np.minimum((corners[1] // tile_shape + 1) * tile_shape, shape) - 1
+    return np.stack([first, np.maximum(last, first)])
+
+
+def compute_tile_indices(corners, tile_shape) -> list[tuple[int, ...]]:
+    """Grid indices of the tiles overlapping a box of corner pixels.
+
+    Parameters
+    ----------
+    corners : array (2, D)
+        Inclusive corner pixels at the resolution of the tiles.
+    tile_shape : int or tuple of int
+        Shape of one tile, either one value for all dimensions or one value
+        per dimension.
+
+    Returns
+    -------
+    indices : list of tuple of int
+        Index of each overlapping tile on the tile grid, in C order.
+    """
+    corners = np.asarray(corners, dtype=int)
+    tile_shape = np.broadcast_to(tile_shape, corners.shape[1:])
+    first = corners[0] // tile_shape
+    last = corners[1] // tile_shape
+    return list(
+        itertools.product(
+            *(range(f, lst + 1) for f, lst in zip(first, last, strict=True))
+        )
+    )
+
+
 def coerce_affine(
     affine: npt.ArrayLike | Affine,
     *,
@@ -823,6 +850,8 @@ class _FeatureTable:
         Dict[str, np.ndarray]
             The property choices dictionary equivalent to this.
         """
+        import pandas as pd
+
         return {
             name: series.dtype.categories.to_numpy()
             for name, series in self._values.items()
@@ -883,6 +912,8 @@ class _FeatureTable:
         to_append : pd.DataFrame
             The features to append.
         """
+        import pandas as pd
+
         self._values = pd.concat([self._values, to_append], ignore_index=True)
 
     def remove(self, indices: Any) -> None:
@@ -948,6 +979,8 @@ class _FeatureTable:
 
 def _get_default_column(column: pd.Series) -> pd.Series:
     """Get the default column of length 1 from a data column."""
+    import pandas as pd
+
     value = None
     if column.size > 0:
         value = column.iloc[-1]
@@ -976,6 +1009,8 @@ def _validate_features(
     --------
     :class:`_FeatureTable` : See initialization for parameter descriptions.
     """
+    import pandas as pd
+
     if isinstance(features, pd.DataFrame):
         features = features.reset_index(drop=True)
     elif isinstance(features, dict):
@@ -999,6 +1034,8 @@ def _validate_feature_defaults(
     --------
     :class:`_FeatureTable` : See initialization for parameter descriptions.
     """
+    import pandas as pd
+
     if defaults is None:
         defaults = {c: _get_default_column(values[c]) for c in values.columns}
     else:
@@ -1048,6 +1085,8 @@ def _features_from_properties(
     --------
     :meth:`_FeatureTable.from_layer`
     """
+    import pandas as pd
+
     # Create categorical series for any choices provided.
     if property_choices is not None:
         properties_df = pd.DataFrame(data=properties)
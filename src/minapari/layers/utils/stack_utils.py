@@ -1,27 +1,42 @@
 from __future__ import annotations
 
 import itertools
-import warnings
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pint
 
 from minapari.layers import Image
+from minapari.layers._channel_data import (
+    _ChannelReader,
+    channel_array,
+    chunks_span_channels,
+)
+from minapari.layers._virtual_data import AxisView, StackedData
 from minapari.layers.image._image_utils import guess_multiscale
+from minapari.utils._dask_utils import _is_dask_data
 from minapari.utils.colormaps import CMYBGR, MAGENTA_GREEN, Colormap
 from minapari.utils.misc import ensure_iterable, ensure_sequence_of_iterables
 from minapari.utils.translations import trans
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
     from minapari.types import FullLayerData
 
+#: Total size in bytes up to which numpy arrays are copied when stacked,
+#: rather than stacked lazily.
+EAGER_STACK_BYTES = 64 * 2**20
+
 
 def slice_from_axis(array, *, axis, element):
     """Take a single index slice from array using slicing.
 
     Equivalent to :func:`np.take`, but using slicing, which ensures that the
-    output is a view of the original array.
+    output is a view of the original array. Arrays other than numpy and dask
+    arrays get a lazy ``AxisView``, and an element of a ``StackedData`` along
+    its stacking axis is the original array.
 
     Parameters
     ----------
@@ -37,24 +52,35 @@ def slice_from_axis(array, *, axis, element):
     sliced : NumPy or other array
         The sliced output array, which has one less dimension than the input.
     """
-    # Check if array is a zarr array and wrap it with dask
-    # to keep lazy behavior and avoid loading into memory
-    if hasattr(array, '__module__') and array.__module__.startswith('zarr'):
-        import dask.array as da
-
-        array = da.from_zarr(array)
-        warnings.warn(
-            trans._(
-                'zarr array cannot be sliced lazily, converted to dask array.',
-                deferred=True,
-            )
-        )
+    if isinstance(array, StackedData) and axis % array.ndim == array.axis:
+        return array.arrays[element]
+    # Arrays such as zarr or h5py read the data when they are sliced, so
+    # take a view that reads it only when it is itself sliced.
+    if not isinstance(array, np.ndarray) and not _is_dask_data(array):
+        return AxisView(array, axis, element)
 
     slices = [slice(None) for i in range(array.ndim)]
     slices[axis] = element
     return array[tuple(slices)]
 
 
+def _stacker(arrays: list) -> Callable[..., Any]:
+    """Choose how to stack arrays without doubling the memory they use.
+
+    Dask arrays are stacked lazily by dask, and small numpy arrays are
+    copied. Anything else, including memmaps and zarr arrays, is stacked in
+    a ``StackedData`` that reads from the arrays only when sliced.
+    """
+    if all(_is_dask_data(arr) for arr in arrays):
+        import dask.array as da
+
+        return da.stack
+    in_memory = all(type(arr) is np.ndarray for arr in arrays)
+    if in_memory and sum(arr.nbytes for arr in arrays) <= EAGER_STACK_BYTES:
+        return np.stack
+    return StackedData
+
+
 def split_channels(
     data: np.ndarray,
     channel_axis: int,
@@ -74,6 +100,12 @@ def split_channels(
     dictionary of the returned LaterData tuple. For example, if gamma is not in
     kwargs then meta will not have a gamma key.
 
+    When the chunks of the data hold several channels, each region of all
+    channels is read at once, instead of reading every chunk once per
+    channel. Dask channels are then dask arrays whose blocks are read that
+    way, and other channels ``ChannelData``. The channels are still
+    separate layers, drawn and composited one by one.
+
     Parameters
     ----------
     data : array or list of array
@@ -148,15 +180,26 @@ def split_channels(
         else:
             kwargs[key] = iter(ensure_iterable(val))
 
+    # Channels share their reads when the chunks hold several channels, so
+    # that each chunk is read once per slice rather than once per channel.
+    levels = data if multiscale else [data]
+    readers = [
+        _ChannelReader(level, channel_axis)
+        if chunks_span_channels(level, channel_axis)
+        else None
+        for level in levels
+    ]
+
     layerdata_list = []
     for i in range(n_channels):
-        if multiscale:
-            image = [
-                slice_from_axis(data[j], axis=channel_axis, element=i)
-                for j in range(len(data))
-            ]
-        else:
-            image = slice_from_axis(data, axis=channel_axis, element=i)
+        image = [
+            slice_from_axis(level, axis=channel_axis, element=i)
+            if reader is None
+            else channel_array(level, reader, i)
+            for level, reader in zip(levels, readers, strict=True)
+        ]
+        if not multiscale:
+            image = image[0]
         i_kwargs = {}
         for key, val in kwargs.items():
             try:
@@ -371,26 +414,7 @@ def images_to_stack(images: list[Image], axis: int = 0, **kwargs) -> Image:
     else:
         arrays_to_check = [img.data for img in images]
 
-    # check if any of the data arrays are zarr arrays
-    # zarr doesn't have a stack method, so we will use dask.array.stack
-    is_zarr = any(
-        hasattr(arr, '__module__') and arr.__module__.startswith('zarr')
-        for arr in arrays_to_check
-    )
-
-    if is_zarr:
-        import dask.array as da
-
-        stacker = da.stack
-        warnings.warn(
-            trans._(
-                'zarr array cannot be stacked lazily, using dask array to stack.',
-                deferred=True,
-            )
-        )
-    else:
-        stacker = np.stack
-
+    stacker = _stacker(arrays_to_check)
     if all(multiscale_flags):
         n_scales = len(images[0].data)
         new_data = [
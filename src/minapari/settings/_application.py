@@ -14,6 +14,7 @@ from minapari.settings._constants import (
 )
 from minapari.settings._fields import Language
 from minapari.utils._base import _DEFAULT_LOCALE
+from minapari.utils._slice_cache import SliceCachePolicy
 from minapari.utils.camera_orientations import (
     DEFAULT_ORIENTATION_TYPED,
     DepthAxisOrientation,
@@ -47,6 +48,51 @@ class DaskSettings(EventedModel):
     )
 
 
+class SliceCacheSettings(EventedModel):
+    enabled: bool = True
+    cache: float = Field(
+        0.5,
+        ge=0,
+        le=MAX_CACHE,
+        title='Cache size (GB)',
+    )
+    policy: SliceCachePolicy = Field(
+        SliceCachePolicy.LRU,
+        title='Eviction policy',
+    )
+
+
+class DataRangeSettings(EventedModel):
+    refine: bool = True
+    max_scan: float = Field(
+        1.0,
+        ge=0,
+        title='Maximum data scanned per layer (GB)',
+    )
+
+
+class InteractiveQualitySettings(EventedModel):
+    enabled: bool = True
+    target_frame_time: float = Field(
+        33.0,
+        gt=0,
+        le=1000,
+        title='Target frame time while the camera moves (ms)',
+    )
+    idle_delay: float = Field(
+        300.0,
+        ge=0,
+        le=5000,
+        title='Delay before rendering at full quality (ms)',
+    )
+    max_step_factor: float = Field(
+        4.0,
+        ge=1,
+        le=16,
+        title='Maximum ray step size factor',
+    )
+
+
 class ApplicationSettings(EventedModel):
     first_time: bool = Field(
         True,
@@ -257,6 +303,30 @@ class ApplicationSettings(EventedModel):
         ),
     )
 
+    slice_cache: SliceCacheSettings = Field(
+        default=SliceCacheSettings(),
+        title=trans._('Slice cache'),
+        description=trans._(
+            'Settings for the cache of sliced and projected layer data, used for any kind of array'
+        ),
+    )
+
+    data_range: DataRangeSettings = Field(
+        default=DataRangeSettings(),
+        title=trans._('Contrast limits estimation'),
+        description=trans._(
+            'Settings for refining the contrast limits of large images by scanning their data in the background'
+        ),
+    )
+
+    interactive_quality: InteractiveQualitySettings = Field(
+        default=InteractiveQualitySettings(),
+        title=trans._('Interactive 3D quality'),
+        description=trans._(
+            'Settings for coarser volume rendering while the camera moves, refined once it stops'
+        ),
+    )
+
     new_labels_dtype: LabelDTypes = Field(
         default=LabelDTypes.uint8,
         title=trans._('New labels data type'),
@@ -36,6 +36,16 @@ class ExperimentalSettings(EventedSettings):
         env='napari_async',
         requires_restart=False,
     )
+    async_slicing_workers: int = Field(
+        4,
+        title=trans._('Asynchronous slicing workers'),
+        description=trans._(
+            'Number of threads used to slice layers in parallel when rendering images asynchronously.'
+        ),
+        env='napari_async_slicing_workers',
+        ge=1,
+        requires_restart=True,
+    )
     autoswap_buffers: bool = Field(
         False,
         title=trans._('Enable autoswapping rendering buffers.'),
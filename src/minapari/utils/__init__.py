@@ -1,17 +1,24 @@
-from minapari._check_numpy_version import NUMPY_VERSION_IS_THREADSAFE
-from minapari.utils._dask_utils import resize_dask_cache
-from minapari.utils.colormaps.colormap import (
-    Colormap,
-    CyclicLabelColormap,
-    DirectLabelColormap,
-)
-from minapari.utils.info import citation_text, sys_info
-from minapari.utils.notebook_display import (
-    NotebookScreenshot,
-    nbscreenshot,
-)
+from minapari._lazy import lazy_imports
+
+# progress is imported eagerly: it shares its name with its submodule,
+# which would shadow it once imported. The other names are imported on
+# first access (PEP 562), so that importing a submodule of minapari.utils
+# does not import dask, the colormaps or the notebook tools.
 from minapari.utils.progress import cancelable_progress, progrange, progress
 
+_LAZY_IMPORTS = {
+    'NUMPY_VERSION_IS_THREADSAFE': 'minapari._check_numpy_version',
+    'resize_dask_cache': 'minapari.utils._dask_utils',
+    'resize_slice_cache': 'minapari.utils._slice_cache',
+    'Colormap': 'minapari.utils.colormaps.colormap',
+    'CyclicLabelColormap': 'minapari.utils.colormaps.colormap',
+    'DirectLabelColormap': 'minapari.utils.colormaps.colormap',
+    'citation_text': 'minapari.utils.info',
+    'sys_info': 'minapari.utils.info',
+    'NotebookScreenshot': 'minapari.utils.notebook_display',
+    'nbscreenshot': 'minapari.utils.notebook_display',
+}
+
 __all__ = (
     'NUMPY_VERSION_IS_THREADSAFE',
     'Colormap',
@@ -24,5 +31,8 @@ __all__ = (
     'progrange',
     'progress',
     'resize_dask_cache',
+    'resize_slice_cache',
     'sys_info',
 )
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
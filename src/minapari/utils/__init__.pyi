@@ -0,0 +1,30 @@
+from minapari._check_numpy_version import NUMPY_VERSION_IS_THREADSAFE
+from minapari.utils._dask_utils import resize_dask_cache
+from minapari.utils._slice_cache import resize_slice_cache
+from minapari.utils.colormaps.colormap import (
+    Colormap,
+    CyclicLabelColormap,
+    DirectLabelColormap,
+)
+from minapari.utils.info import citation_text, sys_info
+from minapari.utils.notebook_display import (
+    NotebookScreenshot,
+    nbscreenshot,
+)
+from minapari.utils.progress import cancelable_progress, progrange, progress
+
+__all__ = (
+    'NUMPY_VERSION_IS_THREADSAFE',
+    'Colormap',
+    'CyclicLabelColormap',
+    'DirectLabelColormap',
+    'NotebookScreenshot',
+    'cancelable_progress',
+    'citation_text',
+    'nbscreenshot',
+    'progrange',
+    'progress',
+    'resize_dask_cache',
+    'resize_slice_cache',
+    'sys_info',
+)
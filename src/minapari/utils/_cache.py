@@ -0,0 +1,196 @@
+"""Byte-bounded caches for sliced and tiled image data."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any
+
+
+def _nbytes(value: Any) -> int:
+    """Best effort size in bytes of a cached value."""
+    nbytes = getattr(value, 'nbytes', None)
+    if nbytes is not None:
+        return int(nbytes)
+    return 0
+
+
+class ByteLRUCache:
+    """Thread-safe least-recently-used cache bounded by a byte budget.
+
+    Values are expected to expose an ``nbytes`` attribute (numpy arrays and
+    most array-likes do). Values larger than the whole budget are never
+    stored. When an insertion exceeds the budget, the least recently used
+    entries are evicted until the cache fits again.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum number of bytes to hold. 0 disables the cache.
+    sizeof : callable, optional
+        Function returning the size in bytes of a value. By default the
+        ``nbytes`` attribute of the value is used.
+
+    Attributes
+    ----------
+    max_bytes : int
+        Maximum number of bytes to hold.
+    total_bytes : int
+        Number of bytes currently held.
+    hits : int
+        Number of successful lookups.
+    misses : int
+        Number of unsuccessful lookups.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        self.max_bytes = int(max_bytes)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._sizeof = _nbytes if sizeof is None else sizeof
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for key and mark it as recently used."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """Store value under key, evicting old entries as needed.
+
+        Returns
+        -------
+        bool
+            True if the value was stored, False if it does not fit.
+        """
+        nbytes = self._sizeof(value)
+        with self._lock:
+            self.pop(key)
+            if nbytes > self.max_bytes:
+                return False
+            self._data[key] = (value, nbytes)
+            self.total_bytes += nbytes
+            self._evict(keep=key)
+        return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key from the cache, returning its value."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            if item is None:
+                return default
+            self.total_bytes -= item[1]
+            return item[0]
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove all entries whose key satisfies predicate.
+
+        Returns
+        -------
+        int
+            Number of removed entries.
+        """
+        with self._lock:
+            keys = [k for k in self._data if predicate(k)]
+            for key in keys:
+                self.pop(key)
+        return len(keys)
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting entries if it shrinks."""
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def _evict(self, keep: Hashable | None = None) -> None:
+        """Evict entries until the cache fits, other than ``keep``.
+
+        The new entry is never evicted to make room for itself, since it
+        alone fits in the budget.
+        """
+        while self.total_bytes > self.max_bytes and self._data:
+            _, (_, nbytes) = self._data.popitem(last=False)
+            self.total_bytes -= nbytes
+
+
+class ByteLFUCache(ByteLRUCache):
+    """Thread-safe least-frequently-used cache bounded by a byte budget.
+
+    Like :class:`ByteLRUCache`, but when the budget is exceeded the entries
+    that were looked up the fewest times are evicted first, and among
+    those the least recently used. This keeps often revisited values, e.g.
+    the slices a user keeps coming back to, over values that were used only
+    once.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        super().__init__(max_bytes, sizeof)
+        self._counts: dict[Hashable, int] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._counts[key] += 1
+            return super().get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        with self._lock:
+            count = self._counts.get(key, 0)
+            stored = super().put(key, value)
+            if stored:
+                self._counts[key] = count
+            return stored
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            self._counts.pop(key, None)
+            return super().pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+            self._counts.clear()
+
+    def _evict(self, keep: Hashable | None = None) -> None:
+        while self.total_bytes > self.max_bytes:
+            # The new entry has not been looked up yet, and would otherwise
+            # always be the one evicted.
+            candidates = [k for k in self._data if k != keep]
+            if not candidates:
+                return
+            # Iteration follows recency, so min keeps the oldest of ties.
+            key = min(candidates, key=lambda k: self._counts.get(k, 0))
+            self.pop(key)
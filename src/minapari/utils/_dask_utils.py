@@ -2,28 +2,41 @@
 
 import collections.abc
 import contextlib
+import sys
 from collections.abc import Callable, Iterator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import dask
-import dask.array as da
-from dask.cache import Cache
+if TYPE_CHECKING:
+    from dask.cache import Cache
+
+# dask is only imported once a layer is given dask data, which means dask
+# was already imported by whoever created the data.
 
 #: dask.cache.Cache, optional : A dask cache for opportunistic caching
 #: use :func:`~.resize_dask_cache` to actually register and resize.
 #: this is a global cache (all layers will use it), but individual layers
-#: can opt out using Layer(..., cache=False)
-_DASK_CACHE = Cache(1)
+#: can opt out using Layer(..., cache=False). Created by _dask_cache().
+_DASK_CACHE: 'Cache | None' = None
 _DEFAULT_MEM_FRACTION = 0.25
 
 DaskIndexer = Callable[
-    [], contextlib.AbstractContextManager[tuple[dict, Cache] | None]
+    [], contextlib.AbstractContextManager[tuple[dict, 'Cache'] | None]
 ]
 
 
+def _dask_cache() -> 'Cache':
+    """Return the global dask cache, creating it on first use."""
+    global _DASK_CACHE
+    if _DASK_CACHE is None:
+        from dask.cache import Cache
+
+        _DASK_CACHE = Cache(1)
+    return _DASK_CACHE
+
+
 def resize_dask_cache(
     nbytes: int | None = None, mem_fraction: float | None = None
-) -> Cache:
+) -> 'Cache':
     """Create or resize the dask cache used for opportunistic caching.
 
     The cache object is an instance of a :class:`Cache`, (which
@@ -64,23 +77,28 @@ def resize_dask_cache(
     if nbytes is None and mem_fraction is not None:
         nbytes = int(virtual_memory().total * mem_fraction)
 
-    avail = _DASK_CACHE.cache.available_bytes
+    dask_cache = _dask_cache()
+    avail = dask_cache.cache.available_bytes
     # if we don't have a cache already, create one.
     if avail == 1:
         # If neither nbytes nor mem_fraction was provided, use default
         if nbytes is None:
             nbytes = int(virtual_memory().total * _DEFAULT_MEM_FRACTION)
-        _DASK_CACHE.cache.resize(nbytes)
-    elif nbytes is not None and nbytes != _DASK_CACHE.cache.available_bytes:
+        dask_cache.cache.resize(nbytes)
+    elif nbytes is not None and nbytes != dask_cache.cache.available_bytes:
         # if the cache has already been registered, then calling
         # resize_dask_cache() without supplying either mem_fraction or nbytes
         # is a no-op:
-        _DASK_CACHE.cache.resize(nbytes)
-    return _DASK_CACHE
+        dask_cache.cache.resize(nbytes)
+    return dask_cache
 
 
 def _is_dask_data(data: Any) -> bool:
     """Return True if data is a dask array or a list/tuple of dask arrays."""
+    da = sys.modules.get('dask.array')
+    if da is None:
+        # There cannot be dask arrays if dask.array was never imported.
+        return False
     return isinstance(data, da.Array) or (
         isinstance(data, collections.abc.Sequence)
         and any(isinstance(i, da.Array) for i in data)
@@ -137,6 +155,8 @@ def configure_dask(data: Any, cache: bool = True) -> DaskIndexer:
     if not _is_dask_data(data):
         return contextlib.nullcontext
 
+    import dask
+
     _cache = resize_dask_cache() if cache else contextlib.nullcontext()
 
     @contextlib.contextmanager
@@ -0,0 +1,213 @@
+"""Layer-agnostic cache of slice responses.
+
+Unlike the dask opportunistic cache in :mod:`minapari.utils._dask_utils`,
+which only caches chunks of dask arrays, this cache stores whole slice
+responses, after any thick-slice projection, for any layer data. It is
+keyed by layer, data level, slice indices and thickness, displayed region
+and projection mode, so revisiting a slice skips both reading the data and
+projecting it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Hashable
+from concurrent.futures import Future
+from enum import auto
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from minapari.utils._cache import ByteLFUCache, ByteLRUCache
+from minapari.utils.misc import StringEnum
+
+if TYPE_CHECKING:
+    from minapari.components import Dims
+    from minapari.layers import Layer
+
+_DEFAULT_SLICE_CACHE_BYTES = 512 * 2**20
+
+
+class SliceCachePolicy(StringEnum):
+    """Eviction policy of the slice cache.
+
+    SliceCachePolicy.LRU
+        Evict the least recently used slices first.
+    SliceCachePolicy.LFU
+        Evict the least frequently used slices first, which favours slices
+        that are revisited often.
+    """
+
+    LRU = auto()
+    LFU = auto()
+
+
+_CACHE_TYPES: dict[SliceCachePolicy, type[ByteLRUCache]] = {
+    SliceCachePolicy.LRU: ByteLRUCache,
+    SliceCachePolicy.LFU: ByteLFUCache,
+}
+
+
+def _slice_nbytes(obj: Any, depth: int = 2) -> int:
+    """Bytes of the arrays held by a slice response, a few levels deep."""
+    if hasattr(obj, 'nbytes'):
+        return int(obj.nbytes)
+    if depth == 0:
+        return 0
+    if dataclasses.is_dataclass(obj):
+        values = [getattr(obj, f.name) for f in dataclasses.fields(obj)]
+    else:
+        values = list(getattr(obj, '__dict__', {}).values())
+    return sum(_slice_nbytes(v, depth - 1) for v in values)
+
+
+#: ByteLRUCache : global cache of slice responses shared by all layers.
+#: Use :func:`resize_slice_cache` to resize it or change its policy.
+#: Individual layers can opt out using Layer(..., cache=False).
+_SLICE_CACHE: ByteLRUCache = ByteLRUCache(
+    _DEFAULT_SLICE_CACHE_BYTES, sizeof=_slice_nbytes
+)
+# Number of invalidations per layer id, so that responses computed from
+# data that changed in the meantime are not stored.
+_GENERATIONS: dict[Hashable, int] = {}
+
+
+def get_slice_cache() -> ByteLRUCache:
+    """Return the global slice cache."""
+    return _SLICE_CACHE
+
+
+def resize_slice_cache(
+    nbytes: int | None = None,
+    policy: SliceCachePolicy | str | None = None,
+) -> ByteLRUCache:
+    """Resize the global slice cache or change its eviction policy.
+
+    Parameters
+    ----------
+    nbytes : int, optional
+        The memory budget of the cache, in bytes. 0 turns the cache off.
+        If ``None``, the budget is unchanged.
+    policy : SliceCachePolicy or str, optional
+        The eviction policy, 'lru' or 'lfu'. Changing it empties the cache.
+        If ``None``, the policy is unchanged.
+
+    Returns
+    -------
+    slice_cache : ByteLRUCache
+        The global slice cache.
+    """
+    global _SLICE_CACHE
+
+    if nbytes is None:
+        nbytes = _SLICE_CACHE.max_bytes
+    if policy is not None:
+        cache_type = _CACHE_TYPES[SliceCachePolicy(policy)]
+        if type(_SLICE_CACHE) is not cache_type:
+            _SLICE_CACHE.clear()
+            _SLICE_CACHE = cache_type(nbytes, sizeof=_slice_nbytes)
+    _SLICE_CACHE.resize(nbytes)
+    return _SLICE_CACHE
+
+
+def invalidate_slice_cache(layer: Layer) -> None:
+    """Remove all cached slices of a layer."""
+    layer_id = layer.unique_id
+    _GENERATIONS[layer_id] = _GENERATIONS.get(layer_id, 0) + 1
+    _SLICE_CACHE.discard(lambda key: key[0] == layer_id)
+
+
+def slice_cache_key(layer: Layer, dims: Dims) -> Hashable:
+    """Key identifying the slice of a layer for a given dims state.
+
+    The key combines the layer identity, the projection mode and the
+    rounded data indices and margins along non-displayed axes, so that it
+    is independent of sub-pixel dims positions. For multiscale layers, it
+    also includes the data level and the displayed region, which are part
+    of the slice. Other layers slice their whole extent, so panning and
+    zooming keep their cached slices valid.
+    """
+    slice_input = layer._make_slice_input(dims)
+    not_displayed = slice_input.not_displayed
+    indices = np.empty((3, 0))
+    if not_displayed:
+        data_slice = slice_input.data_slice(layer._data_to_world.inverse)
+        indices = np.round(data_slice.as_array()[:, not_displayed])
+    view: tuple = ()
+    if getattr(layer, 'multiscale', False):
+        view = (layer.data_level, np.asarray(layer.corner_pixels).tobytes())
+    return (
+        layer.unique_id,
+        slice_input.ndisplay,
+        slice_input.order,
+        indices.tobytes(),
+        view,
+        str(layer.projection_mode),
+    )
+
+
+def _with_request_id(response: Any, request_id: int) -> Any:
+    """Return the response relabelled with the ID of the request it serves."""
+    if dataclasses.is_dataclass(response) and hasattr(
+        response, 'request_id'
+    ):
+        return dataclasses.replace(response, request_id=request_id)
+    return response
+
+
+class _CachedSliceRequest:
+    """Slice request served from a response computed earlier.
+
+    Parameters
+    ----------
+    id : int
+        ID of the request being served.
+    response : Any, optional
+        Response that was computed earlier.
+    future : concurrent.futures.Future, optional
+        Running task that will produce the response.
+    """
+
+    def __init__(
+        self,
+        id: int,  # noqa: A002
+        response: Any = None,
+        future: Future | None = None,
+    ) -> None:
+        self.id = id
+        self._response = response
+        self._future = future
+
+    def __call__(self) -> Any:
+        response = self._response
+        if response is None and self._future is not None:
+            response = self._future.result()
+        return _with_request_id(response, self.id)
+
+
+class _CachingSliceRequest:
+    """Slice request that stores its response in the slice cache.
+
+    Responses that are ``provisional``, e.g. because part of the slice is
+    still being read, are not stored.
+
+    Parameters
+    ----------
+    request : callable
+        The slice request to run.
+    key : Hashable
+        Key of the slice, from :func:`slice_cache_key`.
+    """
+
+    def __init__(self, request: Any, key: Hashable) -> None:
+        self.id = request.id
+        self.key = key
+        self._request = request
+        self._generation = _GENERATIONS.get(key[0], 0)
+
+    def __call__(self) -> Any:
+        response = self._request()
+        current = _GENERATIONS.get(self.key[0], 0) == self._generation
+        if current and not getattr(response, 'provisional', False):
+            _SLICE_CACHE.put(self.key, response)
+        return response
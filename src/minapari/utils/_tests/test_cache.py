@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from minapari.utils._cache import ByteLFUCache, ByteLRUCache
+
+
+def _value(nbytes: int = 100) -> np.ndarray:
+    return np.zeros(nbytes, dtype=np.uint8)
+
+
+@pytest.mark.parametrize('cache_type', [ByteLRUCache, ByteLFUCache])
+def test_new_entries_are_admitted(cache_type):
+    cache = cache_type(300)
+    for key in range(3):
+        assert cache.put(key, _value())
+        # Every resident entry has been looked up at least once.
+        assert cache.get(key) is not None
+
+    assert cache.put(3, _value())
+    assert 3 in cache
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = ByteLFUCache(300)
+    for key in range(3):
+        cache.put(key, _value())
+    cache.get(0)
+    cache.get(2)
+
+    cache.put(3, _value())
+    assert list(cache) == [0, 2, 3]
+
+
+def test_value_larger_than_budget_is_not_stored():
+    cache = ByteLFUCache(100)
+    cache.put(0, _value())
+    assert not cache.put(1, _value(101))
+    assert 1 not in cache
+    assert 0 in cache
+
+
+def test_resize_evicts_new_entries_too():
+    cache = ByteLFUCache(300)
+    cache.put(0, _value())
+    cache.resize(50)
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
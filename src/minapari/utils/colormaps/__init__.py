@@ -1,28 +1,48 @@
-from minapari.utils.colormaps.colorbars import make_colorbar
-from minapari.utils.colormaps.colormap import (
-    Colormap,
-    CyclicLabelColormap,
-    DirectLabelColormap,
-    LabelColormap,
-)
-from minapari.utils.colormaps.colormap_utils import (
-    ALL_COLORMAPS,
-    AVAILABLE_COLORMAPS,
-    CMYBGR,
-    CYMRGB,
-    INVERSE_COLORMAPS,
-    MAGENTA_GREEN,
-    RGB,
-    SIMPLE_COLORMAPS,
-    ValidColormapArg,
-    color_dict_to_colormap,
-    direct_colormap,
-    display_name_to_name,
-    ensure_colormap,
-    label_colormap,
-    low_discrepancy_image,
-    matplotlib_colormaps,
-)
+"""Colormaps, and the utilities to create and convert them.
+
+Names are imported on first access (PEP 562), so that importing a submodule
+such as standardize_color, as minapari.utils.color does, neither creates the
+builtin colormaps nor imports the colormap module, which imports
+minapari.utils.color back.
+"""
+
+from minapari._lazy import lazy_imports
+
+_LAZY_IMPORTS = {
+    'make_colorbar': 'minapari.utils.colormaps.colorbars',
+    **dict.fromkeys(
+        (
+            'Colormap',
+            'CyclicLabelColormap',
+            'DirectLabelColormap',
+            'LabelColormap',
+        ),
+        'minapari.utils.colormaps.colormap',
+    ),
+    **dict.fromkeys(
+        (
+            # The builtin colormaps are created on first access, see
+            # colormap_utils._COLORMAP_REGISTRY_NAMES.
+            'ALL_COLORMAPS',
+            'AVAILABLE_COLORMAPS',
+            'INVERSE_COLORMAPS',
+            'SIMPLE_COLORMAPS',
+            'CMYBGR',
+            'CYMRGB',
+            'MAGENTA_GREEN',
+            'RGB',
+            'ValidColormapArg',
+            'color_dict_to_colormap',
+            'direct_colormap',
+            'display_name_to_name',
+            'ensure_colormap',
+            'label_colormap',
+            'low_discrepancy_image',
+            'matplotlib_colormaps',
+        ),
+        'minapari.utils.colormaps.colormap_utils',
+    ),
+}
 
 __all__ = (
     'ALL_COLORMAPS',
@@ -47,3 +67,5 @@ __all__ = (
     'make_colorbar',
     'matplotlib_colormaps',
 )
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
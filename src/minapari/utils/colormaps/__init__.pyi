@@ -0,0 +1,49 @@
+from minapari.utils.colormaps.colorbars import make_colorbar
+from minapari.utils.colormaps.colormap import (
+    Colormap,
+    CyclicLabelColormap,
+    DirectLabelColormap,
+    LabelColormap,
+)
+from minapari.utils.colormaps.colormap_utils import (
+    ALL_COLORMAPS,
+    AVAILABLE_COLORMAPS,
+    CMYBGR,
+    CYMRGB,
+    INVERSE_COLORMAPS,
+    MAGENTA_GREEN,
+    RGB,
+    SIMPLE_COLORMAPS,
+    ValidColormapArg,
+    color_dict_to_colormap,
+    direct_colormap,
+    display_name_to_name,
+    ensure_colormap,
+    label_colormap,
+    low_discrepancy_image,
+    matplotlib_colormaps,
+)
+
+__all__ = (
+    'ALL_COLORMAPS',
+    'AVAILABLE_COLORMAPS',
+    'CMYBGR',
+    'CYMRGB',
+    'INVERSE_COLORMAPS',
+    'MAGENTA_GREEN',
+    'RGB',
+    'SIMPLE_COLORMAPS',
+    'Colormap',
+    'CyclicLabelColormap',
+    'DirectLabelColormap',
+    'LabelColormap',
+    'ValidColormapArg',
+    'color_dict_to_colormap',
+    'direct_colormap',
+    'display_name_to_name',
+    'ensure_colormap',
+    'label_colormap',
+    'low_discrepancy_image',
+    'make_colorbar',
+    'matplotlib_colormaps',
+)
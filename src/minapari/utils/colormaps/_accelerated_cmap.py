@@ -40,6 +40,7 @@ COLORMAP_BACKEND = ColormapBackend.fastest_available
 
 __all__ = (
     'labels_raw_to_texture_direct',
+    'map_with_lut',
     'minimum_dtype_for_labels',
     'zero_preserving_modulo',
     'zero_preserving_modulo_numpy',
@@ -290,8 +291,70 @@ def labels_raw_to_texture_direct_partsegcore(
     return out.reshape(data.shape)
 
 
+def _map_with_lut_numpy(values: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """Map float values in [0, 1] to colors using a lookup table.
+
+    This implementation uses numpy vectorized operations.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Float values to map.
+    lut : np.ndarray
+        Lookup table of shape (N + 3, 4). The first N rows sample the
+        colormap uniformly over [0, 1], the last three are the colors of
+        NaN, high (>= 1) and low (<= 0) values.
+
+    Returns
+    -------
+    np.ndarray
+        Colors, of shape ``values.shape + (4,)``.
+    """
+    n = lut.shape[0] - 3
+    with np.errstate(invalid='ignore'):
+        scaled = values * (n - 1) + 0.5
+        np.clip(scaled, 0, n - 1, out=scaled)
+        indices = scaled.astype(np.intp)
+    indices[values <= 0] = n + 2
+    indices[values >= 1] = n + 1
+    indices[np.isnan(values)] = n
+    return np.take(lut, indices, axis=0)
+
+
+def _map_with_lut_loop(values: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """Map float values in [0, 1] to colors using a lookup table.
+
+    This implementation uses a loop, compiled with numba when available.
+    See ``_map_with_lut_numpy`` for the layout of the table.
+    """
+    out = np.empty((values.size, lut.shape[1]), dtype=lut.dtype)
+    _map_with_lut_inner_loop(values.reshape(-1), lut, out)
+    return out.reshape(values.shape + (lut.shape[1],))
+
+
+def _map_with_lut_inner_loop(
+    values: np.ndarray, lut: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """Gather the rows of ``lut`` for each value into ``out``."""
+    n = lut.shape[0] - 3
+    for i in prange(values.size):
+        value = values[i]
+        if value != value:  # noqa: PLR0124
+            row = n
+        elif value <= 0:
+            row = n + 2
+        elif value >= 1:
+            row = n + 1
+        else:
+            row = int(value * (n - 1) + 0.5)
+        for c in range(lut.shape[1]):
+            out[i, c] = lut[row, c]
+    return out
+
+
 zero_preserving_modulo = zero_preserving_modulo_numpy
 labels_raw_to_texture_direct = _labels_raw_to_texture_direct_numpy
+map_with_lut = _map_with_lut_numpy
 
 if numba is not None:
     _zero_preserving_modulo_inner_loop = numba.njit(parallel=True, cache=True)(
@@ -300,6 +363,9 @@ if numba is not None:
     _labels_raw_to_texture_direct_inner_loop = numba.njit(
         parallel=True, cache=True
     )(_labels_raw_to_texture_direct_inner_loop)
+    _map_with_lut_inner_loop = numba.njit(parallel=True, cache=True)(
+        _map_with_lut_inner_loop
+    )
 
 
 def set_colormap_backend(backend: ColormapBackend) -> None:
@@ -313,6 +379,7 @@ def set_colormap_backend(backend: ColormapBackend) -> None:
     global \
         COLORMAP_BACKEND, \
         labels_raw_to_texture_direct, \
+        map_with_lut, \
         zero_preserving_modulo, \
         prange
     COLORMAP_BACKEND = backend
@@ -323,6 +390,7 @@ def set_colormap_backend(backend: ColormapBackend) -> None:
     }:
         labels_raw_to_texture_direct = labels_raw_to_texture_direct_partsegcore
         zero_preserving_modulo = zero_preserving_modulo_partsegcore
+        map_with_lut = _map_with_lut_numpy
         prange = range
     elif numba is not None and backend in {
         ColormapBackend.fastest_available,
@@ -330,10 +398,12 @@ def set_colormap_backend(backend: ColormapBackend) -> None:
     }:
         zero_preserving_modulo = _zero_preserving_modulo_loop
         labels_raw_to_texture_direct = _labels_raw_to_texture_direct_loop
+        map_with_lut = _map_with_lut_loop
         prange = numba.prange
     else:
         zero_preserving_modulo = zero_preserving_modulo_numpy
         labels_raw_to_texture_direct = _labels_raw_to_texture_direct_numpy
+        map_with_lut = _map_with_lut_numpy
         prange = range
 
 
@@ -19,7 +19,7 @@ from minapari.utils.colormaps import _accelerated_cmap as _accel_cmap
 from minapari.utils.colormaps.colorbars import make_colorbar
 from minapari.utils.colormaps.standardize_color import transform_color
 from minapari.utils.compat import StrEnum
-from minapari.utils.events import EventedModel
+from minapari.utils.events import EmitterGroup, EventedModel
 from minapari.utils.events.custom_types import Array
 from minapari.utils.events.migrations import deprecated_class_name
 from minapari.utils.translations import trans
@@ -29,6 +29,7 @@ if TYPE_CHECKING:
 
 
 __all__ = (
+    'DEFAULT_LUT_RESOLUTION',
     'Colormap',
     'ColormapInterpolationMode',
     'CyclicLabelColormap',
@@ -36,6 +37,10 @@ __all__ = (
 )
 
 
+#: Default number of samples of the colormap lookup tables.
+DEFAULT_LUT_RESOLUTION = 1024
+
+
 class ColormapInterpolationMode(StrEnum):
     """INTERPOLATION: Interpolation mode for colormaps.
 
@@ -74,6 +79,11 @@ class Colormap(EventedModel):
         Mapping for values equal to or greater than 1.
     low_color : ColorValue
         Mapping for values equal to or less than 0.
+    lut_resolution : int
+        Number of samples of the lookup table used by ``map`` to map
+        float values, set on creation. The table is built on first use and
+        rebuilt after the colors, controls, interpolation or special colors
+        change.
     """
 
     # fields
@@ -85,15 +95,59 @@ class Colormap(EventedModel):
     nan_color: ColorValue = ColorValue('transparent')
     high_color: ColorValue | None = None
     low_color: ColorValue | None = None
+    _lut_resolution: int = PrivateAttr(DEFAULT_LUT_RESOLUTION)
+    _lut: np.ndarray | None = PrivateAttr(None)
+    _int_luts: dict[np.dtype, np.ndarray] = PrivateAttr(default_factory=dict)
 
     def __init__(
-        self, colors, display_name: str | None = None, **data
+        self,
+        colors,
+        display_name: str | None = None,
+        lut_resolution: int = DEFAULT_LUT_RESOLUTION,
+        **data,
     ) -> None:
         if display_name is None:
             display_name = data.get('name', 'custom')
+        if lut_resolution < 2:
+            raise ValueError(
+                trans._(
+                    'lut_resolution must be at least 2, got {lut_resolution}',
+                    deferred=True,
+                    lut_resolution=lut_resolution,
+                )
+            )
 
         super().__init__(colors=colors, **data)
         self._display_name = display_name
+        self._lut_resolution = int(lut_resolution)
+        self._connect_clear_lut()
+
+    def _connect_clear_lut(self) -> None:
+        """Drop the lookup tables whenever a field they depend on changes."""
+        for name in (
+            'colors',
+            'controls',
+            'interpolation',
+            'nan_color',
+            'high_color',
+            'low_color',
+        ):
+            getattr(self.events, name).connect(self._clear_lut)
+
+    def copy(self, **kwargs) -> Self:
+        """Copy the colormap, with its own events and lookup tables.
+
+        The copy made by pydantic shares the events and the cached lookup
+        tables of the original, so that changing its colors would leave
+        its lookup tables stale, and notify the listeners of the original.
+        """
+        copied = super().copy(**kwargs)
+        copied._events = EmitterGroup(source=copied)
+        copied._events.add(**dict.fromkeys(self.events.emitters))
+        copied._reset_event_source()
+        copied._clear_lut()
+        copied._connect_clear_lut()
+        return copied
 
     # controls validator must be called even if None for correct initialization
     @validator('controls', pre=True, always=True, allow_reuse=True)
@@ -146,16 +200,25 @@ class Colormap(EventedModel):
     def __len__(self):
         return len(self.colors)
 
-    def map(self, values):
-        values = np.atleast_1d(values)
+    @property
+    def lut_resolution(self) -> int:
+        return self._lut_resolution
+
+    def _clear_lut(self, event=None) -> None:
+        """Drop the lookup tables, they are rebuilt on the next ``map``."""
+        self._lut = None
+        self._int_luts = {}
+
+    def _interpolate(self, values: np.ndarray) -> np.ndarray:
+        """Interpolate the colors of the control points at the values."""
         if self.interpolation == ColormapInterpolationMode.LINEAR:
             # One color per control point
             cols = [
                 np.interp(values, self.controls, self.colors[:, i])
                 for i in range(4)
             ]
-            cols = np.stack(cols, axis=-1)
-        elif self.interpolation == ColormapInterpolationMode.ZERO:
+            return np.stack(cols, axis=-1)
+        if self.interpolation == ColormapInterpolationMode.ZERO:
             # One color per bin
             # Colors beyond max clipped to final bin
             indices = np.clip(
@@ -163,15 +226,17 @@ class Colormap(EventedModel):
                 0,
                 len(self.colors) - 1,
             )
-            cols = self.colors[indices.astype(np.int32)]
-        else:
-            raise ValueError(
-                trans._(
-                    'Unrecognized Colormap Interpolation Mode',
-                    deferred=True,
-                )
+            return self.colors[indices.astype(np.int32)]
+        raise ValueError(
+            trans._(
+                'Unrecognized Colormap Interpolation Mode',
+                deferred=True,
             )
+        )
 
+    def _map_exact(self, values: np.ndarray) -> np.ndarray:
+        """Map values to colors without lookup tables."""
+        cols = self._interpolate(values)
         values = values[..., None]
         # map NaNs, lows, and highs
         cols = np.where(np.isnan(values), self.nan_color, cols)
@@ -182,6 +247,70 @@ class Colormap(EventedModel):
 
         return cols
 
+    def _get_lut(self) -> np.ndarray:
+        """Lookup table of the colormap, for float values.
+
+        The first ``lut_resolution`` rows sample the colormap uniformly over
+        [0, 1], followed by the colors of NaN, high and low values.
+        """
+        if self._lut is None:
+            samples = np.linspace(0, 1, self._lut_resolution)
+            samples = self._interpolate(samples)
+            special = self._map_exact(np.array([np.nan, 1, 0]))
+            self._lut = np.concatenate([samples, special])
+        return self._lut
+
+    def _get_int_lut(self, dtype: np.dtype) -> np.ndarray:
+        """Lookup table indexed directly by integer values of a dtype.
+
+        Signed values index the table through their unsigned view. For
+        dtypes larger than 16 bits, the table has 3 rows indexed by the
+        values clipped to [-1, 1], plus 1.
+        """
+        if dtype not in self._int_luts:
+            if dtype.itemsize <= 2:
+                unsigned = np.dtype(f'u{dtype.itemsize}')
+                values = np.arange(2 ** (8 * dtype.itemsize), dtype=unsigned)
+                values = values.view(dtype)
+            else:
+                values = np.array([-1, 0, 1])
+            self._int_luts[dtype] = self._map_exact(values.astype(np.float64))
+        return self._int_luts[dtype]
+
+    def map(self, values):
+        """Map values to colors.
+
+        With linear interpolation, float values are mapped with a lookup
+        table of ``lut_resolution`` samples, integer and boolean values
+        index an exact table of all the values of their dtype. Colormaps
+        with zero interpolation map values exactly, since a sampled table
+        would misplace the values close to their control points.
+
+        Parameters
+        ----------
+        values : array-like
+            Values to be mapped, normally within [0, 1].
+
+        Returns
+        -------
+        np.ndarray of same shape as values, but with last dimension of size 4
+            Mapped colors.
+        """
+        values = np.atleast_1d(values)
+        if self.interpolation == ColormapInterpolationMode.ZERO:
+            return self._map_exact(values)
+        if values.dtype == bool:
+            values = values.view(np.uint8)
+        if values.dtype.kind in 'iu':
+            lut = self._get_int_lut(values.dtype)
+            if values.dtype.itemsize <= 2:
+                unsigned = np.dtype(f'u{values.dtype.itemsize}')
+                return np.take(lut, values.view(unsigned), axis=0)
+            return np.take(lut, np.clip(values, -1, 1) + 1, axis=0)
+        if values.dtype.kind != 'f' or values.dtype.itemsize < 4:
+            values = values.astype(np.float32)
+        return _accel_cmap.map_with_lut(values, self._get_lut())
+
     @property
     def colorbar(self):
         return make_colorbar(self)
@@ -3,7 +3,7 @@ from collections import OrderedDict, defaultdict
 from collections.abc import Iterable
 from functools import lru_cache
 from threading import Lock
-from typing import NamedTuple, Union
+from typing import TYPE_CHECKING, NamedTuple, Union
 
 import numpy as np
 import skimage.color as colorconv
@@ -26,7 +26,6 @@ from minapari.utils.colormaps.colormap import (
 )
 from minapari.utils.colormaps.inverse_colormaps import inverse_cmaps
 from minapari.utils.colormaps.standardize_color import transform_color
-from minapari.utils.colormaps.vendored.cm import cmap_d
 from minapari.utils.translations import trans
 
 # All parsable input color types that a user can provide
@@ -103,69 +102,6 @@ _PRIMARY_COLORS = OrderedDict(
     gray=(trans._p('colormap', 'gray'), [1.0, 1.0, 1.0]),
 )
 
-SIMPLE_COLORMAPS = {
-    name: Colormap(
-        name=name, display_name=display_name, colors=[[0.0, 0.0, 0.0], color]
-    )
-    for name, (display_name, color) in _PRIMARY_COLORS.items()
-}
-
-# readd fire and ice colormap for backwards compatibility (see #7858)
-VISPY_OLD_COLORMAPS = {
-    'fire': Colormap(
-        name='fire',
-        display_name='fire',
-        colors=[
-            [1.0, 1.0, 1.0, 1.0],
-            [1.0, 1.0, 0.0, 1.0],
-            [1.0, 0.0, 0.0, 1.0],
-        ],
-    ),
-    'ice': Colormap(
-        name='ice',
-        display_name='ice',
-        colors=[[0.0, 0.0, 1.0, 1.0], [1.0, 1.0, 1.0, 1.0]],
-    ),
-}
-
-# dictionary for bop colormap objects
-BOP_COLORMAPS = {
-    name: Colormap(value, name=name, display_name=display_name)
-    for name, (display_name, value) in bopd.items()
-}
-
-INVERSE_COLORMAPS = {
-    name: Colormap(value, name=name, display_name=display_name)
-    for name, (display_name, value) in inverse_cmaps.items()
-}
-
-# Add the reversed grayscale colormap (white to black) to inverse colormaps
-INVERSE_COLORMAPS.update(
-    {
-        'gray_r': Colormap(
-            name='gray_r',
-            display_name='gray r',
-            colors=[[1.0, 1.0, 1.0], [0.0, 0.0, 0.0]],
-        ),
-    }
-)
-
-DISCONTINUOUS_COLORMAPS = {
-    'HiLo': Colormap(
-        name='HiLo',
-        display_name='HiLo',
-        colors=[[0.0, 0.0, 0.0, 1.0], [1.0, 1.0, 1.0, 1.0]],
-        high_color=[1.0, 0.0, 0.0, 1.0],
-        low_color=[0.0, 0.0, 1.0, 1.0],
-    ),
-    'nan': Colormap(
-        name='nan',
-        display_name='NaN',
-        colors=[[0.0, 0.0, 0.0, 1.0], [1.0, 1.0, 1.0, 1.0]],
-        bad_color=[1.0, 0.0, 0.0, 1.0],
-    ),
-}
-
 _FLOAT32_MAX = float(np.finfo(np.float32).max)
 _MAX_VISPY_SUPPORTED_VALUE = _FLOAT32_MAX / 8
 # Using 8 as divisor comes from experiments.
@@ -658,6 +594,9 @@ def vispy_or_mpl_colormap(name) -> Colormap:
     KeyError
         If no colormap with that name is found within vispy or matplotlib.
     """
+    # The vendored matplotlib colormaps are only loaded when needed.
+    from minapari.utils.colormaps.vendored.cm import cmap_d
+
     if name in _VISPY_COLORMAPS_TRANSLATIONS:
         cmap = get_colormap(name)
         colormap = convert_vispy_colormap(cmap, name=name)
@@ -696,20 +635,6 @@ def vispy_or_mpl_colormap(name) -> Colormap:
     return colormap
 
 
-# A dictionary mapping names to VisPy colormap objects
-ALL_COLORMAPS = {
-    k: vispy_or_mpl_colormap(k) for k in _MATPLOTLIB_COLORMAP_NAMES
-}
-ALL_COLORMAPS.update(SIMPLE_COLORMAPS)
-ALL_COLORMAPS.update(VISPY_OLD_COLORMAPS)
-ALL_COLORMAPS.update(BOP_COLORMAPS)
-ALL_COLORMAPS.update(INVERSE_COLORMAPS)
-ALL_COLORMAPS.update(DISCONTINUOUS_COLORMAPS)
-
-# ... sorted alphabetically by name
-AVAILABLE_COLORMAPS = dict(
-    sorted(ALL_COLORMAPS.items(), key=lambda cmap: cmap[0].lower())
-)
 # lock to allow update of AVAILABLE_COLORMAPS in threads
 AVAILABLE_COLORMAPS_LOCK = Lock()
 
@@ -721,9 +646,150 @@ RGB = ['red', 'green', 'blue']
 CMYBGR = ['cyan', 'magenta', 'yellow', 'blue', 'green', 'red']
 CYMRGB = ['cyan', 'yellow', 'magenta', 'red', 'green', 'blue']
 
-AVAILABLE_LABELS_COLORMAPS = {
-    'lodisc-50': label_colormap(50),
-}
+# The builtin colormaps are only created when first used, since creating
+# them validates dozens of Colormap models and loads the vendored matplotlib
+# tables. Module attributes with these names are built on first access by
+# the module __getattr__, functions of this module must call
+# _ensure_colormap_registry() before using them.
+_COLORMAP_REGISTRY_NAMES = (
+    'SIMPLE_COLORMAPS',
+    'VISPY_OLD_COLORMAPS',
+    'BOP_COLORMAPS',
+    'INVERSE_COLORMAPS',
+    'DISCONTINUOUS_COLORMAPS',
+    'ALL_COLORMAPS',
+    'AVAILABLE_COLORMAPS',
+    'AVAILABLE_LABELS_COLORMAPS',
+)
+_COLORMAP_REGISTRY_LOCK = Lock()
+_colormap_registry_built = False
+
+if TYPE_CHECKING:
+    # Only declared for linters and type checkers: at runtime these names
+    # must stay unbound until the module __getattr__ builds them.
+    SIMPLE_COLORMAPS: dict[str, Colormap] = {}
+    VISPY_OLD_COLORMAPS: dict[str, Colormap] = {}
+    BOP_COLORMAPS: dict[str, Colormap] = {}
+    INVERSE_COLORMAPS: dict[str, Colormap] = {}
+    DISCONTINUOUS_COLORMAPS: dict[str, Colormap] = {}
+    ALL_COLORMAPS: dict[str, Colormap] = {}
+    AVAILABLE_COLORMAPS: dict[str, Colormap] = {}
+    AVAILABLE_LABELS_COLORMAPS: dict[str, CyclicLabelColormap] = {}
+
+
+def _build_colormap_registry() -> dict[str, dict]:
+    """Create the builtin colormaps.
+
+    Returns
+    -------
+    dict
+        The colormap dictionaries of the registry, by module attribute name.
+    """
+    simple_colormaps = {
+        name: Colormap(
+            name=name,
+            display_name=display_name,
+            colors=[[0.0, 0.0, 0.0], color],
+        )
+        for name, (display_name, color) in _PRIMARY_COLORS.items()
+    }
+
+    # readd fire and ice colormap for backwards compatibility (see #7858)
+    vispy_old_colormaps = {
+        'fire': Colormap(
+            name='fire',
+            display_name='fire',
+            colors=[
+                [1.0, 1.0, 1.0, 1.0],
+                [1.0, 1.0, 0.0, 1.0],
+                [1.0, 0.0, 0.0, 1.0],
+            ],
+        ),
+        'ice': Colormap(
+            name='ice',
+            display_name='ice',
+            colors=[[0.0, 0.0, 1.0, 1.0], [1.0, 1.0, 1.0, 1.0]],
+        ),
+    }
+
+    # dictionary for bop colormap objects
+    bop_colormaps = {
+        name: Colormap(value, name=name, display_name=display_name)
+        for name, (display_name, value) in bopd.items()
+    }
+
+    inverse_colormaps = {
+        name: Colormap(value, name=name, display_name=display_name)
+        for name, (display_name, value) in inverse_cmaps.items()
+    }
+
+    # Add the reversed grayscale colormap (white to black) to inverse
+    # colormaps
+    inverse_colormaps['gray_r'] = Colormap(
+        name='gray_r',
+        display_name='gray r',
+        colors=[[1.0, 1.0, 1.0], [0.0, 0.0, 0.0]],
+    )
+
+    discontinuous_colormaps = {
+        'HiLo': Colormap(
+            name='HiLo',
+            display_name='HiLo',
+            colors=[[0.0, 0.0, 0.0, 1.0], [1.0, 1.0, 1.0, 1.0]],
+            high_color=[1.0, 0.0, 0.0, 1.0],
+            low_color=[0.0, 0.0, 1.0, 1.0],
+        ),
+        'nan': Colormap(
+            name='nan',
+            display_name='NaN',
+            colors=[[0.0, 0.0, 0.0, 1.0], [1.0, 1.0, 1.0, 1.0]],
+            bad_color=[1.0, 0.0, 0.0, 1.0],
+        ),
+    }
+
+    # A dictionary mapping names to VisPy colormap objects
+    all_colormaps = {
+        k: vispy_or_mpl_colormap(k) for k in _MATPLOTLIB_COLORMAP_NAMES
+    }
+    all_colormaps.update(simple_colormaps)
+    all_colormaps.update(vispy_old_colormaps)
+    all_colormaps.update(bop_colormaps)
+    all_colormaps.update(inverse_colormaps)
+    all_colormaps.update(discontinuous_colormaps)
+
+    return {
+        'SIMPLE_COLORMAPS': simple_colormaps,
+        'VISPY_OLD_COLORMAPS': vispy_old_colormaps,
+        'BOP_COLORMAPS': bop_colormaps,
+        'INVERSE_COLORMAPS': inverse_colormaps,
+        'DISCONTINUOUS_COLORMAPS': discontinuous_colormaps,
+        'ALL_COLORMAPS': all_colormaps,
+        # ... sorted alphabetically by name
+        'AVAILABLE_COLORMAPS': dict(
+            sorted(all_colormaps.items(), key=lambda cmap: cmap[0].lower())
+        ),
+        'AVAILABLE_LABELS_COLORMAPS': {
+            'lodisc-50': label_colormap(50),
+        },
+    }
+
+
+def _ensure_colormap_registry() -> None:
+    """Create the builtin colormaps if they were not created yet."""
+    global _colormap_registry_built
+    if _colormap_registry_built:
+        return
+    with _COLORMAP_REGISTRY_LOCK:
+        if not _colormap_registry_built:
+            globals().update(_build_colormap_registry())
+            _colormap_registry_built = True
+
+
+def __getattr__(name: str):
+    if name in _COLORMAP_REGISTRY_NAMES:
+        _ensure_colormap_registry()
+        return globals()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def _increment_unnamed_colormap(
@@ -791,6 +857,7 @@ def ensure_colormap(colormap: ValidColormapArg) -> Colormap:
         If a dict is provided and any of the values are not Colormap instances
         or valid inputs to the Colormap constructor.
     """
+    _ensure_colormap_registry()
     with AVAILABLE_COLORMAPS_LOCK:
         if isinstance(colormap, str):
             # when black given as end color, want reversed grayscale colormap
@@ -963,6 +1030,7 @@ def make_default_color_array():
 
 
 def display_name_to_name(display_name):
+    _ensure_colormap_registry()
     display_name_map = {
         v._display_name: k for k, v in AVAILABLE_COLORMAPS.items()
     }
@@ -977,10 +1045,18 @@ class CoercedContrastLimits(NamedTuple):
     scale: float
 
     def coerce_data(self, data: np.ndarray) -> np.ndarray:
-        if self.scale <= 1:
-            return data * self.scale + self.offset
+        """Rescale data to the coerced contrast limits, as float32.
 
-        return (data + self.offset / self.scale) * self.scale
+        The data is rescaled in a single float64 buffer, and converted once
+        to float32, the texture dtype it would be converted to anyway.
+        """
+        if self.scale <= 1:
+            out = np.multiply(data, self.scale, dtype=np.float64)
+            out += self.offset
+        else:
+            out = np.add(data, self.offset / self.scale, dtype=np.float64)
+            out *= self.scale
+        return out.astype(np.float32)
 
 
 def _coerce_contrast_limits(contrast_limits: tuple[float, float]):
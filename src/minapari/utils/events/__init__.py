@@ -1,6 +1,7 @@
 from minapari.utils.events.event import (  # isort:skip
     EmitterGroup,
     Event,
+    EventBatcher,
     EventEmitter,
     set_event_tracing_enabled,
 )
@@ -20,6 +21,7 @@ from minapari.utils.events.types import SupportsEvents
 __all__ = [
     'EmitterGroup',
     'Event',
+    'EventBatcher',
     'EventEmitter',
     'EventedDict',
     'EventedList',
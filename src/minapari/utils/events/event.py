@@ -291,6 +291,12 @@ class EventEmitter:
         self._blocked: dict[Callback | None, int] = {None: 0}
         self._block_counter: _WeakCounter[Callback | None] = _WeakCounter()
 
+        # callbacks with their pass_event flag and whether they are weakly
+        # referenced methods, rebuilt after connect and disconnect
+        self._dispatch: tuple[tuple[Any, bool, bool], ...] | None = None
+        # batch collecting the events of this emitter, see EventBatcher
+        self._batch: _EventBatch | None = None
+
         # used to detect emitter loops
         self._emitting = False
         self.source = source
@@ -563,6 +569,7 @@ class EventEmitter:
         self._callbacks.insert(idx, callback)
         self._callback_refs.insert(idx, _ref)
         self._callback_pass_event.insert(idx, pass_event)
+        self._dispatch = None
 
         if until is not None:
             until.connect(partial(self.disconnect, callback))
@@ -577,6 +584,7 @@ class EventEmitter:
         If no callback is specified, then *all* callbacks are removed.
         If the callback was not already connected, then the call does nothing.
         """
+        self._dispatch = None
         if callback is None:
             self._callbacks = []
             self._callback_refs = []
@@ -708,6 +716,13 @@ class EventEmitter:
         # create / massage event as needed
         event = self._prepare_event(*args, **kwargs)
 
+        if self._batch is not None:
+            if blocked.get(None, 0) > 0:
+                self._block_counter.update([None])
+            else:
+                self._batch.add(self, event)
+            return event
+
         # Add our source to the event; remove it after all callbacks have been
         # invoked.
         event._push_source(self.source)
@@ -719,11 +734,22 @@ class EventEmitter:
 
             _log_event_stack(event)
 
+            dispatch = self._dispatch
+            if dispatch is None:
+                dispatch = self._dispatch = tuple(
+                    (cb, pass_event, isinstance(cb, tuple))
+                    for cb, pass_event in zip(
+                        self._callbacks,
+                        self._callback_pass_event,
+                        strict=False,
+                    )
+                )
+            # Only look callbacks up in `blocked` if any of them is blocked.
+            any_blocked = len(blocked) > 1
+
             rem: list[CallbackRef] = []
-            for cb, pass_event in zip(
-                self._callbacks[:], self._callback_pass_event[:], strict=False
-            ):
-                if isinstance(cb, tuple):
+            for cb, pass_event, is_ref in dispatch:
+                if is_ref:
                     obj = cb[0]()
                     if obj is None:
                         rem.append(cb)  # add dead weakref
@@ -745,7 +771,7 @@ class EventEmitter:
                         continue
                     cb = cast(Callback, cb)
 
-                if blocked.get(cb, 0) > 0:
+                if any_blocked and blocked.get(cb, 0) > 0:
                     self._block_counter.update([cb])
                     continue
 
@@ -865,6 +891,18 @@ class EventEmitter:
         """
         return EventBlocker(self, callback)
 
+    def batch(self) -> 'EventBatcher':
+        """Return an EventBatcher to be used in 'with' statements
+
+        Notes
+        -----
+        For example, one could do::
+
+            with emitter.batch():
+                pass  # ..do stuff; only the last event is emitted on exit..
+        """
+        return EventBatcher(self)
+
 
 class WarningEmitter(EventEmitter):
     """
@@ -1161,6 +1199,81 @@ class EmitterGroup(EventEmitter):
         return EventBlockerAll(self)
 
 
+class _EventBatch:
+    """Last event of each emitter of a batch, in the order they were emitted."""
+
+    def __init__(self) -> None:
+        self._events: dict[EventEmitter, Event] = {}
+
+    def add(self, emitter: EventEmitter, event: Event) -> None:
+        # Move the emitter to the end, so that events are emitted in the
+        # order of their last emission.
+        self._events.pop(emitter, None)
+        self._events[emitter] = event
+
+    def pop_all(self) -> list[tuple[EventEmitter, Event]]:
+        events = list(self._events.items())
+        self._events.clear()
+        return events
+
+
+class EventBatcher:
+    """Collects events of emitters in a 'with' statement and emits them on exit.
+
+    While the block runs, emitting does not invoke any callback. On exit,
+    each emitter that was called emits once, with the last event it was
+    called with, since that event describes the final state. Events are
+    emitted in the order of their last emission. EmitterGroups batch all of
+    their emitters.
+
+    Emitters that are already batched by an enclosing EventBatcher keep
+    their events until that one exits.
+
+    Parameters
+    ----------
+    *targets : EventEmitter
+        Emitters and emitter groups to batch.
+
+    Notes
+    -----
+    For example, to update several properties of several layers and only
+    refresh each of them once::
+
+        with EventBatcher(*(layer.events for layer in layers)):
+            for layer in layers:
+                layer.contrast_limits = (0, 100)
+                layer.gamma = 0.8
+    """
+
+    def __init__(self, *targets: EventEmitter) -> None:
+        self.targets = targets
+        self._emitters: list[EventEmitter] = []
+        self._batch = _EventBatch()
+
+    def __enter__(self):
+        for emitter in _iter_emitters(self.targets):
+            if emitter._batch is None:
+                emitter._batch = self._batch
+                self._emitters.append(emitter)
+        return self
+
+    def __exit__(self, *args):
+        for emitter in self._emitters:
+            emitter._batch = None
+        self._emitters.clear()
+        for emitter, event in self._batch.pop_all():
+            emitter(event)
+
+
+def _iter_emitters(
+    targets: Iterable[EventEmitter],
+) -> Iterator[EventEmitter]:
+    for target in targets:
+        yield target
+        if isinstance(target, EmitterGroup):
+            yield from _iter_emitters(target.emitters.values())
+
+
 class EventBlocker:
     """Represents a block for an EventEmitter to be used in a context
     manager (i.e. 'with' statement).
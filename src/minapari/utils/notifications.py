@@ -230,6 +230,11 @@ class NotificationManager:
         self.notification_ready = self.changed = EventEmitter(
             source=self, event_class=Notification
         )
+        # Emitted with the exception for every error received, before it is
+        # handled, also when it is not caught or ends the process.
+        self.error_received = EventEmitter(
+            source=self, type_name='error_received'
+        )
         self._originals_except_hooks: list[Callable] = []
         self._original_showwarnings_hooks: list[Callable] = []
         self._originals_thread_except_hooks: list[Callable] = []
@@ -292,6 +297,7 @@ class NotificationManager:
         if isinstance(value, KeyboardInterrupt):
             sys.exit('Closed by KeyboardInterrupt')
 
+        self.error_received(value=value)
         if self.exit_on_error:
             sys.__excepthook__(exctype, value, traceback)
             sys.exit('Exit on error')
@@ -36,8 +36,20 @@ Add a line to the config file like:
 
     "trace_file_on_start": "/Path/to/my/trace.json"
 
-Perfmon will start tracing on startup. You must quit napari with the Quit
-command for napari to write trace file. See PerfmonConfig docs.
+Perfmon will start tracing on startup. Events are written to the file as
+they come, but you must quit napari with the Quit command for napari to
+finish the trace file. A path ending with ".gz" writes a gzip compressed
+trace. See PerfmonConfig docs.
+
+Flight Recorder
+---------------
+Add a line to the config file like:
+
+    "flight_recorder_seconds": 30
+
+Perfmon will keep the events of the last 30 seconds in memory, and write
+them to a trace file if an exception is not handled. Call
+timers.dump_flight_recorder() to write them at any time.
 
 Manual Timing
 -------------
@@ -59,6 +59,8 @@ class PerfmonConfig:
     {
         "trace_qt_events": true,
         "trace_file_on_start": "/Path/To/latest.json",
+        "flight_recorder_seconds": 30,
+        "flight_recorder_path": "/Path/To/crash-{time}.json.gz",
         "trace_callables": [
             "my_callables_1",
             "my_callables_2",
@@ -157,6 +159,24 @@ class PerfmonConfig:
         else:
             return path or None
 
+    @property
+    def flight_recorder_seconds(self) -> float | None:
+        """Return how many seconds of events to keep in memory, or None.
+
+        The events are dumped to ``flight_recorder_path`` when an exception
+        is not handled.
+        """
+        if self.config_path is None:
+            return None
+        return self.data.get('flight_recorder_seconds') or None
+
+    @property
+    def flight_recorder_path(self) -> str | None:
+        """Return path of the flight recorder dumps or None."""
+        if self.config_path is None:
+            return None
+        return self.data.get('flight_recorder_path') or None
+
 
 def _create_perf_config() -> PerfmonConfig | None:
     value = os.getenv('NAPARI_PERFMON')
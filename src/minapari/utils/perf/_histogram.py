@@ -0,0 +1,134 @@
+"""LatencyHistogram class."""
+
+import math
+
+
+class LatencyHistogram:
+    """Histogram of durations with a bounded relative error.
+
+    Like HdrHistogram, values are counted in buckets whose width grows with
+    the value: each range between two powers of two of ``resolution`` is
+    split into ``2**significant_bits`` buckets. Percentiles are then exact
+    to within ``2**-significant_bits`` of their value, whatever their
+    magnitude, and the number of buckets only grows with the logarithm of
+    the largest value.
+
+    Parameters
+    ----------
+    resolution : float
+        Smallest difference between two values that is resolved. With
+        durations in milliseconds, the default is one microsecond.
+    significant_bits : int
+        Binary digits of precision kept for each value.
+
+    Attributes
+    ----------
+    count : int
+        How many values we've seen.
+    counts : Dict[int, int]
+        Number of values in each bucket, by bucket index.
+    """
+
+    def __init__(
+        self, resolution: float = 1e-3, significant_bits: int = 7
+    ) -> None:
+        self.resolution = resolution
+        self.significant_bits = significant_bits
+        self.count = 0
+        self.counts: dict[int, int] = {}
+
+    def _index(self, value: float) -> int:
+        """Return the index of the bucket of a value."""
+        quantum = max(int(value / self.resolution), 0)
+        shift = max(quantum.bit_length() - self.significant_bits - 1, 0)
+        return (shift << self.significant_bits) + (quantum >> shift)
+
+    def _bounds(self, index: int) -> tuple[float, float]:
+        """Return the lower and upper bounds of the values of a bucket."""
+        shift = max((index >> self.significant_bits) - 1, 0)
+        mantissa = index - (shift << self.significant_bits)
+        return (
+            (mantissa << shift) * self.resolution,
+            ((mantissa + 1) << shift) * self.resolution,
+        )
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a new value.
+
+        Parameters
+        ----------
+        value : float
+            The new value, negative values are counted as 0.
+        count : int
+            Number of times the value is added.
+        """
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add the values of another histogram to this one.
+
+        Parameters
+        ----------
+        other : LatencyHistogram
+            Histogram with the same resolution and significant bits.
+        """
+        if (other.resolution, other.significant_bits) != (
+            self.resolution,
+            self.significant_bits,
+        ):
+            raise ValueError('histograms have different buckets')
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+
+    def percentiles(self, qs: 'list[float]') -> list[float]:
+        """Return several percentiles of the values.
+
+        Parameters
+        ----------
+        qs : list of float
+            Percentiles to compute, between 0 and 100.
+
+        Returns
+        -------
+        list of float
+            The middle of the bucket of each percentile, in the same order
+            as ``qs``.
+        """
+        if self.count == 0:
+            raise ValueError('no values')
+        # Rank of the value of each percentile, visited in increasing order.
+        ranks = sorted(
+            (max(math.ceil(q / 100 * self.count), 1), i)
+            for i, q in enumerate(qs)
+        )
+        results = [0.0] * len(qs)
+        seen = 0
+        pending = iter(ranks)
+        rank, i = next(pending, (None, None))
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while rank is not None and rank <= seen:
+                low, high = self._bounds(index)
+                results[i] = (low + high) / 2
+                rank, i = next(pending, (None, None))
+            if rank is None:
+                break
+        return results
+
+    def percentile(self, q: float) -> float:
+        """Return one percentile of the values.
+
+        Parameters
+        ----------
+        q : float
+            Percentile to compute, between 0 and 100.
+
+        Returns
+        -------
+        float
+            The middle of the bucket of the percentile.
+        """
+        return self.percentiles([q])[0]
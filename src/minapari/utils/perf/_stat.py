@@ -1,60 +1,171 @@
 """Stat class."""
 
+import math
+
+from minapari.utils.perf._histogram import LatencyHistogram
+
+# The percentiles reported by Stat.as_dict().
+PERCENTILES = (50, 90, 95, 99)
+
 
 class Stat:
-    """Keep min/max/average on an integer value.
+    """Keep min/max/average and a latency histogram on a duration.
 
     Parameters
     ----------
-    value : int
-        The first value to keep statistics on.
+    value : float, optional
+        The first duration to keep statistics on, in milliseconds. If None,
+        the Stat starts empty.
+    self_value : float, optional
+        The part of the first duration not spent in nested timers. By
+        default, the whole duration.
 
     Attributes
     ----------
-    min : int
+    min : float
         Minimum value so far.
-    max : int
+    max : float
         Maximum value so far.
-    sum : int
+    sum : float
         Sum of all values seen.
+    self_sum : float
+        Sum of all values seen minus the time spent in nested timers.
     count : int
         How many values we've seen.
+    histogram : LatencyHistogram
+        Histogram of all values seen, for percentiles.
+    children : Dict[str, float]
+        Time spent in each directly nested timer, by timer name.
     """
 
-    def __init__(self, value: int) -> None:
+    def __init__(
+        self, value: float | None = None, self_value: float | None = None
+    ) -> None:
         """Create Stat with an initial value.
 
         Parameters
         ----------
-        value : int
+        value : float, optional
             Initial value.
+        self_value : float, optional
+            Initial value minus the time spent in nested timers.
         """
-        self.min = value
-        self.max = value
-        self.sum = value
-        self.count = 1
+        self.min = math.inf
+        self.max = -math.inf
+        self.sum = 0.0
+        self.self_sum = 0.0
+        self.count = 0
+        self.histogram = LatencyHistogram()
+        self.children: dict[str, float] = {}
+        if value is not None:
+            self.add(value, self_value)
 
-    def add(self, value: int) -> None:
+    def add(self, value: float, self_value: float | None = None) -> None:
         """Add a new value.
 
         Parameters
         ----------
-        value : int
+        value : float
             The new value.
+        self_value : float, optional
+            The new value minus the time spent in nested timers. By
+            default, the whole value.
         """
         self.sum += value
+        self.self_sum += value if self_value is None else self_value
         self.count += 1
         self.max = max(self.max, value)
         self.min = min(self.min, value)
+        self.histogram.add(value)
+
+    def add_child(self, name: str, value: float) -> None:
+        """Add time spent in a directly nested timer.
+
+        Parameters
+        ----------
+        name : str
+            Name of the nested timer.
+        value : float
+            Time spent in it.
+        """
+        self.children[name] = self.children.get(name, 0.0) + value
+
+    def merge(self, other: 'Stat') -> None:
+        """Add the values of another Stat to this one.
+
+        Parameters
+        ----------
+        other : Stat
+            The Stat to add.
+        """
+        self.sum += other.sum
+        self.self_sum += other.self_sum
+        self.count += other.count
+        self.max = max(self.max, other.max)
+        self.min = min(self.min, other.min)
+        self.histogram.merge(other.histogram)
+        for name, value in other.children.items():
+            self.add_child(name, value)
 
     @property
-    def average(self) -> int:
+    def average(self) -> float:
         """Average value.
 
         Returns
         -------
-        average value : int.
+        average value : float.
+        """
+        if self.count > 0:
+            return self.sum / self.count
+        raise ValueError('no values')  # impossible for us
+
+    @property
+    def self_average(self) -> float:
+        """Average value minus the time spent in nested timers.
+
+        Returns
+        -------
+        average self value : float.
         """
         if self.count > 0:
-            return self.sum // self.count
+            return self.self_sum / self.count
         raise ValueError('no values')  # impossible for us
+
+    def percentile(self, q: float) -> float:
+        """Return a percentile of the values.
+
+        Parameters
+        ----------
+        q : float
+            Percentile to compute, between 0 and 100.
+
+        Returns
+        -------
+        float
+            The percentile, to within 1% of its value.
+        """
+        value = self.histogram.percentile(q)
+        return min(max(value, self.min), self.max)
+
+    def as_dict(self) -> dict:
+        """Return the statistics as a dict that can be written to JSON.
+
+        Returns
+        -------
+        dict
+            Count, total, self total, average, min, max and percentiles
+            of the values, and the time spent in each nested timer.
+        """
+        percentiles = self.histogram.percentiles(list(PERCENTILES))
+        data = {
+            'count': self.count,
+            'total_ms': self.sum,
+            'self_ms': self.self_sum,
+            'average_ms': self.average,
+            'min_ms': self.min,
+            'max_ms': self.max,
+        }
+        for q, value in zip(PERCENTILES, percentiles, strict=True):
+            data[f'p{q}_ms'] = min(max(value, self.min), self.max)
+        data['children_ms'] = dict(self.children)
+        return data
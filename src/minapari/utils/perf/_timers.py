@@ -1,16 +1,22 @@
 """PerfTimers class and global instance."""
 
 import contextlib
+import json
 import os
+from collections import deque
 from collections.abc import Generator
 from time import perf_counter_ns
 
 from minapari.utils.perf._event import PerfEvent
 from minapari.utils.perf._stat import Stat
-from minapari.utils.perf._trace_file import PerfTraceFile
+from minapari.utils.perf._trace_file import PerfFlightRecorder, PerfTraceFile
 
 USE_PERFMON = os.getenv('NAPARI_PERFMON', '0') != '0'
 
+# Completed events of each thread that can still be found to be nested in a
+# later event. Only the most recent ones are kept.
+MAX_NESTING_CANDIDATES = 256
+
 
 class PerfTimers:
     """Timers for performance monitoring.
@@ -19,39 +25,48 @@ class PerfTimers:
     monkey-patch the timers into the code at startup. See
     napari.utils.perf._config for details.
 
-    The collecting timing information can be used in two ways:
+    The collecting timing information can be used in three ways:
     1) Writing a JSON trace file in Chrome's Tracing format.
     2) Napari's real-time QtPerformance widget.
+    3) Latency statistics, see PerfTimers.export_stats().
 
     Attributes
     ----------
     timers : Dict[str, Stat]
-        Statistics are kept on each timer.
+        Statistics are kept on each timer, since the last clear().
+    totals : Dict[str, Stat]
+        Statistics of each timer up to the last clear(), since the last
+        reset().
     trace_file : Optional[PerfTraceFile]
         The tracing file we are writing to if any.
+    flight_recorder : Optional[PerfFlightRecorder]
+        The ring buffer of recent events if any.
 
     Notes
     -----
     Chrome deduces nesting based on the start and end times of each timer. The
     chrome://tracing GUI shows the nesting as stacks of colored rectangles.
 
-    However our self.timers dictionary and thus our QtPerformance widget do not
-    currently understand nesting. So if they say two timers each took 1ms, you
-    can't tell if one called the other or not.
-
-    Despite this limitation when the QtPerformance widget reports slow timers it
-    still gives you a good idea what was slow. And then you can use the
-    chrome://tracing GUI to see the full story.
+    We deduce nesting the same way, for timers of the same thread. Each Stat
+    keeps the time spent in its directly nested timers, so that the "self"
+    time of a timer can be told apart from its total time.
     """
 
     def __init__(self) -> None:
         """Create PerfTimers."""
         # Maps a timer name to one Stat object.
         self.timers: dict[str, Stat] = {}
+        self.totals: dict[str, Stat] = {}
+
+        # Completed events not nested in another event yet, by thread id.
+        self._unparented: dict[int, deque[PerfEvent]] = {}
 
         # Menu item "Debug -> Record Trace File..." starts a trace.
         self.trace_file: PerfTraceFile | None = None
 
+        # Keeps the last events to dump them on demand or on a crash.
+        self.flight_recorder: PerfFlightRecorder | None = None
+
     def add_event(self, event: PerfEvent) -> None:
         """Save an event to performance trace file and
         update the timers if the event has phase 'X'.
@@ -64,15 +79,55 @@ class PerfTimers:
         # Add event if tracing.
         if self.trace_file is not None:
             self.trace_file.add_event(event)
+        if self.flight_recorder is not None:
+            self.flight_recorder.add_event(event)
 
         if event.phase == 'X':  # Complete Event
             # Update our self.timers (in milliseconds).
             name = event.name
-            duration_ms = int(event.duration_ms)
-            if name in self.timers:
-                self.timers[name].add(duration_ms)
-            else:
-                self.timers[name] = Stat(duration_ms)
+            stat = self.timers.get(name)
+            if stat is None:
+                stat = self.timers[name] = Stat()
+            children_ms = self._add_children(event, stat)
+            duration_ms = event.duration_ms
+            stat.add(duration_ms, duration_ms - children_ms)
+
+    def _add_children(self, event: PerfEvent, stat: Stat) -> float:
+        """Find the events directly nested in a complete event.
+
+        Events are added when they end, so the events nested in an event
+        are the last ones of its thread that started after it. They are
+        replaced by the event, which may itself be nested in a later one.
+
+        Parameters
+        ----------
+        event : PerfEvent
+            The complete event.
+        stat : Stat
+            Statistics of the event's timer, to add the nested time to.
+
+        Returns
+        -------
+        float
+            Total duration of the nested events in milliseconds.
+        """
+        thread_id = event.origin.thread_id
+        unparented = self._unparented.get(thread_id)
+        if unparented is None:
+            unparented = self._unparented[thread_id] = deque(
+                maxlen=MAX_NESTING_CANDIDATES
+            )
+        start_ns, end_ns = event.span
+        children_ms = 0.0
+        while unparented:
+            child = unparented[-1]
+            if child.span.start_ns < start_ns or child.span.end_ns > end_ns:
+                break
+            unparented.pop()
+            stat.add_child(child.name, child.duration_ms)
+            children_ms += child.duration_ms
+        unparented.append(event)
+        return children_ms
 
     def add_instant_event(
         self,
@@ -141,10 +196,63 @@ class PerfTimers:
         )
 
     def clear(self) -> None:
-        """Clear all timers."""
+        """Clear all timers, after adding them to the totals."""
         # After the GUI displays timing information it clears the timers
-        # so that we start accumulating fresh information.
-        self.timers.clear()
+        # so that we start accumulating fresh information. Timers may be
+        # added from other threads, e.g. by the slicing threads, so swap
+        # the dict before iterating over it.
+        timers, self.timers = self.timers, {}
+        for name, stat in timers.items():
+            total = self.totals.get(name)
+            if total is None:
+                self.totals[name] = stat
+            else:
+                total.merge(stat)
+
+    def reset(self) -> None:
+        """Clear all timers and totals."""
+        self.timers = {}
+        self.totals = {}
+
+    def get_stats(self) -> dict[str, Stat]:
+        """Return the statistics of each timer since the last reset().
+
+        Returns
+        -------
+        Dict[str, Stat]
+            The statistics of each timer, by timer name.
+        """
+        stats = {}
+        for timers in (self.totals, self.timers):
+            for name, stat in list(timers.items()):
+                if name not in stats:
+                    stats[name] = Stat()
+                stats[name].merge(stat)
+        return stats
+
+    def export_stats(self, path: str | None = None) -> dict[str, dict]:
+        """Export the statistics of each timer since the last reset().
+
+        Parameters
+        ----------
+        path : str, optional
+            Also write the statistics to this path as JSON.
+
+        Returns
+        -------
+        Dict[str, dict]
+            Count, total and self time, average, min, max and percentiles
+            of each timer in milliseconds, by timer name, from the largest
+            total time to the smallest. See Stat.as_dict().
+        """
+        stats = sorted(
+            self.get_stats().items(), key=lambda item: -item[1].sum
+        )
+        data = {name: stat.as_dict() for name, stat in stats}
+        if path is not None:
+            with open(path, 'w') as outf:
+                json.dump(data, outf, indent=2)
+        return data
 
     def start_trace_file(self, path: str) -> None:
         """Start recording a trace file to disk.
@@ -162,6 +270,53 @@ class PerfTimers:
             self.trace_file.close()
             self.trace_file = None
 
+    def start_flight_recorder(
+        self,
+        seconds: float = 30.0,
+        dump_path: str | None = None,
+        dump_on_exception: bool = True,
+    ) -> None:
+        """Start keeping the events of the last seconds in memory.
+
+        Parameters
+        ----------
+        seconds : float
+            Age of the oldest events kept, in seconds.
+        dump_path : str, optional
+            Default path of the dumped trace files, see PerfFlightRecorder.
+        dump_on_exception : bool
+            Dump the events when an exception is not handled.
+        """
+        self.stop_flight_recorder()
+        self.flight_recorder = PerfFlightRecorder(
+            seconds, dump_path=dump_path, dump_on_exception=dump_on_exception
+        )
+
+    def dump_flight_recorder(self, path: str | None = None) -> str | None:
+        """Write the recent events to a trace file.
+
+        Parameters
+        ----------
+        path : str, optional
+            Write the trace to this path, by default the dump path of the
+            flight recorder.
+
+        Returns
+        -------
+        str or None
+            Path of the trace file, None if the flight recorder is not
+            running.
+        """
+        if self.flight_recorder is None:
+            return None
+        return self.flight_recorder.dump(path)
+
+    def stop_flight_recorder(self) -> None:
+        """Stop keeping recent events."""
+        if self.flight_recorder is not None:
+            self.flight_recorder.close()
+            self.flight_recorder = None
+
 
 @contextlib.contextmanager
 def block_timer(
@@ -239,6 +394,7 @@ class DummyTimer:
 
     def __init__(self) -> None:
         self.trace_file = None
+        self.flight_recorder = None
 
     def add_instant_event(
         self, name: str, **kwargs: str | float | None
@@ -257,6 +413,34 @@ class DummyTimer:
     def stop_trace_file(self) -> None:
         """empty timer to use when perfmon is disabled"""
 
+    def clear(self) -> None:
+        """empty timer to use when perfmon is disabled"""
+
+    def reset(self) -> None:
+        """empty timer to use when perfmon is disabled"""
+
+    def get_stats(self) -> dict[str, Stat]:
+        """empty timer to use when perfmon is disabled"""
+        return {}
+
+    def export_stats(self, path: str | None = None) -> dict[str, dict]:
+        """empty timer to use when perfmon is disabled"""
+        return {}
+
+    def start_flight_recorder(
+        self,
+        seconds: float = 30.0,
+        dump_path: str | None = None,
+        dump_on_exception: bool = True,
+    ) -> None:
+        """empty timer to use when perfmon is disabled"""
+
+    def dump_flight_recorder(self, path: str | None = None) -> None:
+        """empty timer to use when perfmon is disabled"""
+
+    def stop_flight_recorder(self) -> None:
+        """empty timer to use when perfmon is disabled"""
+
 
 def add_instant_event(
     name: str,
@@ -1,22 +1,178 @@
-"""PerfTraceFile class to write the chrome://tracing file format (JSON)"""
+"""Write perf events in the chrome://tracing file format (JSON).
 
+PerfTraceFile streams events to disk from a background thread, so a trace
+uses bounded memory however long it runs and everything up to the last flush
+survives a crash. PerfFlightRecorder instead keeps only the most recent
+events in memory and writes them to a trace file on demand or when an
+exception is not handled.
+
+Trace files whose name ends with ".gz" are gzip compressed, which both
+chrome://tracing and https://ui.perfetto.dev open directly. Streamed traces
+are compressed as one gzip member per flush, so that a trace cut short by a
+crash still decompresses up to its last flush.
+"""
+
+import contextlib
+import gzip
 import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
 from time import perf_counter_ns
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from minapari.utils.perf._event import PerfEvent
 
+_logger = logging.getLogger(__name__)
+
+
+def _open_trace(path: str | Path, compress: bool | None) -> IO[str]:
+    """Open a trace file for writing, gzip compressed if requested.
+
+    If ``compress`` is None, the file is compressed if its name ends with
+    ".gz".
+    """
+    if compress is None:
+        compress = str(path).endswith('.gz')
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8')
+    return open(path, 'w', encoding='utf-8')  # noqa: SIM115
+
+
+class _GzipMembers:
+    """Text file written as a sequence of complete gzip members.
+
+    Text is buffered until ``flush``, which compresses it as one member.
+    Unlike a single gzip stream, which cannot be read before it is closed,
+    the members written so far are a valid gzip file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._file = open(path, 'wb')  # noqa: SIM115
+        self._buffer: list[str] = []
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, text: str) -> None:
+        self._buffer.append(text)
+
+    def flush(self) -> None:
+        if self._buffer:
+            data = ''.join(self._buffer).encode('utf-8')
+            self._buffer = []
+            self._file.write(gzip.compress(data))
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def _get_event_data(event: 'PerfEvent') -> dict:
+    """Return the data for one perf event.
+
+    Parameters
+    ----------
+    event : PerfEvent
+        Event to write.
+
+    Returns
+    -------
+    dict
+        The data to be written to JSON.
+    """
+    category = 'none' if event.category is None else event.category
+
+    data = {
+        'pid': event.origin.process_id,
+        'tid': event.origin.thread_id,
+        'name': event.name,
+        'cat': category,
+        'ph': event.phase,
+        'ts': event.start_us,
+        'args': event.args,
+    }
+
+    # The three phase types we support.
+    assert event.phase in ['X', 'I', 'C']
+
+    if event.phase == 'X':
+        # "X" is a Complete Event, it has a duration.
+        data['dur'] = event.duration_us
+    elif event.phase == 'I':
+        # "I is an Instant Event, it has a "scope" one of:
+        #     "g" - global
+        #     "p" - process
+        #     "t" - thread
+        # We hard code "process" right now because that's all we've needed.
+        data['s'] = 'p'
+
+    return data
+
+
+def _encode_events(events: 'Iterable[PerfEvent]') -> str:
+    """Encode events as comma separated JSON objects, one per line."""
+    return ',\n'.join(json.dumps(_get_event_data(x)) for x in events)
+
+
+def write_trace(
+    path: str | Path,
+    events: 'Iterable[PerfEvent]',
+    compress: bool | None = None,
+) -> None:
+    """Write a complete trace file with the given events.
+
+    Parameters
+    ----------
+    path : str or Path
+        Write the trace file to this path.
+    events : iterable of PerfEvent
+        Events to write.
+    compress : bool, optional
+        Compress the file with gzip. By default, if the path ends in ".gz".
+    """
+    with _open_trace(path, compress) as outf:
+        outf.write('[\n')
+        outf.write(_encode_events(events))
+        outf.write('\n]\n')
+
 
 class PerfTraceFile:
-    """Writes a chrome://tracing formatted JSON file.
+    """Streams a chrome://tracing formatted JSON file.
+
+    Events are queued in memory and written in chunks by a background
+    thread, every ``flush_interval`` seconds or as soon as ``chunk_size``
+    events are waiting, so that the cost of writing to a file does not
+    bloat our timings.
+
+    The file is a JSON array whose closing bracket is only written by
+    PerfTraceFile.close(). The trace format allows it to be missing, so a
+    trace cut short by a crash can still be opened.
 
-    Stores PerfEvents in memory, writes the JSON file in PerfTraceFile.close().
+    If writing fails, the error is logged and later events are dropped
+    instead of being queued.
 
     Parameters
     ----------
     output_path : str
         Write the trace file to this path.
+    flush_interval : float
+        Maximum time events wait in memory before being written, in seconds.
+    chunk_size : int
+        Number of waiting events that triggers a write before the interval.
+    compress : bool, optional
+        Compress the file with gzip. By default, if the path ends in ".gz".
 
     Attributes
     ----------
@@ -24,10 +180,6 @@ class PerfTraceFile:
         Write the trace file to this path.
     zero_ns : int
         perf_counter_ns() time when we started the trace.
-    events : List[PerfEvent]
-        Process ID.
-    outf : file handle
-        JSON file we are writing to.
 
     Notes
     -----
@@ -35,70 +187,228 @@ class PerfTraceFile:
     https://chromium.googlesource.com/catapult/+/HEAD/tracing/README.md
     """
 
-    def __init__(self, output_path: str) -> None:
-        """Store events in memory and write to the file when done."""
+    def __init__(
+        self,
+        output_path: str,
+        *,
+        flush_interval: float = 1.0,
+        chunk_size: int = 10_000,
+        compress: bool | None = None,
+    ) -> None:
+        """Open the file and start the thread writing events to it."""
         self.output_path = output_path
+        self.flush_interval = flush_interval
+        self.chunk_size = chunk_size
 
         # So the events we write start at t=0.
         self.zero_ns = perf_counter_ns()
 
-        # Accumulate events in a list and only write at the end so the cost
-        # of writing to a file does not bloat our timings.
-        self.events: list[PerfEvent] = []
+        # Appending to a deque is thread safe, events can be added from any
+        # thread while the writer thread pops them.
+        self._pending: deque[PerfEvent] = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._failed = False
+        self._empty = True
+
+        if compress is None:
+            compress = str(output_path).endswith('.gz')
+        self._outf: IO[str] | _GzipMembers = (
+            _GzipMembers(output_path)
+            if compress
+            else _open_trace(output_path, compress=False)
+        )
+        self._outf.write('[\n')
+        self._thread = threading.Thread(
+            target=self._run, name='PerfTraceFile', daemon=True
+        )
+        self._thread.start()
 
     def add_event(self, event: 'PerfEvent') -> None:
-        """Add one perf event to our in-memory list.
+        """Queue one perf event to be written.
 
         Parameters
         ----------
         event : PerfEvent
             Event to add
         """
-        self.events.append(event)
+        if self._failed:
+            return
+        self._pending.append(event)
+        if len(self._pending) >= self.chunk_size:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Write all queued events to disk now."""
+        with self._lock:
+            if self._outf.closed:
+                return
+            events = []
+            while self._pending:
+                events.append(self._pending.popleft())
+            if events:
+                if not self._empty:
+                    self._outf.write(',\n')
+                self._outf.write(_encode_events(events))
+                self._empty = False
+            self._outf.flush()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                _logger.exception(
+                    'Could not write to %s, dropping later events',
+                    self.output_path,
+                )
+                self._failed = True
+                self._pending.clear()
+                return
 
     def close(self) -> None:
-        """Close the trace file, write all events to disk."""
-        event_data = [self._get_event_data(x) for x in self.events]
-        with open(self.output_path, 'w') as outf:
-            json.dump(event_data, outf)
+        """Close the trace file, write the remaining events to disk."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        if self._failed:
+            with self._lock, contextlib.suppress(OSError):
+                self._outf.close()
+            return
+        self.flush()
+        with self._lock:
+            self._outf.write('\n]\n')
+            self._outf.close()
+
 
-    def _get_event_data(self, event: 'PerfEvent') -> dict:
-        """Return the data for one perf event.
+class PerfFlightRecorder:
+    """Keeps the perf events of the last seconds in a ring buffer.
+
+    Recording costs little since nothing is written to disk until
+    PerfFlightRecorder.dump() is called, or an exception is not handled
+    when ``dump_on_exception`` is True.
+
+    Parameters
+    ----------
+    seconds : float
+        Age of the oldest events kept, in seconds.
+    max_events : int
+        Maximum number of events kept, older events are dropped first.
+    dump_path : str, optional
+        Default path of the dumped trace files. A "{time}" field is
+        replaced by the time of the dump. By default, a gzip compressed file
+        in the temporary directory.
+    dump_on_exception : bool
+        Dump the events when an exception is not handled, in any thread.
+        Exceptions are caught from ``sys.excepthook`` and
+        ``threading.excepthook``, and from the notification manager, which
+        replaces these hooks while the GUI runs.
+    """
+
+    def __init__(
+        self,
+        seconds: float = 30.0,
+        *,
+        max_events: int = 100_000,
+        dump_path: str | None = None,
+        dump_on_exception: bool = True,
+    ) -> None:
+        self.seconds = seconds
+        if dump_path is None:
+            dump_path = os.path.join(
+                tempfile.gettempdir(), 'minapari-flight-{time}.json.gz'
+            )
+        self.dump_path = dump_path
+        self._events: deque[PerfEvent] = deque(maxlen=max_events)
+        self._hooks = None
+        self._previous_hooks = None
+        # The exception last dumped, which may reach several of the hooks.
+        self._dumped: BaseException | None = None
+        if dump_on_exception:
+            self._install_hooks()
+
+    def add_event(self, event: 'PerfEvent') -> None:
+        """Add one perf event to the ring buffer.
 
         Parameters
         ----------
         event : PerfEvent
-            Event to write.
+            Event to add
+        """
+        self._events.append(event)
+
+    def recent_events(self) -> 'list[PerfEvent]':
+        """Return the events that ended in the last ``seconds``."""
+        oldest = perf_counter_ns() - int(self.seconds * 1e9)
+        return [x for x in list(self._events) if x.span.end_ns >= oldest]
+
+    def dump(self, path: str | None = None) -> str:
+        """Write the recent events to a trace file.
+
+        Parameters
+        ----------
+        path : str, optional
+            Write the trace file to this path, by default ``dump_path``.
 
         Returns
         -------
-        dict
-            The data to be written to JSON.
+        str
+            Path of the trace file.
         """
-        category = 'none' if event.category is None else event.category
-
-        data = {
-            'pid': event.origin.process_id,
-            'tid': event.origin.thread_id,
-            'name': event.name,
-            'cat': category,
-            'ph': event.phase,
-            'ts': event.start_us,
-            'args': event.args,
-        }
-
-        # The three phase types we support.
-        assert event.phase in ['X', 'I', 'C']
-
-        if event.phase == 'X':
-            # "X" is a Complete Event, it has a duration.
-            data['dur'] = event.duration_us
-        elif event.phase == 'I':
-            # "I is an Instant Event, it has a "scope" one of:
-            #     "g" - global
-            #     "p" - process
-            #     "t" - thread
-            # We hard code "process" right now because that's all we've needed.
-            data['s'] = 'p'
-
-        return data
+        if path is None:
+            path = self.dump_path.format(time=time.strftime('%Y%m%d-%H%M%S'))
+        write_trace(path, self.recent_events())
+        return path
+
+    def _dump_on_exception(self, error: BaseException | None) -> None:
+        if error is not None and error is self._dumped:
+            return
+        self._dumped = error
+        try:
+            path = self.dump()
+        except Exception:
+            _logger.exception('Could not dump the perf flight recorder')
+        else:
+            _logger.warning('Perf flight recorder dumped to %s', path)
+
+    def _install_hooks(self) -> None:
+        from minapari.utils.notifications import notification_manager
+
+        sys_hook, thread_hook = sys.excepthook, threading.excepthook
+        self._previous_hooks = (sys_hook, thread_hook)
+
+        def excepthook(*args):
+            self._dump_on_exception(args[1] if len(args) > 1 else None)
+            sys_hook(*args)
+
+        def thread_excepthook(args):
+            self._dump_on_exception(args.exc_value)
+            thread_hook(args)
+
+        sys.excepthook = excepthook
+        threading.excepthook = thread_excepthook
+        self._hooks = (excepthook, thread_excepthook)
+        notification_manager.error_received.connect(self._on_error_received)
+
+    def _on_error_received(self, event) -> None:
+        self._dump_on_exception(event.value)
+
+    def close(self) -> None:
+        """Stop dumping on exceptions and drop the recorded events."""
+        if self._hooks is not None:
+            from minapari.utils.notifications import notification_manager
+
+            notification_manager.error_received.disconnect(
+                self._on_error_received
+            )
+        if self._hooks is not None and self._previous_hooks is not None:
+            # Only restore the hooks if nobody replaced ours since.
+            if sys.excepthook is self._hooks[0]:
+                sys.excepthook = self._previous_hooks[0]
+            if threading.excepthook is self._hooks[1]:
+                threading.excepthook = self._previous_hooks[1]
+            self._hooks = self._previous_hooks = None
+        self._events.clear()
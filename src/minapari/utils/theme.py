@@ -5,6 +5,7 @@ import re
 import sys
 from ast import literal_eval
 from contextlib import suppress
+from functools import lru_cache
 from typing import Any
 
 import npe2
@@ -19,14 +20,20 @@ from minapari.utils.events import EventedModel
 from minapari.utils.events.containers._evented_dict import EventedDict
 from minapari.utils.translations import trans
 
-try:
-    from qtpy import QT_VERSION
 
+@lru_cache
+def _use_gradients() -> bool:
+    """Return True if the Qt version supports gradients in stylesheets.
+
+    Qt is only imported when a stylesheet is built, so that themes can be
+    used without importing Qt.
+    """
+    try:
+        from qtpy import QT_VERSION
+    except (ImportError, RuntimeError):
+        return False
     major, minor, *_ = QT_VERSION.split('.')  # type: ignore[attr-defined]
-    use_gradients = (int(major) >= 5) and (int(minor) >= 12)
-    del major, minor, QT_VERSION
-except (ImportError, RuntimeError):
-    use_gradients = False
+    return (int(major) >= 5) and (int(minor) >= 12)
 
 
 class Theme(EventedModel):
@@ -166,7 +173,7 @@ def opacity(color: str | Color, value: int = 255) -> str:
 
 
 def gradient(stops, horizontal: bool = True) -> str:
-    if not use_gradients:
+    if not _use_gradients():
         return stops[-1]
 
     if horizontal:
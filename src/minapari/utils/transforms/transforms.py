@@ -138,6 +138,8 @@ class TransformChain(EventedList[_T], Transform, Generic[_T]):
         for tr in self:
             if hasattr(tr, 'changed'):
                 tr.changed.connect(self._clean_cache)
+        self.events.inserted.connect(self._on_inserted)
+        self.events.reordered.connect(self._clean_cache)
 
     def __call__(self, coords):
         return tz.pipe(coords, *self)
@@ -174,6 +176,11 @@ class TransformChain(EventedList[_T], Transform, Generic[_T]):
         super().__delitem__(key)
         self._clean_cache()
 
+    def _on_inserted(self, event):
+        if hasattr(event.value, 'changed'):
+            event.value.changed.connect(self._clean_cache)
+        self._clean_cache()
+
     @property
     def inverse(self) -> 'TransformChain':
         """Return the inverse transform chain."""
@@ -228,6 +235,29 @@ class TransformChain(EventedList[_T], Transform, Generic[_T]):
         """
         return TransformChain([tf.set_slice(axes) for tf in self])
 
+    def simplified_slice(self, axes: Sequence[int]) -> _T:
+        """Return the simplified transform subset to the given axes.
+
+        This is equivalent to ``self.simplified.set_slice(axes)``, but the
+        result, and therefore its inverse, is cached until any transform of
+        the chain changes. It is shared between calls and must not be
+        modified.
+
+        Parameters
+        ----------
+        axes : Sequence[int]
+            Axes to subset the simplified transform with.
+
+        Returns
+        -------
+        Transform
+            Resulting transform.
+        """
+        key = ('simplified_slice', tuple(int(axis) for axis in axes))
+        if key not in self._cache_dict:
+            self._cache_dict[key] = self.simplified.set_slice(list(key[1]))
+        return self._cache_dict[key]
+
     def expand_dims(self, axes: Sequence[int]) -> 'TransformChain':
         """Return a transform chain with added axes for non-visible dimensions.
 
@@ -482,17 +512,44 @@ class Affine(Transform):
         append_first_axis = coords.ndim == 1
         if append_first_axis:
             coords = coords[np.newaxis, :]
-        coords_ndim = coords.shape[1]
-        padded_linear_matrix = embed_in_identity_matrix(
-            self._linear_matrix, coords_ndim
-        )
-        translate = translate_to_vector(self._translate, ndim=coords_ndim)
-        out = coords @ padded_linear_matrix.T
+        scale, matrix, translate = self._padded(coords.shape[1])
+        if scale is not None:
+            out = coords * scale
+        else:
+            out = coords @ matrix
         out += translate
         if append_first_axis:
             out = out[0]
         return out
 
+    def _padded(
+        self, ndim: int
+    ) -> tuple[npt.NDArray | None, npt.NDArray, npt.NDArray]:
+        """Return the transform embedded in ``ndim`` dimensions, cached.
+
+        Returns
+        -------
+        scale : array or None
+            The diagonal of the linear matrix if it is exactly diagonal,
+            in which case points can be scaled instead of multiplied.
+        matrix : array
+            The transposed linear matrix, to right-multiply points with.
+        translate : array
+            The translation vector.
+        """
+        key = ('padded', ndim)
+        if key not in self._cache_dict:
+            matrix = embed_in_identity_matrix(self._linear_matrix, ndim)
+            scale = np.diagonal(matrix).copy()
+            if np.count_nonzero(matrix - np.diag(scale)):
+                scale = None
+            self._cache_dict[key] = (
+                scale,
+                matrix.T.copy(),
+                translate_to_vector(self._translate, ndim=ndim),
+            )
+        return self._cache_dict[key]
+
     @property
     def ndim(self) -> int:
         """Dimensionality of the transform."""
@@ -103,6 +103,7 @@ class Viewer(ViewerModel):
     def close(self):
         """Close the viewer window."""
         self._layer_slicer.shutdown()
+        self._layer_loader.shutdown()
         disconnect_events(self.dims.events, self)
         self.layers.clear()
         self.window.close()